@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 import logging
+from typing import Any
+import zlib
+
+import aiohttp
+import voluptuous as vol
 
 from homeassistant.components import persistent_notification
-from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry, ConfigEntryState
 from homeassistant.const import (
     CONF_CLIENT_ID,
     CONF_REGION,
@@ -19,7 +25,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     __version__,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -28,7 +34,8 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_send,
 )
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -38,6 +45,7 @@ from .const import (
     CONF_USE_API_V2,
     CONF_USE_HA_SESSION,
     DOMAIN,
+    ENTRIES,
     LGE_DEVICES,
     LGE_DISCOVERY_NEW,
     MIN_HA_MAJ_VER,
@@ -45,13 +53,14 @@ from .const import (
     STARTUP,
     __min_ha_version__,
 )
+from .profiler import PipelineProfiler
 from .wideq import (
     DeviceInfo as ThinQDeviceInfo,
     DeviceType,
     TemperatureUnit,
     get_lge_device,
 )
-from .wideq.core_async import ClientAsync
+from .wideq.core_async import ClientAsync, lg_client_session
 from .wideq.core_exceptions import (
     AuthenticationError,
     InvalidCredentialError,
@@ -59,7 +68,15 @@ from .wideq.core_exceptions import (
     MonitorUnavailableError,
     NotConnectedError,
 )
-from .wideq.device import Device as ThinQDevice
+from .wideq.core_util import PollScheduler
+from .wideq.device import (
+    STAT_ENTITY_WRITES,
+    STAT_FEATURES,
+    Device as ThinQDevice,
+    PollStats,
+)
+from .wideq.model_info import ModelInfoV1, ModelInfoV2, ModelInfoV2AC
+from .wideq.model_store import get_shared_store
 
 SMARTTHINQ_PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -82,8 +99,34 @@ SIGNAL_RELOAD_ENTRY = f"{DOMAIN}_reload_entry"
 
 DISCOVERED_DEVICES = "discovered_devices"
 UNSUPPORTED_DEVICES = "unsupported_devices"
+PROFILER = "profiler"
+
+# resources shared by all the config entries
+POLL_SCHEDULERS = "poll_schedulers"
+SHARED_SESSION = "shared_session"
+
+# disk cache of the model info files, inside HA storage folder
+MODEL_STORE_DIR = f"{DOMAIN}_models"
+
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+DEFAULT_PROFILE_DURATION = 60  # seconds
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
 
 SCAN_INTERVAL = timedelta(seconds=30)
+DISCOVERY_INTERVAL = timedelta(minutes=5)
+# minimum delay between two scheduled updates when aligning to the device phase
+MIN_PHASE_DELAY = SCAN_INTERVAL.total_seconds() / 2
+# device refresh after a command, delayed to let the device apply the changes
+POST_COMMAND_REFRESH_DELAY = 3  # seconds
+POST_COMMAND_REFRESH_MIN_INTERVAL = 15  # seconds
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -91,12 +134,17 @@ class LGEAuthentication:
     """Class to authenticate connection with LG ThinQ."""
 
     def __init__(
-        self, hass: HomeAssistant, region: str, language: str, use_ha_session=False
+        self,
+        hass: HomeAssistant,
+        region: str,
+        language: str,
+        use_ha_session=False,
+        client_session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the class."""
         self._region = region
         self._language = language
-        self._client_session = None
+        self._client_session = client_session
         if use_ha_session:
             self._client_session = async_get_clientsession(hass)
 
@@ -148,6 +196,7 @@ class LGEAuthentication:
         oauth_url: str | None = None,
         client_id: str | None = None,
         update_clientid_callback: Callable[[str], None] | None = None,
+        poll_scheduler: PollScheduler | None = None,
     ) -> ClientAsync:
         """Create a new client using refresh token."""
         return await ClientAsync.from_token(
@@ -158,6 +207,7 @@ class LGEAuthentication:
             aiohttp_session=self._client_session,
             client_id=client_id,
             update_clientid_callback=update_clientid_callback,
+            poll_scheduler=poll_scheduler,
         )
 
 
@@ -230,9 +280,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         return False
 
-    log_info: bool = hass.data.get(DOMAIN, {}).get(SIGNAL_RELOAD_ENTRY, 0) < 2
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    entries_data: dict[str, dict] = domain_data.setdefault(ENTRIES, {})
+    entry_data: dict[str, Any] = entries_data.setdefault(entry.entry_id, {})
+    log_info: bool = entry_data.get(SIGNAL_RELOAD_ENTRY, 0) < 2
     if log_info:
-        hass.data[DOMAIN] = {SIGNAL_RELOAD_ENTRY: 2}
+        entries_data[entry.entry_id] = entry_data = {SIGNAL_RELOAD_ENTRY: 2}
         _LOGGER.info(STARTUP)
         _LOGGER.info(
             "Initializing ThinQ platform with region: %s - language: %s",
@@ -240,6 +293,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             language,
         )
 
+    # model files are cached on disk, only the data used by
+    # the devices is kept in memory
+    get_shared_store().configure(
+        hass.config.path(STORAGE_DIR, MODEL_STORE_DIR), keep_raw=False
+    )
+
     def _update_clientid_callback(client_id: str) -> None:
         """Update config entry with the new client id."""
         hass.config_entries.async_update_entry(
@@ -248,18 +307,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # if network is not connected we can have some error
     # raising ConfigEntryNotReady platform setup will be retried
-    lge_auth = LGEAuthentication(hass, region, language, use_ha_session)
+    # entries share the connection pool and, for the same region, the
+    # scheduler that staggers the slow-rate additional polls over their
+    # interval (it spreads the calls, it does not limit their rate)
+    shared_session = None if use_ha_session else _async_get_shared_session(hass)
+    lge_auth = LGEAuthentication(hass, region, language, use_ha_session, shared_session)
+    poll_scheduler = domain_data.setdefault(POLL_SCHEDULERS, {}).setdefault(
+        region, PollScheduler()
+    )
     try:
         client = await lge_auth.create_client_from_token(
-            refresh_token, oauth2_url, client_id, _update_clientid_callback
+            refresh_token,
+            oauth2_url,
+            client_id,
+            _update_clientid_callback,
+            poll_scheduler,
         )
     except (AuthenticationError, InvalidCredentialError) as exc:
-        if (auth_retry := hass.data[DOMAIN].get(AUTH_RETRY, 0)) >= MAX_AUTH_RETRY:
-            hass.data.pop(DOMAIN)
+        if (auth_retry := entry_data.get(AUTH_RETRY, 0)) >= MAX_AUTH_RETRY:
+            entries_data.pop(entry.entry_id)
             # Launch config entries reauth setup
             raise ConfigEntryAuthFailed("ThinQ authentication failed") from exc
 
-        hass.data[DOMAIN][AUTH_RETRY] = auth_retry + 1
+        entry_data[AUTH_RETRY] = auth_retry + 1
         msg = (
             "Invalid ThinQ credential error, integration setup aborted."
             " Please use the LG App on your mobile device to ensure your"
@@ -276,6 +346,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         raise ConfigEntryNotReady("ThinQ platform not ready") from exc
 
+    _async_migrate_unique_id(hass, entry, client.user_number)
+
     if not client.has_devices:
         _LOGGER.error("No ThinQ devices found. Component setup aborted")
         return False
@@ -284,7 +356,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     try:
         lge_devices, unsupported_devices, discovered_devices = await lge_devices_setup(
-            hass, client
+            hass, client, excluded_ids=_async_other_entries_device_ids(hass, entry)
         )
     except Exception as exc:
         if log_info:
@@ -302,17 +374,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     dev_ids = [v for ids in discovered_devices.values() for v in ids]
     cleanup_orphan_lge_devices(hass, entry.entry_id, dev_ids)
 
-    async def _async_call_reload_entry():
+    async def _async_call_reload_entry(reload_client: ClientAsync):
         """Reload current entry."""
-        if SIGNAL_RELOAD_ENTRY in hass.data[DOMAIN]:
+        if reload_client is not client:
+            return
+        entry_data = entries_data[entry.entry_id]
+        if SIGNAL_RELOAD_ENTRY in entry_data:
             return
-        hass.data[DOMAIN][SIGNAL_RELOAD_ENTRY] = 1
+        entry_data[SIGNAL_RELOAD_ENTRY] = 1
         await hass.config_entries.async_reload(entry.entry_id)
 
     entry.async_on_unload(
         async_dispatcher_connect(hass, SIGNAL_RELOAD_ENTRY, _async_call_reload_entry)
     )
 
+    # the listener is called on every entry update, like the token and
+    # reauth updates of entry data, only an options change is reloaded
+    entry_options = dict(entry.options)
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload current entry to apply the new options."""
+        if dict(entry.options) == entry_options:
+            return
+        await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     async def _close_lg_client(event: Event) -> None:
         """Close client to abort pollong."""
         await client.close()
@@ -321,7 +408,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_lg_client)
     )
 
-    hass.data[DOMAIN] = {
+    entries_data[entry.entry_id] = {
         CLIENT: client,
         LGE_DEVICES: lge_devices,
         UNSUPPORTED_DEVICES: unsupported_devices,
@@ -331,6 +418,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     start_devices_discovery(hass, entry, client)
 
+    if PROFILER not in domain_data:
+        domain_data[PROFILER] = _create_profiler(hass)
+
+        async def _async_profile(call: ServiceCall) -> None:
+            """Start a profile session of the polling pipeline."""
+            hass.data[DOMAIN][PROFILER].async_start(call.data[ATTR_DURATION])
+
+        hass.services.async_register(
+            DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+        )
+
     return True
 
 
@@ -339,14 +437,103 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, SMARTTHINQ_PLATFORMS
     ):
-        data = hass.data.pop(DOMAIN)
+        domain_data = hass.data[DOMAIN]
+        entries_data = domain_data[ENTRIES]
+        data = entries_data.pop(entry.entry_id)
+        for dev_list in data.get(LGE_DEVICES, {}).values():
+            for lge_dev in dev_list:
+                lge_dev.async_cancel_refresh()
         reload = data.get(SIGNAL_RELOAD_ENTRY, 0)
         if reload > 0:
-            hass.data[DOMAIN] = {SIGNAL_RELOAD_ENTRY: reload}
+            entries_data[entry.entry_id] = {SIGNAL_RELOAD_ENTRY: reload}
         await data[CLIENT].close()
+
+        # release shared resources when the last entry is unloaded
+        if not any(
+            other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+            if profiler := domain_data.pop(PROFILER, None):
+                await profiler.async_stop()
+            domain_data.pop(POLL_SCHEDULERS, None)
+            if session := domain_data.pop(SHARED_SESSION, None):
+                await session.close()
     return unload_ok
 
 
+@callback
+def _async_get_shared_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the ThinQ aiohttp session shared by the config entries."""
+    domain_data = hass.data[DOMAIN]
+    if (session := domain_data.get(SHARED_SESSION)) and not session.closed:
+        return session
+
+    session = domain_data[SHARED_SESSION] = lg_client_session()
+
+    async def _close_session(event: Event) -> None:
+        """Close the shared session."""
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_session)
+    return session
+
+
+@callback
+def _async_other_entries_device_ids(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> set[str]:
+    """Return the ids of the devices managed by the other config entries."""
+    return {
+        device_id
+        for entry_id, entry_data in hass.data[DOMAIN][ENTRIES].items()
+        if entry_id != entry.entry_id
+        for device_id in entry_data.get(DISCOVERED_DEVICES, {})
+    }
+
+
+@callback
+def _async_migrate_unique_id(
+    hass: HomeAssistant, entry: ConfigEntry, user_number: str | None
+) -> None:
+    """Set the account user number as unique id of entries created without it."""
+    if entry.unique_id is not None or not user_number:
+        return
+    for other_entry in hass.config_entries.async_entries(DOMAIN):
+        if other_entry.unique_id == user_number:
+            _LOGGER.warning(
+                "ThinQ account already configured by entry %s", other_entry.title
+            )
+            return
+    _LOGGER.debug("Set the ThinQ user number as config entry unique id")
+    hass.config_entries.async_update_entry(entry, unique_id=user_number)
+
+
+class LGEDataUpdateCoordinator(DataUpdateCoordinator):
+    """Device coordinator that counts the entity state writes of each update."""
+
+    def __init__(
+        self, hass: HomeAssistant, poll_stats: PollStats, **kwargs: Any
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, _LOGGER, **kwargs)
+        self._poll_stats = poll_stats
+
+        self._entity_writes = 0
+
+    @callback
+    def async_entity_written(self) -> None:
+        """Count an entity state write for the current update."""
+        self._entity_writes += 1
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners."""
+        self._entity_writes = 0
+        super().async_update_listeners()
+        self._poll_stats.add_sample(STAT_ENTITY_WRITES, self._entity_writes)
+
+
 class LGEDevice:
     """Generic class that represents a LGE device."""
 
@@ -370,9 +557,18 @@ class LGEDevice:
         self._unique_id = f"{self._type.name}:{self._device_id}"
 
         self._state = None
-        self._coordinator: DataUpdateCoordinator | None = None
+        self._coordinator: LGEDataUpdateCoordinator | None = None
         self._disc_count = 0
         self._available = True
+        self._avail_changed = False
+        self._state_version = 0
+        self._post_cmd_refresh_unsub: Callable[[], None] | None = None
+        self._last_post_cmd_refresh = 0.0
+
+        # deterministic offset inside the scan interval used to spread
+        # the updates of the different devices
+        scan_interval = SCAN_INTERVAL.total_seconds()
+        self._phase = zlib.crc32(self._device_id.encode()) % 1000 * scan_interval / 1000
 
     @property
     def available(self) -> bool:
@@ -414,6 +610,25 @@ class LGEDevice:
         """Current device state"""
         return self._state
 
+    @property
+    def state_version(self) -> int:
+        """Return a counter increased every time the device state changed."""
+        return self._state_version
+
+    def state_changed(self, keys: frozenset[str] | None = None) -> bool:
+        """
+        Return True if the last update changed the device state.
+        If keys are provided, only changes of these features are checked,
+        an empty set only checks for availability changes.
+        """
+        if self._avail_changed or not self._state:
+            return True
+        if (changed := self._state.changed_features) is None:
+            return True
+        if keys is None:
+            return bool(changed) or self._state.data_changed
+        return not changed.isdisjoint(keys)
+
     @property
     def available_features(self) -> dict:
         """Return a list of available features."""
@@ -438,10 +653,23 @@ class LGEDevice:
         return data
 
     @property
-    def coordinator(self) -> DataUpdateCoordinator | None:
+    def coordinator(self) -> LGEDataUpdateCoordinator | None:
         """Return the DataUpdateCoordinator used by this device."""
         return self._coordinator
 
+    @property
+    def phase(self) -> float:
+        """Return the update phase offset inside the scan interval in seconds."""
+        return self._phase
+
+    def _phase_update_interval(self) -> timedelta:
+        """Return the interval to the next update aligned with the device phase."""
+        scan_interval = SCAN_INTERVAL.total_seconds()
+        delay = (self._phase - self._hass.loop.time()) % scan_interval
+        if delay < MIN_PHASE_DELAY:
+            delay += scan_interval
+        return timedelta(seconds=delay)
+
     async def init_device(self) -> bool:
         """Init the device status and start coordinator."""
         if not await self._device.init_device_info():
@@ -459,26 +687,76 @@ class LGEDevice:
 
     @callback
     def async_set_updated(self):
-        """Manually update state and notify coordinator entities."""
+        """
+        Manually update state and notify coordinator entities.
+        Called after a command, also schedule a device refresh.
+        """
         if self._coordinator:
+            # commands can change values not included in the status,
+            # so all entities are updated
+            self._avail_changed = False
+            self._state.update_changes(None)
+            self._state_version += 1
             self._coordinator.async_set_updated_data(self._state)
+            self._async_schedule_post_command_refresh()
+
+    @callback
+    def _async_schedule_post_command_refresh(self) -> None:
+        """
+        Schedule a single device refresh after a command.
+        A pending refresh is postponed, so a burst of commands
+        results in one refresh, and refreshes are rate limited.
+        """
+        if self._post_cmd_refresh_unsub:
+            self._post_cmd_refresh_unsub()
+        next_allowed = self._last_post_cmd_refresh + POST_COMMAND_REFRESH_MIN_INTERVAL
+        delay = max(POST_COMMAND_REFRESH_DELAY, next_allowed - self._hass.loop.time())
+        self._post_cmd_refresh_unsub = async_call_later(
+            self._hass, delay, self._async_post_command_refresh
+        )
+
+    async def _async_post_command_refresh(self, _) -> None:
+        """Refresh device querying it directly after a command."""
+        self._post_cmd_refresh_unsub = None
+        if not self._coordinator:
+            return
+        self._last_post_cmd_refresh = self._hass.loop.time()
+        self._device.request_device_query()
+        await self._coordinator.async_refresh()
+
+    @callback
+    def async_cancel_refresh(self) -> None:
+        """Cancel a pending post command refresh."""
+        if self._post_cmd_refresh_unsub:
+            self._post_cmd_refresh_unsub()
+            self._post_cmd_refresh_unsub = None
 
     async def _create_coordinator(self) -> None:
         """Get the coordinator for a specific device."""
-        coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
+        coordinator = LGEDataUpdateCoordinator(
             self._hass,
-            _LOGGER,
+            self._device.poll_stats,
             name=f"{DOMAIN}-{self._name}",
             update_method=self._async_update,
             # Polling interval. Will only be polled if there are subscribers.
             update_interval=SCAN_INTERVAL,
         )
         await coordinator.async_refresh()
+        coordinator.update_interval = self._phase_update_interval()
         self._coordinator = coordinator
 
     async def _async_update(self):
         """Async update used by coordinator."""
+        prev_state = self._state
+        prev_avail = (self.available, self.assumed_state)
         await self._async_state_update()
+        self._avail_changed = prev_avail != (self.available, self.assumed_state)
+        self._state.update_changes(prev_state)
+        if self.state_changed():
+            self._state_version += 1
+        if self._coordinator:
+            # keep next update aligned with the device phase
+            self._coordinator.update_interval = self._phase_update_interval()
         return self._state
 
     async def _async_state_update(self):
@@ -522,7 +800,7 @@ class LGEDevice:
         except InvalidCredentialError:
             # If we receive invalid credential, we reload integration
             # to provide proper notification
-            async_dispatcher_send(self._hass, SIGNAL_RELOAD_ENTRY)
+            async_dispatcher_send(self._hass, SIGNAL_RELOAD_ENTRY, self._device.client)
             return
 
         self._available = True
@@ -532,18 +810,42 @@ class LGEDevice:
             # _LOGGER.debug('Status attributes: %s', l)
             self._disc_count = 0
             self._state = state
+            with self._device.poll_stats.measure(STAT_FEATURES):
+                _ = state.device_features
+
+
+def _create_profiler(hass: HomeAssistant) -> PipelineProfiler:
+    """Create the profiler for the polling pipeline."""
+    return PipelineProfiler(
+        hass,
+        [
+            (LGEDevice, "_async_state_update"),
+            (ThinQDevice, "_device_poll"),
+            (ModelInfoV1, "decode_monitor"),
+            (ModelInfoV1, "decode_snapshot"),
+            (ModelInfoV2, "decode_monitor"),
+            (ModelInfoV2, "decode_snapshot"),
+            (ModelInfoV2AC, "decode_snapshot"),
+        ],
+    )
 
 
 async def lge_devices_setup(
     hass: HomeAssistant,
     client: ClientAsync,
     discovered_devices: dict[str, list[str]] | None = None,
+    *,
+    device_ids: set[str] | None = None,
+    excluded_ids: set[str] | None = None,
 ) -> tuple[
     dict[DeviceType, list[LGEDevice]],
     dict[DeviceType, list[ThinQDeviceInfo]],
     dict[str, list[str]],
 ]:
-    """Query connected devices from LG ThinQ."""
+    """
+    Query connected devices from LG ThinQ.
+    If device_ids is provided, only these devices are set up.
+    """
     _LOGGER.debug("Searching LGE ThinQ devices...")
 
     wrapped_devices: dict[DeviceType, list[LGEDevice]] = {}
@@ -593,9 +895,17 @@ async def lge_devices_setup(
 
     for device_info in client_devices:
         device_id = device_info.device_id
+        if device_ids is not None and device_id not in device_ids:
+            continue
         if device_id in discovered_devices:
             new_devices[device_id] = discovered_devices[device_id]
             continue
+        if excluded_ids and device_id in excluded_ids:
+            # device shared with another account already configured
+            _LOGGER.debug(
+                "LGE Device %s already managed by another entry", device_info.name
+            )
+            continue
 
         new_devices[device_id] = []
         device_count += 1
@@ -651,67 +961,127 @@ def cleanup_orphan_lge_devices(
         device_registry.async_remove_device(dev_id)
 
 
+def _add_devices_map(
+    devices_map: dict[DeviceType, list], new_devices: dict[DeviceType, list]
+) -> None:
+    """Add in place new devices to a map of devices."""
+    for dev_type, dev_list in new_devices.items():
+        devices_map.setdefault(dev_type, []).extend(dev_list)
+
+
+def _remove_devices_map(
+    devices_map: dict[DeviceType, list], is_removed: Callable[[Any], bool]
+) -> None:
+    """Remove in place the devices from a map of devices."""
+    for dev_type in list(devices_map):
+        dev_list = [dev for dev in devices_map[dev_type] if not is_removed(dev)]
+        if dev_list:
+            devices_map[dev_type] = dev_list
+        else:
+            devices_map.pop(dev_type)
+
+
+@callback
+def remove_lge_devices(hass: HomeAssistant, dev_ids: Iterable[str]) -> None:
+    """Delete devices from the registry."""
+    device_registry = dr.async_get(hass)
+    for device_id in dev_ids:
+        if dev := device_registry.async_get_device({(DOMAIN, device_id)}):
+            device_registry.async_remove_device(dev.id)
+
+
 @callback
 def start_devices_discovery(
     hass: HomeAssistant, entry: ConfigEntry, client: ClientAsync
 ) -> None:
-    """Start devices discovery."""
+    """
+    Start devices discovery.
 
-    async def _async_discover_devices(_):
-        """Discover new devices."""
-        _LOGGER.debug("Discovering new devices...")
+    Discovery is triggered when the devices list refreshed by the devices
+    polling changes, so only added devices are set up and only removed
+    devices are deleted.
+    """
+    discovery_lock = asyncio.Lock()
 
-        old_devs = hass.data[DOMAIN][DISCOVERED_DEVICES]
+    @callback
+    def _async_remove_devices(removed_ids: set[str]) -> None:
+        """Remove the devices not available anymore."""
+        entry_data = hass.data[DOMAIN][ENTRIES][entry.entry_id]
+        discovered_devs: dict[str, list[str]] = entry_data[DISCOVERED_DEVICES]
+        removed_dev_ids = set()
+        for device_id in removed_ids:
+            removed_dev_ids.update(discovered_devs.pop(device_id, []))
+
+        for dev_list in entry_data[LGE_DEVICES].values():
+            for lge_dev in dev_list:
+                if lge_dev.device_id in removed_dev_ids:
+                    lge_dev.async_cancel_refresh()
+        for dev_id in removed_dev_ids:
+            client.poll_scheduler.unregister(dev_id)
+        remove_lge_devices(hass, removed_dev_ids)
+
+        # Update hass data LGE_DEVICES and UNSUPPORTED_DEVICES
+        _remove_devices_map(
+            entry_data[LGE_DEVICES], lambda dev: dev.device_id in removed_dev_ids
+        )
+        _remove_devices_map(
+            entry_data[UNSUPPORTED_DEVICES], lambda dev: dev.device_id in removed_ids
+        )
+
+    async def _async_add_devices(added_ids: set[str]) -> None:
+        """Set up the new devices."""
+        _LOGGER.debug("Discovering new devices...")
+        entry_data = hass.data[DOMAIN][ENTRIES][entry.entry_id]
+        discovered_devs: dict[str, list[str]] = entry_data[DISCOVERED_DEVICES]
         lge_devs, unsupported_devs, new_devs = await lge_devices_setup(
-            hass, client, old_devs
+            hass,
+            client,
+            discovered_devs,
+            device_ids=added_ids,
+            excluded_ids=_async_other_entries_device_ids(hass, entry),
         )
-        hass.data[DOMAIN][DISCOVERED_DEVICES] = new_devs
+        discovered_devs.update(new_devs)
+
+        # Update hass data LGE_DEVICES and UNSUPPORTED_DEVICES
+        _add_devices_map(entry_data[LGE_DEVICES], lge_devs)
+        _add_devices_map(entry_data[UNSUPPORTED_DEVICES], unsupported_devs)
 
         # send signal to set up new entities
         if lge_devs:
             _notify_message(
                 hass, "new_devices", "SmartThinQ Sensors", "Discovered new devices."
             )
-            async_dispatcher_send(hass, LGE_DISCOVERY_NEW, lge_devs)
-
-        # remove device not available anymore
-        if lge_devs or unsupported_devs or len(old_devs) != len(new_devs):
-            new_ids = [v for ids in new_devs.values() for v in ids]
-            cleanup_orphan_lge_devices(hass, entry.entry_id, new_ids)
-
-            # Update hass data LGE_DEVICES
-            prev_lge_devs: dict[DeviceType, list[LGEDevice]] = hass.data[DOMAIN][
-                LGE_DEVICES
-            ]
-            new_lge_devs: dict[DeviceType, list[LGEDevice]] = {}
-            for dev_type, dev_list in prev_lge_devs.items():
-                new_dev_list = [dev for dev in dev_list if dev.device_id in new_ids]
-                if new_dev_list:
-                    new_lge_devs[dev_type] = new_dev_list
-            for dev_type, dev_list in lge_devs.items():
-                if dev_type in new_lge_devs:
-                    new_lge_devs[dev_type].extend(dev_list)
-                else:
-                    new_lge_devs[dev_type] = dev_list
-            hass.data[DOMAIN][LGE_DEVICES] = new_lge_devs
-
-            # Update hass data UNSUPPORTED_DEVICES
-            prev_uns_devs: dict[DeviceType, list[ThinQDeviceInfo]] = hass.data[DOMAIN][
-                UNSUPPORTED_DEVICES
-            ]
-            new_uns_devs: dict[DeviceType, list[ThinQDeviceInfo]] = {}
-            for dev_type, dev_list in prev_uns_devs.items():
-                new_dev_list = [dev for dev in dev_list if dev.device_id in new_devs]
-                if new_dev_list:
-                    new_uns_devs[dev_type] = new_dev_list
-            for dev_type, dev_list in unsupported_devs.items():
-                if dev_type in new_uns_devs:
-                    new_uns_devs[dev_type].extend(dev_list)
-                else:
-                    new_uns_devs[dev_type] = dev_list
-            hass.data[DOMAIN][UNSUPPORTED_DEVICES] = new_uns_devs
-
-    # schedule discover new devices every 5 minutes
+            async_dispatcher_send(
+                hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", lge_devs
+            )
+
+    async def _async_discover_devices(
+        added_ids: set[str], removed_ids: set[str]
+    ) -> None:
+        """Discover new devices and remove devices not available anymore."""
+        async with discovery_lock:
+            if removed_ids:
+                _async_remove_devices(removed_ids)
+            if added_ids:
+                await _async_add_devices(added_ids)
+
+    @callback
+    def _async_devices_changed(added_ids: set[str], removed_ids: set[str]) -> None:
+        """Start discovery when the client devices list changes."""
+        hass.async_create_task(_async_discover_devices(added_ids, removed_ids))
+
+    async def _async_refresh_devices(_) -> None:
+        """Refresh devices list if not already refreshed by devices polling."""
+        if client.devices_update_age < DISCOVERY_INTERVAL.total_seconds():
+            return
+        try:
+            await client.refresh_devices()
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed to refresh ThinQ devices list: %s", exc)
+
+    entry.async_on_unload(client.add_devices_listener(_async_devices_changed))
+
+    # refresh devices list every 5 minutes if not refreshed by polling
     entry.async_on_unload(
-        async_track_time_interval(hass, _async_discover_devices, timedelta(minutes=5))
+        async_track_time_interval(hass, _async_refresh_devices, DISCOVERY_INTERVAL)
     )
@@ -26,6 +26,7 @@ from .const import (
     ATTR_RUN_COMPLETED,
     DEFAULT_ICON,
     DOMAIN,
+    ENTRIES,
     LGE_DEVICES,
     LGE_DISCOVERY_NEW,
 )
@@ -34,8 +35,11 @@ from .device_helpers import (
     STATE_LOOKUP,
     WASH_DEVICE_TYPES,
     LGEBaseDevice,
+    LGEStateChangeMixin,
     get_entity_name,
+    get_entity_profile,
     get_wrapper_device,
+    profile_descriptions,
 )
 from .wideq import DehumidifierFeatures, DeviceType, WashDeviceFeatures
 
@@ -226,8 +230,9 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE binary sensors."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
+    entity_profile = get_entity_profile(entry)
 
     _LOGGER.debug("Starting LGE ThinQ binary sensors setup...")
 
@@ -243,7 +248,7 @@ async def async_setup_entry(
                 lge_device, sensor_desc, get_wrapper_device(lge_device, dev_type)
             )
             for dev_type, sensor_descs in BINARY_SENSOR_ENTITIES.items()
-            for sensor_desc in sensor_descs
+            for sensor_desc in profile_descriptions(sensor_descs, entity_profile)
             for lge_device in lge_devices.get(dev_type, [])
             if _binary_sensor_exist(lge_device, sensor_desc)
         ]
@@ -253,11 +258,13 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
-class LGEBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class LGEBinarySensor(LGEStateChangeMixin, CoordinatorEntity, BinarySensorEntity):
     """Class to monitor binary sensors for LGE device"""
 
     entity_description: ThinQBinarySensorEntityDescription
@@ -279,6 +286,8 @@ class LGEBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_device_info = api.device_info
         if not description.translation_key and description.name is UNDEFINED:
             self._attr_name = get_entity_name(api, description.key)
+        if not (wrapped_device and description.value_fn is not None):
+            self._update_keys = frozenset({description.key})
 
         self._is_on = None
 
@@ -18,8 +18,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
-from .device_helpers import LGEBaseDevice
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import (
+    LGEBaseDevice,
+    LGEStateChangeMixin,
+    get_entity_profile,
+    profile_descriptions,
+)
 from .wideq import WM_DEVICE_TYPES, WashDeviceFeatures
 
 # general button attributes
@@ -87,8 +92,9 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE buttons."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
+    entity_profile = get_entity_profile(entry)
 
     _LOGGER.debug("Starting LGE ThinQ button setup...")
 
@@ -102,7 +108,7 @@ async def async_setup_entry(
         lge_button = [
             LGEButton(lge_device, button_desc)
             for dev_type, button_descs in BUTTON_ENTITIES.items()
-            for button_desc in button_descs
+            for button_desc in profile_descriptions(button_descs, entity_profile)
             for lge_device in lge_devices.get(dev_type, [])
             if _button_exist(lge_device, button_desc)
         ]
@@ -112,11 +118,13 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
-class LGEButton(CoordinatorEntity, ButtonEntity):
+class LGEButton(LGEStateChangeMixin, CoordinatorEntity, ButtonEntity):
     """Class to control buttons for LGE device"""
 
     entity_description: ThinQButtonEntityDescription
@@ -134,6 +142,8 @@ class LGEButton(CoordinatorEntity, ButtonEntity):
         self.entity_description = description
         self._attr_unique_id = f"{api.unique_id}-{description.key}-button"
         self._attr_device_info = api.device_info
+        if description.available_fn is None:
+            self._update_keys = frozenset()
 
     @property
     def available(self) -> bool:
@@ -31,8 +31,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback, current_p
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
-from .device_helpers import TEMP_UNIT_LOOKUP, LGERefrigeratorDevice
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import TEMP_UNIT_LOOKUP, LGERefrigeratorDevice, LGEStateChangeMixin
 from .wideq import AirConditionerFeatures, DeviceType, TemperatureUnit
 from .wideq.devices.ac import (
     AWHP_MAX_TEMP,
@@ -129,7 +129,7 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up LGE device climate based on config_entry."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
 
     _LOGGER.debug("Starting LGE ThinQ climate setup...")
@@ -161,7 +161,9 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
     # register services
@@ -173,7 +175,7 @@ async def async_setup_entry(
     )
 
 
-class LGEClimate(CoordinatorEntity, ClimateEntity):
+class LGEClimate(LGEStateChangeMixin, CoordinatorEntity, ClimateEntity):
     """Base climate device."""
 
     _enable_turn_on_off_backwards_compatibility = False
@@ -13,9 +13,11 @@ import voluptuous as vol
 from homeassistant.config_entries import (
     CONN_CLASS_CLOUD_POLL,
     SOURCE_REAUTH,
+    ConfigEntry,
     ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlow,
 )
 from homeassistant.const import (
     CONF_BASE,
@@ -39,12 +41,15 @@ from homeassistant.helpers.selector import (
 
 from . import LGEAuthentication, is_valid_ha_version
 from .const import (
+    CONF_ENTITY_PROFILE,
     CONF_LANGUAGE,
     CONF_OAUTH2_URL,
     CONF_USE_API_V2,
     CONF_USE_HA_SESSION,
     CONF_USE_REDIRECT,
+    DEFAULT_ENTITY_PROFILE,
     DOMAIN,
+    ENTITY_PROFILES,
     __min_ha_version__,
 )
 from .wideq.core_exceptions import AuthenticationError, InvalidCredentialError
@@ -86,6 +91,7 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
         self._language: str | None = None
         self._token: str | None = None
         self._client_id: str | None = None
+        self._user_number: str | None = None
         self._oauth2_url: str | None = None
         self._use_ha_session = False
 
@@ -94,6 +100,12 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
         self._error: str | None = None
         self._is_import = False
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return SmartThinQOptionsFlowHandler()
+
     @staticmethod
     def _validate_region_language(region: str, language: str) -> str | None:
         """Validate format of region and language."""
@@ -152,9 +164,8 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
         if self._is_import:
             self._error = "invalid_config"
         elif entries := self._async_current_entries():
+            # default region and language from the configured account
             entry = entries[0]
-            if entry.state == ConfigEntryState.LOADED:
-                return self.async_abort(reason="single_instance_allowed")
             if not self._region:
                 self._region = entry.data.get(CONF_REGION)
             if not self._user_lang:
@@ -262,6 +273,9 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
             return RESULT_NO_DEV
 
         self._client_id = client.client_id
+        self._user_number = client.user_number
+        if self._user_number and self.source != SOURCE_REAUTH:
+            await self.async_set_unique_id(self._user_number, raise_on_progress=False)
         return RESULT_SUCCESS
 
     async def _manage_error(
@@ -298,11 +312,27 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
         if self._use_ha_session:
             data[CONF_USE_HA_SESSION] = True
 
-        # if an entry exists, we are reconfiguring
-        if entries := self._async_current_entries():
-            entry = entries[0]
+        if self.source == SOURCE_REAUTH:
+            return self.async_update_reload_and_abort(
+                entry=self._get_reauth_entry(),
+                unique_id=self._user_number,
+                data=data,
+            )
+
+        # if an entry exists for the same account, we are reconfiguring,
+        # entries created before multi account support have no unique id
+        # until migrated on setup and can be for the same account
+        entries = self._async_current_entries()
+        entry = next(
+            (entry for entry in entries if entry.unique_id == self._user_number),
+            None,
+        ) or next((entry for entry in entries if entry.unique_id is None), None)
+        if entry:
+            if entry.state == ConfigEntryState.LOADED:
+                return self.async_abort(reason="already_configured")
             return self.async_update_reload_and_abort(
                 entry=entry,
+                unique_id=self._user_number,
                 data=data,
             )
 
@@ -385,6 +415,35 @@ class SmartThinQFlowHandler(ConfigFlow, domain=DOMAIN):
         return self.async_update_reload_and_abort(self._get_reauth_entry())
 
 
+class SmartThinQOptionsFlowHandler(OptionsFlow):
+    """Handle SmartThinQ options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        entity_profile = self.config_entry.options.get(
+            CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE
+        )
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_ENTITY_PROFILE, default=entity_profile
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=ENTITY_PROFILES,
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_ENTITY_PROFILE,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+
 def _dict_to_select(opt_dict: dict) -> SelectSelectorConfig:
     """Covert a dict to a SelectSelectorConfig."""
     return SelectSelectorConfig(
@@ -32,12 +32,22 @@ ATTR_OVEN_UPPER_TARGET_TEMP = "oven_upper_target_temp"
 ATTR_OVEN_TEMP_UNIT = "oven_temp_unit"
 
 # configuration
+CONF_ENTITY_PROFILE = "entity_profile"
 CONF_LANGUAGE = "language"
 CONF_OAUTH2_URL = "oauth2_url"
 CONF_USE_API_V2 = "use_api_v2"
 CONF_USE_HA_SESSION = "use_ha_session"
 CONF_USE_REDIRECT = "use_redirect"
 
+# entity profiles
+ENTITY_PROFILE_FULL = "full"
+ENTITY_PROFILE_STANDARD = "standard"
+ENTITY_PROFILE_MINIMAL = "minimal"
+ENTITY_PROFILES = [ENTITY_PROFILE_FULL, ENTITY_PROFILE_STANDARD, ENTITY_PROFILE_MINIMAL]
+DEFAULT_ENTITY_PROFILE = ENTITY_PROFILE_STANDARD
+
+# per config entry data are stored in hass.data[DOMAIN][ENTRIES]
+ENTRIES = "entries"
 CLIENT = "client"
 LGE_DEVICES = "lge_devices"
 
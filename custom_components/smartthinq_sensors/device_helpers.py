@@ -1,8 +1,14 @@
 """Helper class for ThinQ devices"""
 
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from datetime import datetime, timedelta
+from typing import Any, TypeVar
 
-from homeassistant.const import STATE_OFF, STATE_ON, UnitOfTemperature
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON, EntityCategory, UnitOfTemperature
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.util.dt import utcnow
 
 from . import LGEDevice
@@ -22,10 +28,16 @@ from .const import (
     ATTR_RUN_COMPLETED,
     ATTR_START_TIME,
     ATTR_TEMP_UNIT,
+    CONF_ENTITY_PROFILE,
+    DEFAULT_ENTITY_PROFILE,
     DEFAULT_SENSOR,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
 )
 from .wideq import WM_DEVICE_TYPES, DeviceType, StateOptions, TemperatureUnit
 
+_EntityDescriptionT = TypeVar("_EntityDescriptionT", bound=EntityDescription)
+
 STATE_LOOKUP = {
     StateOptions.OFF: STATE_OFF,
     StateOptions.ON: STATE_ON,
@@ -70,7 +82,78 @@ def get_entity_name(device: LGEDevice, ent_key: str) -> str | None:
     return name
 
 
-class LGEBaseDevice:
+def get_entity_profile(entry: ConfigEntry) -> str:
+    """Return the entity profile configured for a config entry."""
+    return entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+
+
+def profile_descriptions(
+    descriptions: Iterable[_EntityDescriptionT], profile: str
+) -> Iterator[_EntityDescriptionT]:
+    """
+    Return the entity descriptions to create for an entity profile.
+
+    The full profile enables by default all the entities, the minimal profile
+    skips diagnostic entities and entities disabled by default.
+    """
+    for desc in descriptions:
+        if profile == ENTITY_PROFILE_FULL:
+            if not desc.entity_registry_enabled_default:
+                desc = replace(desc, entity_registry_enabled_default=True)
+        elif profile == ENTITY_PROFILE_MINIMAL:
+            if (
+                not desc.entity_registry_enabled_default
+                or desc.entity_category == EntityCategory.DIAGNOSTIC
+            ):
+                continue
+        yield desc
+
+
+class LGEStateAttributesMixin:
+    """
+    Mixin that returns the optional state attributes computed by
+    `_get_state_attributes` once per device state version.
+    """
+
+    _api: LGEDevice
+    _attrs: dict[str, Any] | None = None
+    _attrs_version = -1
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the optional state attributes, computed once per state version."""
+        if self._attrs_version != (version := self._api.state_version):
+            self._attrs = self._get_state_attributes()
+            self._attrs_version = version
+        return self._attrs
+
+    def _get_state_attributes(self) -> dict[str, Any] | None:
+        """Return the optional state attributes."""
+        return None
+
+
+class LGEStateChangeMixin(LGEStateAttributesMixin):
+    """
+    Mixin for coordinator entities that write their state only when the
+    device update changed it.
+
+    Entities that only depend on specific device features set `_update_keys`,
+    entities that use wrapper functions keep the default None and are
+    written when anything in the device status changed.
+    """
+
+    _update_keys: frozenset[str] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self._api.state_changed(self._update_keys):
+            return
+        self._api.coordinator.async_entity_written()
+        super()._handle_coordinator_update()
+
+
+class LGEBaseDevice(LGEStateAttributesMixin):
     """A wrapper to monitor LGE devices"""
 
     def __init__(self, api_device: LGEDevice):
@@ -134,10 +217,20 @@ class LGEBaseDevice:
             ret_val[feat_name] = states.get(feat_key)
         return ret_val
 
-    @property
-    def extra_state_attributes(self):
+    def _get_device_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes."""
+        return {}
+
+    def _get_state_attributes(self) -> dict[str, Any]:
         """Return the optional state attributes."""
-        return self.get_features_attributes()
+        data = self._get_device_attributes()
+        data.update(self.get_features_attributes())
+        return data
+
+    @property
+    def device_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes, without features."""
+        return self._get_device_attributes()
 
 
 class LGEWashDevice(LGEBaseDevice):
@@ -236,10 +329,9 @@ class LGEWashDevice(LGEBaseDevice):
                     return smart_course
         return "-"
 
-    @property
-    def extra_state_attributes(self):
-        """Return the optional state attributes."""
-        data = {
+    def _get_device_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes."""
+        return {
             ATTR_RUN_COMPLETED: self.run_completed,
             ATTR_ERROR_STATE: self.error_state,
             ATTR_START_TIME: self.start_time,
@@ -249,10 +341,6 @@ class LGEWashDevice(LGEBaseDevice):
             ATTR_RESERVE_TIME: self.reserve_time,
             ATTR_CURRENT_COURSE: self.current_course,
         }
-        features = super().extra_state_attributes
-        data.update(features)
-
-        return data
 
 
 class LGERefrigeratorDevice(LGEBaseDevice):
@@ -288,19 +376,14 @@ class LGERefrigeratorDevice(LGEBaseDevice):
             return STATE_LOOKUP.get(state, STATE_OFF)
         return STATE_OFF
 
-    @property
-    def extra_state_attributes(self):
-        """Return the optional state attributes."""
-        data = {
+    def _get_device_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes."""
+        return {
             ATTR_FRIDGE_TEMP: self.temp_fridge,
             ATTR_FREEZER_TEMP: self.temp_freezer,
             ATTR_TEMP_UNIT: self.temp_unit,
             ATTR_DOOR_OPEN: self.dooropen_state,
         }
-        features = super().extra_state_attributes
-        data.update(features)
-
-        return data
 
 
 class LGETempDevice(LGEBaseDevice):
@@ -354,18 +437,13 @@ class LGERangeDevice(LGEBaseDevice):
             return TEMP_UNIT_LOOKUP.get(unit, UnitOfTemperature.CELSIUS)
         return UnitOfTemperature.CELSIUS
 
-    @property
-    def extra_state_attributes(self):
-        """Return the optional state attributes."""
-        data = {
+    def _get_device_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes."""
+        return {
             ATTR_OVEN_LOWER_TARGET_TEMP: self.oven_lower_target_temp,
             ATTR_OVEN_UPPER_TARGET_TEMP: self.oven_upper_target_temp,
             ATTR_OVEN_TEMP_UNIT: self.oven_temp_unit,
         }
-        features = super().extra_state_attributes
-        data.update(features)
-
-        return data
 
 
 def get_wrapper_device(
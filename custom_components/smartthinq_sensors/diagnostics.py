@@ -8,12 +8,13 @@ from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from . import UNSUPPORTED_DEVICES
-from .const import DOMAIN, LGE_DEVICES
+from . import PROFILER, UNSUPPORTED_DEVICES
+from .const import CLIENT, DOMAIN, ENTRIES, LGE_DEVICES
+from .wideq.core_recorder import DEVICE_REDACT_KEYS
 from .wideq.device import Device as ThinQDevice
 
 TO_REDACT = {CONF_TOKEN}
-TO_REDACT_DEV = {"macAddress", "ssid", "userNo"}
+TO_REDACT_DEV = DEVICE_REDACT_KEYS
 TO_REDACT_STATE = {"macAddress", "ssid"}
 
 
@@ -21,18 +22,17 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict:
     """Return diagnostics for a config entry."""
-    return _async_get_diagnostics(hass, entry)
+    return await _async_get_diagnostics(hass, entry)
 
 
 async def async_get_device_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry, device: dr.DeviceEntry
 ) -> dict:
     """Return diagnostics for a device entry."""
-    return _async_get_diagnostics(hass, entry, device)
+    return await _async_get_diagnostics(hass, entry, device)
 
 
-@callback
-def _async_get_diagnostics(
+async def _async_get_diagnostics(
     hass: HomeAssistant,
     entry: ConfigEntry,
     device: dr.DeviceEntry | None = None,
@@ -44,14 +44,15 @@ def _async_get_diagnostics(
     if device:
         lg_device_id = next(iter(device.identifiers))[1]
 
-    devs_data = _async_devices_as_dict(hass, lg_device_id)
+    entry_data = hass.data[DOMAIN][ENTRIES].get(entry.entry_id, {})
+    devs_data = await _async_devices_as_dict(hass, entry_data, lg_device_id)
     diag_data[LGE_DEVICES] = devs_data
 
     if device:
         return diag_data
 
     # Get info for unsupported device if diagnostic is for the config entry
-    unsup_devices = hass.data[DOMAIN].get(UNSUPPORTED_DEVICES, {})
+    unsup_devices = entry_data.get(UNSUPPORTED_DEVICES, {})
     unsup_data = {}
     for dev_type, devices in unsup_devices.items():
         unsup_devs = [
@@ -62,16 +63,24 @@ def _async_get_diagnostics(
     if unsup_data:
         diag_data[UNSUPPORTED_DEVICES] = unsup_data
 
+    # Status of the shared model info store and of the account connection
+    if client := entry_data.get(CLIENT):
+        diag_data["model_store"] = client.model_store.as_dict()
+        diag_data["client_health"] = client.health.as_dict()
+
+    # Summary of the last profile session, if any
+    if (profiler := hass.data[DOMAIN].get(PROFILER)) and profiler.summary:
+        diag_data["profile"] = profiler.summary
+
     return diag_data
 
 
-@callback
-def _async_devices_as_dict(
-    hass: HomeAssistant, lg_device_id: str | None = None
+async def _async_devices_as_dict(
+    hass: HomeAssistant, entry_data: dict, lg_device_id: str | None = None
 ) -> dict:
     """Represent a LGE devices as a dictionary."""
 
-    lge_devices = hass.data[DOMAIN].get(LGE_DEVICES, {})
+    lge_devices = entry_data.get(LGE_DEVICES, {})
     devs_data = {}
     for dev_type, devices in lge_devices.items():
         lge_devs = {}
@@ -84,8 +93,9 @@ def _async_devices_as_dict(
                 "device_info": async_redact_data(
                     device.device_info.as_dict(), TO_REDACT_DEV
                 ),
-                "model_info": device.model_info.as_dict(),
+                "model_info": await device.model_info.async_as_dict(),
                 "device_status": device.status.as_dict if device.status else None,
+                "runtime": _async_device_runtime_info(device),
                 "home_assistant": _async_device_ha_info(
                     hass, device.device_info.device_id
                 ),
@@ -99,6 +109,20 @@ def _async_devices_as_dict(
     return devs_data
 
 
+@callback
+def _async_device_runtime_info(device: ThinQDevice) -> dict:
+    """Return the status update statistics of a ThinQ device."""
+    return {
+        "poll_stats": device.poll_stats.as_dict(),
+        "additional_poll": device.client.poll_scheduler.as_dict(device.unique_id),
+        "monitor_session": device.monitor_session,
+        "snapshot_source": device.snapshot_stats,
+        "command_queue": device.command_queue.as_dict(),
+        "optimistic_state": device.optimistic_state.as_dict(),
+        "event_lease": lease.as_dict() if (lease := device.event_lease) else None,
+    }
+
+
 @callback
 def _async_device_ha_info(hass: HomeAssistant, lg_device_id: str) -> dict | None:
     """Gather information how this ThinQ device is represented in Home Assistant."""
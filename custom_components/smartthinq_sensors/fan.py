@@ -22,7 +22,8 @@ from homeassistant.util.percentage import (
 )
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import LGEStateChangeMixin
 from .wideq import DeviceType, HoodFeatures, MicroWaveFeatures
 
 ATTR_FAN_MODE = "fan_mode"
@@ -141,7 +142,7 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up LGE device fan based on config_entry."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
 
     _LOGGER.debug("Starting LGE ThinQ fan setup...")
@@ -167,7 +168,9 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
@@ -264,7 +267,7 @@ class LGEFanWrapper:
             await self._description.turn_off_fn(self._api)
 
 
-class LGEBaseFan(CoordinatorEntity, FanEntity):
+class LGEBaseFan(LGEStateChangeMixin, CoordinatorEntity, FanEntity):
     """Base fan device."""
 
     def __init__(self, api: LGEDevice):
@@ -308,8 +311,7 @@ class LGEFan(LGEBaseFan):
             features |= FanEntityFeature.PRESET_MODE
         return features
 
-    @property
-    def extra_state_attributes(self):
+    def _get_state_attributes(self):
         """Return the optional state attributes with device specific additions."""
         state = {}
         if fan_modes := self._wrapper.fan_speeds:
@@ -20,7 +20,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback, current_p
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import LGEStateChangeMixin
 from .wideq import DehumidifierFeatures, DeviceType
 from .wideq.devices.dehumidifier import DeHumidifierDevice
 
@@ -36,7 +37,7 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up LGE device humidifier based on config_entry."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
 
     _LOGGER.debug("Starting LGE ThinQ humidifier setup...")
@@ -59,7 +60,9 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
     # register services
@@ -71,7 +74,7 @@ async def async_setup_entry(
     )
 
 
-class LGEBaseHumidifier(CoordinatorEntity, HumidifierEntity):
+class LGEBaseHumidifier(LGEStateChangeMixin, CoordinatorEntity, HumidifierEntity):
     """Base humidifier device."""
 
     def __init__(self, api: LGEDevice):
@@ -114,8 +117,7 @@ class LGEDeHumidifier(LGEBaseHumidifier):
             return HumidifierEntityFeature.MODES
         return HumidifierEntityFeature(0)
 
-    @property
-    def extra_state_attributes(self):
+    def _get_state_attributes(self):
         """Return the optional state attributes with device specific additions."""
         state = {}
         if humidity := self._api.state.device_features.get(
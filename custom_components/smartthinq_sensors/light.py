@@ -20,8 +20,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
-from .device_helpers import LGEBaseDevice
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import LGEBaseDevice, LGEStateChangeMixin
 from .wideq import DeviceType, HoodFeatures, MicroWaveFeatures
 
 _LOGGER = logging.getLogger(__name__)
@@ -79,7 +79,7 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE selects."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
 
     _LOGGER.debug("Starting LGE ThinQ light setup...")
@@ -104,11 +104,13 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
-class LGELight(CoordinatorEntity, LightEntity):
+class LGELight(LGEStateChangeMixin, CoordinatorEntity, LightEntity):
     """Class to control lights for LGE device"""
 
     entity_description: ThinQLightEntityDescription
@@ -131,6 +133,8 @@ class LGELight(CoordinatorEntity, LightEntity):
         self._turn_off_effect = None
         self._last_effect = None
         self._attr_effect_list = self._get_light_effects()
+        if description.value_fn is None and self._turn_off_effect is not None:
+            self._update_keys = frozenset({description.key})
 
     def _get_light_effects(self) -> list[str]:
         """Get available light effects."""
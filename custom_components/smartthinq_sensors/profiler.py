@@ -0,0 +1,183 @@
+"""On-demand profiling of the SmartThinQ polling pipeline."""
+
+from __future__ import annotations
+
+import cProfile
+from collections.abc import Callable
+from datetime import datetime
+import functools
+import inspect
+import logging
+import os
+import pstats
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+PROFILE_TOP_COUNT = 15
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PipelineProfiler:
+    """
+    Profile the polling pipeline for a limited time.
+
+    A cProfile session is enabled on the event loop and the target methods
+    are wrapped to measure their wall time, the difference between wall and
+    profiled time is the time spent waiting the network. Nothing is wrapped
+    when the profiler is not running.
+    """
+
+    def __init__(self, hass: HomeAssistant, targets: list[tuple[type, str]]) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self._targets = targets
+        self._profile: cProfile.Profile | None = None
+        self._stop_unsub: Callable[[], None] | None = None
+        self._originals: list[tuple[type, str, Any]] = []
+        self._timings: dict[str, dict[str, Any]] = {}
+        self._started: datetime | None = None
+        self.summary: dict[str, Any] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if a profile session is running."""
+        return self._profile is not None
+
+    def _timed(self, name: str, func: Callable) -> Callable:
+        """Wrap a function to measure its wall time."""
+        stats = self._timings.setdefault(
+            name, {"calls": 0, "wall_s": 0.0, "max_s": 0.0, "code": func.__code__}
+        )
+
+        def _update(start: float) -> None:
+            elapsed = time.perf_counter() - start
+            stats["calls"] += 1
+            stats["wall_s"] += elapsed
+            stats["max_s"] = max(stats["max_s"], elapsed)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _update(start)
+
+            return _async_wrapper
+
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _update(start)
+
+        return _wrapper
+
+    def _patch_targets(self) -> None:
+        """Wrap the target methods."""
+        for cls, name in self._targets:
+            if not (func := cls.__dict__.get(name)):
+                continue
+            self._originals.append((cls, name, func))
+            setattr(cls, name, self._timed(f"{cls.__name__}.{name}", func))
+
+    def _restore_targets(self) -> None:
+        """Restore the original target methods."""
+        for cls, name, func in self._originals:
+            setattr(cls, name, func)
+        self._originals.clear()
+
+    @callback
+    def async_start(self, duration: float) -> None:
+        """Start a profile session that stop after duration seconds."""
+        if self.is_running:
+            raise HomeAssistantError("A profile session is already running")
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as exc:
+            raise HomeAssistantError(f"Profiling not available: {exc}") from exc
+
+        self._profile = profile
+        self._started = datetime.now()
+        self._timings = {}
+        self._patch_targets()
+        self._stop_unsub = async_call_later(self._hass, duration, self._async_timeout)
+        _LOGGER.info("SmartThinQ profile started for %s seconds", duration)
+
+    async def _async_timeout(self, _) -> None:
+        """Stop the session when duration expired."""
+        self._stop_unsub = None
+        await self.async_stop()
+
+    async def async_stop(self) -> None:
+        """Stop the running session, write the stats and update the summary."""
+        if not (profile := self._profile):
+            return
+        profile.disable()
+        self._profile = None
+        self._restore_targets()
+        if self._stop_unsub:
+            self._stop_unsub()
+            self._stop_unsub = None
+
+        file_name = f"smartthinq_profile_{self._started:%Y%m%d_%H%M%S}.prof"
+        path = self._hass.config.path(file_name)
+        self.summary = await self._hass.async_add_executor_job(
+            self._write_stats, profile, path
+        )
+        _LOGGER.info("SmartThinQ profile completed, stats saved to %s", path)
+
+    def _write_stats(self, profile: cProfile.Profile, path: str) -> dict[str, Any]:
+        """Save the profile stats and return the summary."""
+        profile.dump_stats(path)
+        stats: dict[tuple, tuple] = pstats.Stats(profile).stats
+        base_path = os.path.dirname(__file__)
+
+        hotspots = []
+        integration_time = 0.0
+        for (file, line, func_name), (_, calls, tottime, cumtime, _) in stats.items():
+            if not file.startswith(base_path) or file == __file__:
+                continue
+            integration_time += tottime
+            hotspots.append(
+                {
+                    "function": f"{os.path.relpath(file, base_path)}:{line}({func_name})",
+                    "calls": calls,
+                    "tottime_s": round(tottime, 4),
+                    "cumtime_s": round(cumtime, 4),
+                }
+            )
+        hotspots.sort(key=lambda item: item["tottime_s"], reverse=True)
+
+        targets = {}
+        for name, timing in self._timings.items():
+            code = timing["code"]
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            cumtime = stats[key][3] if key in stats else 0.0
+            targets[name] = {
+                "calls": timing["calls"],
+                "wall_s": round(timing["wall_s"], 4),
+                "max_s": round(timing["max_s"], 4),
+                "profiled_s": round(cumtime, 4),
+                "wait_s": round(max(timing["wall_s"] - cumtime, 0.0), 4),
+            }
+
+        return {
+            "started": self._started.isoformat() if self._started else None,
+            "file": path,
+            "total_s": round(sum(item[2] for item in stats.values()), 4),
+            "integration_s": round(integration_time, 4),
+            "targets": targets,
+            "hotspots": hotspots[:PROFILE_TOP_COUNT],
+        }
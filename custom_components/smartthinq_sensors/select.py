@@ -15,7 +15,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import (
+    LGEStateChangeMixin,
+    get_entity_profile,
+    profile_descriptions,
+)
 from .wideq import WM_DEVICE_TYPES, DeviceType, MicroWaveFeatures
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,8 +98,9 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE selects."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
+    entity_profile = get_entity_profile(entry)
 
     _LOGGER.debug("Starting LGE ThinQ select setup...")
 
@@ -108,7 +114,7 @@ async def async_setup_entry(
         lge_select = [
             LGESelect(lge_device, select_desc)
             for dev_type, select_descs in SELECT_ENTITIES.items()
-            for select_desc in select_descs
+            for select_desc in profile_descriptions(select_descs, entity_profile)
             for lge_device in lge_devices.get(dev_type, [])
             if _select_exist(lge_device, select_desc)
         ]
@@ -118,11 +124,13 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
-class LGESelect(CoordinatorEntity, SelectEntity):
+class LGESelect(LGEStateChangeMixin, CoordinatorEntity, SelectEntity):
     """Class to control selects for LGE device"""
 
     entity_description: ThinQSelectEntityDescription
@@ -140,6 +148,8 @@ class LGESelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{api.unique_id}-{description.key}-select"
         self._attr_device_info = api.device_info
         self._attr_options = self.entity_description.options_fn(self._api)
+        if description.value_fn is None and description.available_fn is None:
+            self._update_keys = frozenset({description.key})
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -34,6 +34,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import LGEDevice
 from .const import (
     ATTR_CURRENT_COURSE,
+    ATTR_END_TIME,
     ATTR_FREEZER_TEMP,
     ATTR_FRIDGE_TEMP,
     ATTR_INITIAL_TIME,
@@ -41,9 +42,13 @@ from .const import (
     ATTR_OVEN_UPPER_TARGET_TEMP,
     ATTR_REMAIN_TIME,
     ATTR_RESERVE_TIME,
+    ATTR_START_TIME,
+    DEFAULT_ENTITY_PROFILE,
     DEFAULT_ICON,
     DEFAULT_SENSOR,
     DOMAIN,
+    ENTITY_PROFILE_MINIMAL,
+    ENTRIES,
     LGE_DEVICES,
     LGE_DISCOVERY_NEW,
 )
@@ -51,8 +56,11 @@ from .device_helpers import (
     DEVICE_ICONS,
     WASH_DEVICE_TYPES,
     LGEBaseDevice,
+    LGEStateChangeMixin,
     get_entity_name,
+    get_entity_profile,
     get_wrapper_device,
+    profile_descriptions,
 )
 from .wideq import (
     SET_TIME_DEVICE_TYPES,
@@ -578,8 +586,9 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE sensors."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
+    entity_profile = get_entity_profile(entry)
 
     _LOGGER.debug("Starting LGE ThinQ sensors setup...")
 
@@ -591,16 +600,26 @@ async def async_setup_entry(
             return
 
         lge_sensors = [
-            LGESensor(lge_device, sensor_desc, get_wrapper_device(lge_device, dev_type))
+            LGESensor(
+                lge_device,
+                sensor_desc,
+                get_wrapper_device(lge_device, dev_type),
+                entity_profile,
+            )
             for dev_type, sensor_descs in SENSOR_ENTITIES.items()
-            for sensor_desc in sensor_descs
+            for sensor_desc in profile_descriptions(sensor_descs, entity_profile)
             for lge_device in lge_devices.get(dev_type, [])
             if _sensor_exist(lge_device, sensor_desc)
         ]
 
         lge_common_sensors = [
-            LGESensor(lge_device, sensor_desc, get_wrapper_device(lge_device, dev_type))
-            for sensor_desc in COMMON_SENSORS
+            LGESensor(
+                lge_device,
+                sensor_desc,
+                get_wrapper_device(lge_device, dev_type),
+                entity_profile,
+            )
+            for sensor_desc in profile_descriptions(COMMON_SENSORS, entity_profile)
             for dev_type in lge_devices.keys()
             for lge_device in lge_devices.get(dev_type, [])
         ]
@@ -610,7 +629,9 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
     # register services
@@ -635,11 +656,22 @@ async def async_setup_entry(
     )
 
 
-class LGESensor(CoordinatorEntity, SensorEntity):
+class LGESensor(LGEStateChangeMixin, CoordinatorEntity, SensorEntity):
     """Class to monitor sensors for LGE device"""
 
     entity_description: ThinQSensorEntityDescription
     _attr_has_entity_name = True
+    # the time attributes change every minute while a program is running
+    # and are available as dedicated sensors
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_END_TIME,
+            ATTR_INITIAL_TIME,
+            ATTR_REMAIN_TIME,
+            ATTR_RESERVE_TIME,
+            ATTR_START_TIME,
+        }
+    )
     _wrap_device: LGEBaseDevice | None
 
     def __init__(
@@ -647,11 +679,13 @@ class LGESensor(CoordinatorEntity, SensorEntity):
         api: LGEDevice,
         description: ThinQSensorEntityDescription,
         wrapped_device: LGEBaseDevice | None = None,
+        entity_profile: str = DEFAULT_ENTITY_PROFILE,
     ):
         """Initialize the sensor."""
         super().__init__(api.coordinator)
         self._api = api
         self._wrap_device = wrapped_device
+        self._entity_profile = entity_profile
         self.entity_description = description
         self._attr_unique_id = api.unique_id
         if description.key != DEFAULT_SENSOR:
@@ -660,6 +694,13 @@ class LGESensor(CoordinatorEntity, SensorEntity):
         if not description.translation_key and description.name is UNDEFINED:
             self._attr_name = get_entity_name(api, description.key)
         self._is_default = description.key == DEFAULT_SENSOR
+        if not wrapped_device or not (
+            self._is_default
+            or description.value_fn is not None
+            or description.unit_fn is not None
+        ):
+            attr_keys = (description.feature_attributes or {}).values()
+            self._update_keys = frozenset({description.key, *attr_keys})
 
     @property
     def supported_features(self) -> int:
@@ -703,10 +744,11 @@ class LGESensor(CoordinatorEntity, SensorEntity):
         """Return True if unable to access real state of the entity."""
         return self._api.assumed_state
 
-    @property
-    def extra_state_attributes(self):
+    def _get_state_attributes(self):
         """Return the optional state attributes."""
         if self._is_default and self._wrap_device:
+            if self._entity_profile == ENTITY_PROFILE_MINIMAL:
+                return self._wrap_device.device_attributes
             return self._wrap_device.extra_state_attributes
 
         features = self.entity_description.feature_attributes
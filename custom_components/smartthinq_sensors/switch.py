@@ -20,8 +20,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LGEDevice
-from .const import DOMAIN, LGE_DEVICES, LGE_DISCOVERY_NEW
-from .device_helpers import STATE_LOOKUP, LGEBaseDevice
+from .const import DOMAIN, ENTRIES, LGE_DEVICES, LGE_DISCOVERY_NEW
+from .device_helpers import (
+    STATE_LOOKUP,
+    LGEBaseDevice,
+    LGEStateChangeMixin,
+    get_entity_profile,
+    profile_descriptions,
+)
 from .wideq import (
     WM_DEVICE_TYPES,
     AirConditionerFeatures,
@@ -168,8 +174,9 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the LGE switch."""
-    entry_config = hass.data[DOMAIN]
+    entry_config = hass.data[DOMAIN][ENTRIES][entry.entry_id]
     lge_cfg_devices = entry_config.get(LGE_DEVICES)
+    entity_profile = get_entity_profile(entry)
 
     _LOGGER.debug("Starting LGE ThinQ switch setup...")
 
@@ -183,7 +190,7 @@ async def async_setup_entry(
         lge_switch = [
             LGESwitch(lge_device, switch_desc)
             for dev_type, switch_descs in SWITCH_ENTITIES.items()
-            for switch_desc in switch_descs
+            for switch_desc in profile_descriptions(switch_descs, entity_profile)
             for lge_device in lge_devices.get(dev_type, [])
             if _switch_exist(lge_device, switch_desc)
         ]
@@ -202,11 +209,13 @@ async def async_setup_entry(
     _async_discover_device(lge_cfg_devices)
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, LGE_DISCOVERY_NEW, _async_discover_device)
+        async_dispatcher_connect(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", _async_discover_device
+        )
     )
 
 
-class LGEBaseSwitch(CoordinatorEntity, SwitchEntity):
+class LGEBaseSwitch(LGEStateChangeMixin, CoordinatorEntity, SwitchEntity):
     """Base switch device."""
 
     _attr_device_class = SwitchDeviceClass.SWITCH
@@ -239,6 +248,8 @@ class LGESwitch(LGEBaseSwitch):
         super().__init__(api)
         self.entity_description = description
         self._attr_unique_id = f"{api.unique_id}-{description.key}-switch"
+        if description.value_fn is None and description.available_fn is None:
+            self._update_keys = frozenset({description.key})
 
     @property
     def is_on(self):
@@ -15,6 +15,7 @@ import logging
 import os
 import ssl
 import sys
+import time
 from typing import Any
 from urllib.parse import (
     ParseResult,
@@ -28,13 +29,14 @@ from urllib.parse import (
 import uuid
 
 import aiohttp
-from charset_normalizer import from_bytes
 import xmltodict
 
 from . import core_exceptions as exc
 from .const import DEFAULT_COUNTRY, DEFAULT_LANGUAGE, DEFAULT_TIMEOUT
-from .core_util import add_end_slash, as_list, gen_uuid
+from .core_recorder import ReplaySession, TrafficRecorder
+from .core_util import ClientHealth, PollScheduler, add_end_slash, as_list, gen_uuid
 from .device_info import KEY_DEVICE_ID, DeviceInfo
+from .model_store import ModelStore, get_shared_store
 
 # The core version
 CORE_VERSION = "coreAsync"
@@ -110,6 +112,11 @@ TOKEN_EXP_LIMIT = 60  # will expire within 60 seconds
 # minimum time between 2 consecutive call for device snapshot updates (in seconds)
 MIN_TIME_BETWEEN_UPDATE = 25
 
+# min interval between client reconnections, and reconnections
+# attempted before discovering again the gateway
+MIN_TIME_BETWEEN_CLI_REFRESH = 10  # seconds
+RECONNECT_GATEWAY_REFRESH = 30
+
 _LG_SSL_CIPHERS = (
     "DEFAULT:!aNULL:!eNULL:!MD5:!3DES:!DES:!RC4:!IDEA:!SEED:!aDSS:!SRP:!PSK"
 )
@@ -181,6 +188,8 @@ class CoreAsync:
         session: aiohttp.ClientSession | None = None,
         client_id: str | None = None,
         update_clientid_callback: Callable[[str], None] | None = None,
+        gateway_url: str | None = None,
+        record_path: str | None = None,
     ):
         """
         Create the CoreAsync object
@@ -190,6 +199,8 @@ class CoreAsync:
             language: ThinQ account language
             timeout: the http timeout (default = 15 sec.)
             session: the AioHttp session to use (if None a new session is created)
+            gateway_url: the ThinQ gateway url (used to connect to a mock server)
+            record_path: the file where API traffic is recorded (if None no recording)
         """
 
         self._country = country
@@ -199,6 +210,15 @@ class CoreAsync:
         self._client_id = client_id
         self._update_clientid_callback = update_clientid_callback
         self._lang_pack_url = None
+        self._gateway_url = (
+            gateway_url or os.environ.get("thinq2_gateway_url") or V2_GATEWAY_URL
+        )
+
+        record_path = record_path or os.environ.get("thinq2_record_path")
+        self._recorder = TrafficRecorder(record_path) if record_path else None
+
+        # replay recorded traffic for debug / test
+        self._replay_path = os.environ.get("thinq2_replay_path")
 
         if session:
             self._session = session
@@ -233,12 +253,30 @@ class CoreAsync:
             await self._session.close()
             self._session = None
 
-    def _get_session(self) -> aiohttp.ClientSession:
+    def _get_session(self) -> aiohttp.ClientSession | ReplaySession:
         """Return current aiohttp client session or init a new one when required."""
         if not self._session:
-            self._session = lg_client_session()
+            if self._replay_path:
+                self._session = ReplaySession(self._replay_path)
+            else:
+                self._session = lg_client_session()
         return self._session
 
+    async def _record(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        resp: aiohttp.ClientResponse,
+        result: Any,
+        start: float,
+    ) -> None:
+        """Record a request/response pair if recording is enabled."""
+        if self._recorder:
+            await self._recorder.record(
+                method, url, data, resp.status, result, time.monotonic() - start
+            )
+
     def _get_client_id(
         self, user_number: str | None = None, force_refresh: bool = False
     ) -> str:
@@ -337,11 +375,13 @@ class CoreAsync:
         url: str,
     ) -> bytes:
         """Make a generic HTTP request."""
+        start = time.monotonic()
         async with self._get_session().get(
             url=url,
             timeout=self._timeout,
         ) as resp:
             result = await resp.content.read()
+            await self._record("GET", url, None, resp, result, start)
 
         return result
 
@@ -357,6 +397,7 @@ class CoreAsync:
         _LOGGER.debug("thinq2_get before: %s", url)
 
         client_id = self._get_client_id(user_number)
+        start = time.monotonic()
         async with self._get_session().get(
             url=url,
             headers=self._thinq2_headers(
@@ -371,6 +412,7 @@ class CoreAsync:
             raise_for_status=False,
         ) as resp:
             out = await self._get_json_resp(resp)
+            await self._record("GET", url, None, resp, out, start)
 
         _LOGGER.debug("thinq2_get after: %s", out)
 
@@ -393,9 +435,11 @@ class CoreAsync:
         _LOGGER.debug("lgedm2_post before: %s", url)
 
         client_id = self._get_client_id(user_number)
+        payload = data if is_api_v2 else {DATA_ROOT: data}
+        start = time.monotonic()
         async with self._get_session().post(
             url=url,
-            json=data if is_api_v2 else {DATA_ROOT: data},
+            json=payload,
             headers=self._thinq2_headers(
                 client_id=client_id,
                 access_token=access_token,
@@ -409,6 +453,7 @@ class CoreAsync:
             raise_for_status=False,
         ) as resp:
             out = await self._get_json_resp(resp)
+            await self._record("POST", url, payload, resp, out, start)
 
         _LOGGER.debug("lgedm2_post after: %s", out)
 
@@ -532,7 +577,7 @@ class CoreAsync:
 
     async def gateway_info(self):
         """Return ThinQ gateway information."""
-        result = await self.thinq2_get(V2_GATEWAY_URL)
+        result = await self.thinq2_get(self._gateway_url)
         _LOGGER.debug("GatewayV2 info: %s", result)
         if not self._oauth_url:
             self._oauth_url = self._get_oauth_url_from_gateway_v2_info(result)
@@ -711,10 +756,12 @@ class CoreAsync:
             "x-lge-oauth-signature": sig,
         }
 
+        start = time.monotonic()
         async with self._get_session().get(
             url=url, headers=headers, timeout=self._timeout, raise_for_status=False
         ) as resp:
             res_data = await resp.json()
+            await self._record("GET", url, None, resp, res_data, start)
 
         if res_data.get("status", -1) != 1 or "account" not in res_data:
             _LOGGER.error("get_user_number: invalid response: %s", res_data)
@@ -746,6 +793,7 @@ class CoreAsync:
             "Accept": "application/json",
         }
 
+        start = time.monotonic()
         async with self._get_session().post(
             url=url,
             headers=headers,
@@ -754,8 +802,10 @@ class CoreAsync:
             raise_for_status=False,
         ) as resp:
             if resp.status != 200:
+                await self._record("POST", url, data, resp, None, start)
                 raise exc.TokenError()
             res_data = await resp.json()
+            await self._record("POST", url, data, resp, res_data, start)
 
         if log_auth_info:
             _LOGGER.debug("Auth request result: %s", res_data)
@@ -1453,6 +1503,8 @@ class ClientAsync:
         language: str = DEFAULT_LANGUAGE,
         *,
         enable_emulation: bool = False,
+        model_store: ModelStore | None = None,
+        poll_scheduler: PollScheduler | None = None,
     ) -> None:
         """Initialize the client."""
         # The three steps required to get access to call the API.
@@ -1464,13 +1516,27 @@ class ClientAsync:
         # The last list of devices we got from the server. This is the
         # raw JSON list data describing the devices.
         self._devices = None
-
-        # Cached model info data. This is a mapping from URLs to JSON
-        # responses.
-        self._model_url_info: dict[str, Any] = {}
+        self._device_ids: set[str] | None = None
+        self._devices_listeners: list[Callable[[set[str], set[str]], None]] = []
+        # One DeviceInfo for each device, updated in place on every refresh
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._snapshot_listeners: dict[str, list[Callable[[DeviceInfo], None]]] = {}
+
+        # Model info data, shared with the other clients.
+        self._model_store = model_store or get_shared_store()
         self._common_lang_pack = None
         self._local_lang_pack = None
 
+        # Scheduler for slow-rate additional device polls, can be
+        # shared by the clients of different accounts in the same region.
+        self._poll_scheduler = poll_scheduler or PollScheduler()
+
+        # Health of the account connection, shared by the client devices
+        self._health = ClientHealth()
+        self._health_lock = asyncio.Lock()
+        self._last_reconnect = 0.0
+        self._reconnect_count = 0
+
         # Locale information used to discover a gateway, if necessary.
         self._country = country
         self._language = language
@@ -1505,6 +1571,76 @@ class ClientAsync:
             self._devices = {
                 d[KEY_DEVICE_ID]: d for d in new_devices if KEY_DEVICE_ID in d
             }
+            self._update_device_infos()
+            self._update_device_ids()
+
+    def _update_device_infos(self) -> None:
+        """Update the DeviceInfo objects and notify snapshot listeners on changes."""
+        changed: list[DeviceInfo] = []
+        for device_id, data in self._devices.items():
+            if not (device_info := self._device_infos.get(device_id)):
+                self._device_infos[device_id] = DeviceInfo(data)
+            elif device_info.update_data(data):
+                changed.append(device_info)
+        for device_id in self._device_infos.keys() - self._devices.keys():
+            self._device_infos.pop(device_id)
+
+        for device_info in changed:
+            listeners = self._snapshot_listeners.get(device_info.device_id, [])
+            for listener in list(listeners):
+                listener(device_info)
+
+    def _update_device_ids(self) -> None:
+        """Update the set of device ids and notify listeners on changes."""
+        old_ids = self._device_ids
+        new_ids = set(self._devices)
+        self._device_ids = new_ids
+        if old_ids is None or new_ids == old_ids:
+            return
+        added_ids = new_ids - old_ids
+        removed_ids = old_ids - new_ids
+        _LOGGER.debug(
+            "ThinQ devices list changed. Added: %s, Removed: %s",
+            added_ids,
+            removed_ids,
+        )
+        for listener in list(self._devices_listeners):
+            listener(added_ids, removed_ids)
+
+    def add_devices_listener(
+        self, listener: Callable[[set[str], set[str]], None]
+    ) -> Callable[[], None]:
+        """
+        Add a listener called with added and removed device ids
+        when the list of devices changes.
+        Return a function to remove the listener.
+        """
+        self._devices_listeners.append(listener)
+
+        def _remove_listener() -> None:
+            if listener in self._devices_listeners:
+                self._devices_listeners.remove(listener)
+
+        return _remove_listener
+
+    def add_snapshot_listener(
+        self, device_id: str, listener: Callable[[DeviceInfo], None]
+    ) -> Callable[[], None]:
+        """
+        Add a listener called with the DeviceInfo when the snapshot
+        of a device changes after a devices list refresh.
+        Return a function to remove the listener.
+        """
+        listeners = self._snapshot_listeners.setdefault(device_id, [])
+        listeners.append(listener)
+
+        def _remove_listener() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners and self._snapshot_listeners.get(device_id) is listeners:
+                self._snapshot_listeners.pop(device_id)
+
+        return _remove_listener
 
     @property
     def api_version(self):
@@ -1525,6 +1661,13 @@ class ClientAsync:
             return None
         return self._auth.gateway.core.client_id
 
+    @property
+    def user_number(self) -> str | None:
+        """Return the ThinQ account user number."""
+        if not self._auth:
+            return None
+        return self._auth.user_number
+
     @property
     def session(self) -> Session:
         """Return the Session object associated to this client."""
@@ -1538,20 +1681,34 @@ class ClientAsync:
         """Return True if there are devices associated."""
         return bool(self._devices)
 
+    @property
+    def devices_update_age(self) -> float:
+        """Return the seconds elapsed from the last devices list update."""
+        call_time = datetime.now(timezone.utc)
+        return (call_time - self._last_device_update).total_seconds()
+
     @property
     def devices(self) -> list[DeviceInfo] | None:
         """Return list of DeviceInfo objects describing the user's devices."""
         if self._devices is None:
             return None
-        return [DeviceInfo(d) for d in self._devices.values()]
+        return list(self._device_infos.values())
 
     def get_device(self, device_id: str) -> DeviceInfo | None:
         """Return a DeviceInfo object by device ID or None if the device id does not exist."""
         if not self._devices:
             return None
-        if device_id in self._devices:
-            return DeviceInfo(self._devices[device_id])
-        return None
+        return self._device_infos.get(device_id)
+
+    @property
+    def poll_scheduler(self) -> PollScheduler:
+        """Return the scheduler used for slow-rate device polls."""
+        return self._poll_scheduler
+
+    @property
+    def health(self) -> ClientHealth:
+        """Return the health of the account connection."""
+        return self._health
 
     @property
     def emulation(self) -> bool:
@@ -1607,6 +1764,61 @@ class ClientAsync:
         else:
             await self.refresh()
 
+    async def _reconnect(self) -> None:
+        """Refresh client connection after a connection error."""
+        self._last_reconnect = time.monotonic()
+        refresh_gateway = self._reconnect_count >= RECONNECT_GATEWAY_REFRESH
+        if refresh_gateway:
+            self._reconnect_count = 0
+        self._reconnect_count += 1
+        _LOGGER.debug("ThinQ client not connected. Trying to reconnect...")
+        await self.refresh(refresh_gateway)
+        self._reconnect_count = 0
+        self._health.reconnected()
+        _LOGGER.warning("ThinQ client successfully reconnected")
+
+    async def _probe(self) -> None:
+        """Check the account connection with a single token request."""
+        self._check_connected()
+        self._auth = await self.auth.refresh(True)
+        self._session = self.auth.start_session()
+
+    async def ensure_connected(self) -> bool:
+        """
+        Make the client ready for a device request.
+
+        Return False if the request must be skipped, because the account
+        is down or a reconnection was attempted too recently. While the
+        account is down only one caller probes the connection, with a
+        token refresh; invalid credentials are raised to the caller.
+        """
+        async with self._health_lock:
+            health = self._health
+            if health.is_down:
+                if not health.begin_probe():
+                    return False
+                try:
+                    await self._probe()
+                except exc.InvalidCredentialError:
+                    health.end_probe(False)
+                    raise
+                except Exception as ex:  # pylint: disable=broad-except
+                    _LOGGER.debug("ThinQ connection probe failed: %s", ex)
+                    health.end_probe(False)
+                    return False
+                health.end_probe(True)
+                return True
+
+            if not health.reconnect_required:
+                await self.refresh_auth()
+                return True
+
+            elapsed = time.monotonic() - self._last_reconnect
+            if elapsed <= MIN_TIME_BETWEEN_CLI_REFRESH:
+                return False
+            await self._reconnect()
+            return True
+
     @classmethod
     async def from_user_login(
         cls,
@@ -1619,6 +1831,9 @@ class ClientAsync:
         aiohttp_session: aiohttp.ClientSession | None = None,
         client_id: str | None = None,
         enable_emulation: bool = False,
+        gateway_url: str | None = None,
+        model_store: ModelStore | None = None,
+        poll_scheduler: PollScheduler | None = None,
     ) -> ClientAsync:
         """
         Construct a client using username and password.
@@ -1634,6 +1849,7 @@ class ClientAsync:
             oauth_url=oauth_url,
             session=aiohttp_session,
             client_id=client_id,
+            gateway_url=gateway_url,
         )
         try:
             gateway = await Gateway.discover(core)
@@ -1643,6 +1859,8 @@ class ClientAsync:
                 country=country,
                 language=language,
                 enable_emulation=enable_emulation,
+                model_store=model_store,
+                poll_scheduler=poll_scheduler,
             )
             client._session = auth.start_session()
             await client._load_devices()
@@ -1664,6 +1882,9 @@ class ClientAsync:
         client_id: str | None = None,
         update_clientid_callback: Callable[[str], None] | None = None,
         enable_emulation: bool = False,
+        gateway_url: str | None = None,
+        model_store: ModelStore | None = None,
+        poll_scheduler: PollScheduler | None = None,
     ) -> ClientAsync:
         """
         Construct a client using just a refresh token.
@@ -1680,6 +1901,7 @@ class ClientAsync:
             session=aiohttp_session,
             client_id=client_id,
             update_clientid_callback=update_clientid_callback,
+            gateway_url=gateway_url,
         )
         try:
             gateway = await Gateway.discover(core)
@@ -1689,6 +1911,8 @@ class ClientAsync:
                 country=country,
                 language=language,
                 enable_emulation=enable_emulation,
+                model_store=model_store,
+                poll_scheduler=poll_scheduler,
             )
             await client.refresh()
         except Exception:  # pylint: disable=broad-except
@@ -1749,47 +1973,18 @@ class ClientAsync:
 
         return result
 
-    async def _load_json_info(self, info_url: str):
-        """Load JSON data from specific url."""
+    async def _get_model_content(self, url: str) -> bytes:
+        """Download the content of a model file."""
         self._check_connected()
-        if not info_url:
-            return {}
-
-        content = await self._auth.gateway.core.http_get_bytes(info_url)
-
-        def _load_json_content():
-            """Decode and load as json the received content."""
-            try:
-                # we use charset_normalizer to detect correct encoding and convert to unicode string
-                str_content = str(from_bytes(content).best(), errors="replace")
-            except (LookupError, TypeError):
-                # A LookupError is raised if the encoding was not found which could
-                # indicate a misspelling or similar mistake.
-                #
-                # A TypeError can be raised if encoding is None
-                #
-                # So we try blindly encoding.
-                str_content = str(content, errors="replace")
-
-            enc_resp = str_content.encode()
-            try:
-                return json.loads(enc_resp)
-            except json.JSONDecodeError as ex:
-                _LOGGER.warning(
-                    "Failed to load json info file: %s - error: %s", info_url, ex
-                )
-                return None
-
-        return await asyncio.to_thread(_load_json_content)
+        return await self._auth.gateway.core.http_get_bytes(url)
 
     async def common_lang_pack(self):
         """Load JSON common lang pack from specific url."""
         if self._devices is None:
             return {}
         if self._common_lang_pack is None and self._session:
-            self._common_lang_pack = (
-                await self._load_json_info(self._session.common_lang_pack_url)
-            ).get("pack", {})
+            lang_pack = await self.model_url_info(self._session.common_lang_pack_url)
+            self._common_lang_pack = (lang_pack or {}).get("pack", {})
         return self._common_lang_pack
 
     async def local_lang_pack(self) -> dict[str, str]:
@@ -1825,25 +2020,29 @@ class ClientAsync:
         """
         if not url:
             return {}
-        if url not in self._model_url_info:
+
+        async def _fetch_model_content(model_url: str) -> bytes:
+            """Download a model file not available in the store."""
             if device:
                 _LOGGER.debug(
                     "Loading model info for %s. Model: %s, Url: %s",
                     device.name,
                     device.model_name,
-                    url,
+                    model_url,
                 )
-            if not (model_url_info := await self._load_json_info(url)):
-                return None
-            self._model_url_info[url] = model_url_info
-        return self._model_url_info[url]
+            return await self._get_model_content(model_url)
+
+        return await self._model_store.async_get(url, _fetch_model_content) or None
+
+    @property
+    def model_store(self) -> ModelStore:
+        """Return the store used for the model info data."""
+        return self._model_store
 
     def dump(self) -> dict[str, Any]:
         """Serialize the client state."""
 
-        out = {
-            "model_url_info": self._model_url_info,
-        }
+        out: dict[str, Any] = {}
 
         if self._auth:
             out["auth"] = self._auth.dump()
@@ -1885,9 +2084,6 @@ class ClientAsync:
         if "session" in state:
             client._session = Session(client.auth, state["session"])
 
-        if "model_info" in state:
-            client._model_url_info = state["model_url_info"]
-
         if "country" in state:
             client._country = state["country"]
 
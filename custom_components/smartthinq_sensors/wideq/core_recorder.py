@@ -0,0 +1,292 @@
+"""
+Record and replay of the LG SmartThinQ API traffic.
+
+Recordings are stored as JSON lines in an append-only file, sensitive
+values are redacted before writing so recordings can be shared. Device
+and home ids are replaced with stable pseudonyms, in the request url and
+data, so that the requests of different devices can still be matched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import deque
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+REDACTED = "**REDACTED**"
+PSEUDONYM_PREFIX = "redacted-"
+
+# keys redacted from device information, also used by diagnostics
+DEVICE_REDACT_KEYS = {"macAddress", "ssid", "userNo"}
+
+# keys redacted from the recorded traffic
+TRAFFIC_REDACT_KEYS = {
+    *DEVICE_REDACT_KEYS,
+    "access_token",
+    "refresh_token",
+    "token",
+    "serialNo",
+    "serialNumber",
+    "deviceSerialNo",
+}
+
+# keys with values replaced by a stable pseudonym in the recorded traffic
+TRAFFIC_PSEUDONYM_KEYS = {"deviceId", "homeId"}
+
+# url path segments followed by an id
+_ID_PARENT_SEGMENTS = {"devices", "homes"}
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$", re.I
+)
+
+# request keys that change on every call and are ignored when matching
+_VOLATILE_KEYS = {"workId"}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def pseudonym(value: Any) -> str:
+    """Return a stable pseudonym for an id, a pseudonym is returned unchanged."""
+    value = str(value)
+    if value.startswith(PSEUDONYM_PREFIX):
+        return value
+    digest = hashlib.sha256(value.encode()).hexdigest()
+    return f"{PSEUDONYM_PREFIX}{digest[:16]}"
+
+
+def redact_data(
+    data: Any, to_redact: set[str], to_pseudonym: set[str] | None = None
+) -> Any:
+    """
+    Return a copy of data with the values of the keys to redact replaced.
+    The values of the keys in `to_pseudonym` are replaced with a pseudonym.
+    """
+    if isinstance(data, list):
+        return [redact_data(item, to_redact, to_pseudonym) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    redacted = {}
+    for key, value in data.items():
+        if key in to_redact:
+            redacted[key] = REDACTED
+        elif to_pseudonym and key in to_pseudonym and value:
+            redacted[key] = pseudonym(value)
+        else:
+            redacted[key] = redact_data(value, to_redact, to_pseudonym)
+    return redacted
+
+
+def redact_url(url: str) -> str:
+    """
+    Return the url with the ids in the path replaced with a pseudonym
+    and the query values redacted.
+    """
+    parsed = urlparse(url)
+    segments = parsed.path.split("/")
+    for idx, segment in enumerate(segments):
+        if not segment:
+            continue
+        if _UUID_SEGMENT.match(segment) or (
+            idx > 0 and segments[idx - 1] in _ID_PARENT_SEGMENTS
+        ):
+            segments[idx] = pseudonym(segment)
+    query = urlencode(
+        [(key, REDACTED) for key, _ in parse_qsl(parsed.query, keep_blank_values=True)]
+    )
+    netloc = parsed.netloc.rpartition("@")[2]
+    return urlunparse((parsed.scheme, netloc, "/".join(segments), "", query, ""))
+
+
+def _redact_traffic(data: Any) -> Any:
+    """Return a copy of the traffic data with the sensitive values replaced."""
+    return redact_data(data, TRAFFIC_REDACT_KEYS, TRAFFIC_PSEUDONYM_KEYS)
+
+
+def _strip_volatile(data: Any) -> Any:
+    """Remove from request data the keys that change on every call."""
+    if isinstance(data, list):
+        return [_strip_volatile(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {k: _strip_volatile(v) for k, v in data.items() if k not in _VOLATILE_KEYS}
+
+
+def request_key(method: str, url: str, data: Any = None) -> str:
+    """Return the key used to match a request with a recording."""
+    request = _strip_volatile(_redact_traffic(data))
+    body = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return f"{method} {urlparse(redact_url(url)).path} {body}"
+
+
+class TrafficRecorder:
+    """Append the API request/response pairs to a recording file."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self._path = path
+        self._write_lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Return the recording file path."""
+        return self._path
+
+    def _write(self, line: str) -> None:
+        """Append a line to the recording file."""
+        with self._write_lock:
+            with open(self._path, "a", encoding="utf-8") as rec_file:
+                rec_file.write(line + "\n")
+
+    async def record(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        status: int,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        """Redact and append a request/response pair to the recording."""
+        record: dict[str, Any] = {
+            "time": round(time.time(), 3),
+            "method": method,
+            "url": redact_url(url),
+            "data": _redact_traffic(data),
+            "status": status,
+            "elapsed": round(elapsed, 4),
+        }
+        if isinstance(response, bytes):
+            try:
+                response = json.loads(response)
+            except ValueError:
+                record["b64"] = base64.b64encode(response).decode()
+                response = None
+        if "b64" not in record:
+            record["body"] = _redact_traffic(response)
+
+        line = json.dumps(record, separators=(",", ":"))
+        try:
+            await asyncio.to_thread(self._write, line)
+        except OSError as exc:
+            _LOGGER.warning("Failed to write traffic recording: %s", exc)
+
+
+class ReplayResponse:
+    """A recorded response, with the subset of aiohttp response API we use."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._body = body
+        self.content = self
+
+    async def read(self) -> bytes:
+        """Return the response body."""
+        return self._body
+
+    async def text(self, errors: str = "strict") -> str:
+        """Return the response body as text."""
+        return self._body.decode("utf-8", errors=errors)
+
+    async def json(self) -> Any:
+        """Return the response body as json."""
+        return json.loads(self._body)
+
+
+class _ReplayRequest:
+    """Async context manager returning a recorded response."""
+
+    def __init__(self, coro) -> None:
+        """Initialize the request."""
+        self._coro = coro
+
+    async def __aenter__(self) -> ReplayResponse:
+        """Return the recorded response."""
+        return await self._coro
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Nothing to release."""
+
+
+class ReplaySession:
+    """
+    Serve recorded responses in place of an aiohttp client session.
+
+    Responses for the same request are returned in recorded order, the
+    last one is repeated when the recording is exhausted. If `use_timing`
+    is set, the recorded response time is waited, scaled by `speed`.
+    """
+
+    def __init__(self, path: str, *, use_timing=False, speed: float = 1.0) -> None:
+        """Initialize the session, the recording file is loaded on first request."""
+        self._path = path
+        self._use_timing = use_timing
+        self._speed = speed
+        self._closed = False
+        self._records: dict[str, deque[dict[str, Any]]] | None = None
+        self._load_lock = asyncio.Lock()
+
+    def _load_records(self) -> dict[str, deque[dict[str, Any]]]:
+        """Load the recording file grouping records by request."""
+        records: dict[str, deque[dict[str, Any]]] = {}
+        with open(self._path, encoding="utf-8") as rec_file:
+            for line in rec_file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = request_key(record["method"], record["url"], record["data"])
+                records.setdefault(key, deque()).append(record)
+        return records
+
+    @property
+    def closed(self) -> bool:
+        """Return if the session is closed."""
+        return self._closed
+
+    async def close(self) -> None:
+        """Close the session."""
+        self._closed = True
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Replay a GET request."""
+        return _ReplayRequest(self._replay("GET", url, None))
+
+    def post(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Replay a POST request."""
+        data = kwargs.get("json", kwargs.get("data"))
+        return _ReplayRequest(self._replay("POST", url, data))
+
+    async def _next_record(self, method: str, url: str, data: Any) -> dict | None:
+        """Return the next recording for a request."""
+        async with self._load_lock:
+            if self._records is None:
+                self._records = await asyncio.to_thread(self._load_records)
+        if not (records := self._records.get(request_key(method, url, data))):
+            return None
+        if len(records) > 1:
+            return records.popleft()
+        return records[0]
+
+    async def _replay(self, method: str, url: str, data: Any) -> ReplayResponse:
+        """Return the recorded response for a request."""
+        if not (record := await self._next_record(method, url, data)):
+            _LOGGER.warning("No recording available for %s %s", method, url)
+            return ReplayResponse(404, b"")
+
+        if self._use_timing and self._speed > 0:
+            await asyncio.sleep(record["elapsed"] / self._speed)
+
+        if "b64" in record:
+            body = base64.b64decode(record["b64"])
+        else:
+            body = json.dumps(record["body"]).encode()
+        return ReplayResponse(record["status"], body)
@@ -1,6 +1,27 @@
 """Support for LG SmartThinQ device."""
 
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
 import uuid
+import zlib
+
+from .backports.enum import StrEnum
+
+# consecutive account level failures before polling is paused
+MAX_ACCOUNT_FAILURES = 10
+
+# interval between the recovery probes while the account is down
+PROBE_MIN_INTERVAL = 30  # seconds
+PROBE_MAX_INTERVAL = 600  # seconds
+
+# delay between the devices resuming polls after a recovery
+RESUME_STAGGER_STEP = 0.5  # seconds
+
+_LOGGER = logging.getLogger(__name__)
 
 
 def as_list(obj) -> list:
@@ -67,3 +88,259 @@ class TempUnitConversion:
                 out[c_num] = fah
             self._c2f_map = out
         return self._c2f_map.get(value, value)
+
+
+class PollScheduler:
+    """
+    Schedule slow-rate poll tasks shared by all devices of a client.
+
+    Each task key is assigned a stable slot inside the poll interval,
+    derived from the key, so that tasks started at the same time are
+    spread over the interval instead of running all in the same poll
+    cycle, and adding or removing a key does not move the other slots.
+    The first run of a key is also delayed to its slot offset.
+    """
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self._start = time.monotonic()
+        self._slots: dict[str, float] = {}
+        self._next_run: dict[str, float] = {}
+        self._running: set[str] = set()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def _slot_offset(self, key: str, interval: int) -> float:
+        """Return the offset of the slot assigned to a key."""
+        return interval * self._slots[key]
+
+    def _next_slot(self, key: str, interval: int, now: float) -> float:
+        """Return the start time of the next slot assigned to a key."""
+        offset = self._slot_offset(key, interval)
+        cycles = int((now - self._start - offset) // interval) + 1
+        return self._start + offset + cycles * interval
+
+    def register(self, key: str) -> None:
+        """Register a new task key, first run is scheduled on first call."""
+        if key in self._slots:
+            return
+        self._slots[key] = zlib.crc32(key.encode()) % 1000 / 1000
+        self._stats[key] = {
+            "runs": 0,
+            "skipped": 0,
+            "errors": 0,
+            "last_duration": None,
+            "total_duration": 0.0,
+        }
+
+    def unregister(self, key: str) -> None:
+        """Remove a task key from the scheduler."""
+        if self._slots.pop(key, None) is None:
+            return
+        self._next_run.pop(key, None)
+        self._stats.pop(key, None)
+
+    def is_due(self, key: str, interval: int) -> bool:
+        """Return True if the task for the key must run now."""
+        self.register(key)
+        if key in self._running:
+            return False
+        now = time.monotonic()
+        if (next_run := self._next_run.get(key)) is None:
+            next_run = now + self._slot_offset(key, interval)
+            self._next_run[key] = next_run
+        return now >= next_run
+
+    def skip(self, key: str, interval: int) -> None:
+        """Skip the current run for the key and move to the next slot."""
+        self.register(key)
+        self._stats[key]["skipped"] += 1
+        self._next_run[key] = self._next_slot(key, interval, time.monotonic())
+
+    async def run(
+        self,
+        key: str,
+        interval: int,
+        target: Callable[[], Awaitable[Any]],
+        *,
+        force: bool = False,
+    ) -> bool:
+        """
+        Run the task for the key if due, return True if executed.
+        With force the task runs also when not due, unless already running.
+        """
+        if force:
+            self.register(key)
+            if key in self._running:
+                return False
+        elif not self.is_due(key, interval):
+            return False
+
+        self._running.add(key)
+        stats = self._stats[key]
+        start = time.monotonic()
+        try:
+            await target()
+        except Exception as exc:  # pylint: disable=broad-except
+            stats["errors"] += 1
+            _LOGGER.debug("Error running scheduled poll for %s: %s", key, exc)
+        finally:
+            self._running.discard(key)
+            end = time.monotonic()
+            stats["runs"] += 1
+            stats["last_duration"] = round(end - start, 3)
+            stats["total_duration"] += end - start
+            self._next_run[key] = self._next_slot(key, interval, end)
+
+        return True
+
+    def as_dict(self, key: str | None = None) -> dict[str, Any]:
+        """Return the collected statistics."""
+
+        def _format(stats: dict[str, Any]) -> dict[str, Any]:
+            return {**stats, "total_duration": round(stats["total_duration"], 3)}
+
+        if key is not None:
+            return _format(self._stats[key]) if key in self._stats else {}
+        return {k: _format(v) for k, v in self._stats.items()}
+
+
+class HealthState(StrEnum):
+    """The health states of a ThinQ account connection."""
+
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+    DOWN = "down"
+    RECOVERING = "recovering"
+
+
+class ClientHealth:
+    """
+    Track the health of the ThinQ account connection of a client.
+
+    Failures reported by the devices move the state from healthy to degraded,
+    and to down when they persist. While down the devices do not poll, a
+    single probe is allowed at increasing intervals and the state is
+    recovering until the probe completes. When the probe succeeds, the
+    devices paused during the outage resume polling with staggered delays.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_failures: int = MAX_ACCOUNT_FAILURES,
+        probe_min_interval: float = PROBE_MIN_INTERVAL,
+        probe_max_interval: float = PROBE_MAX_INTERVAL,
+        resume_step: float = RESUME_STAGGER_STEP,
+    ) -> None:
+        """Initialize object."""
+        self._max_failures = max_failures
+        self._probe_min_interval = probe_min_interval
+        self._probe_max_interval = probe_max_interval
+        self._resume_step = resume_step
+        self._state = HealthState.HEALTHY
+        self._failures = 0
+        self._reconnect_required = False
+        self._probe_interval = probe_min_interval
+        self._next_probe = 0.0
+        self._paused: dict[str, None] = {}
+        self._resume_at: dict[str, float] = {}
+        self._stats = {"outages": 0, "probes": 0, "failed_probes": 0}
+
+    @property
+    def state(self) -> HealthState:
+        """Return the current state."""
+        return self._state
+
+    @property
+    def is_down(self) -> bool:
+        """Return True if the device polling is paused."""
+        return self._state in (HealthState.DOWN, HealthState.RECOVERING)
+
+    @property
+    def reconnect_required(self) -> bool:
+        """Return True if the client must reconnect before next poll."""
+        return self._reconnect_required
+
+    def _set_state(self, state: HealthState) -> None:
+        """Change the current state."""
+        if state == self._state:
+            return
+        _LOGGER.debug("ThinQ account health changed: %s -> %s", self._state, state)
+        self._state = state
+
+    def report_success(self) -> None:
+        """Report a successful request."""
+        self._failures = 0
+        if self._state == HealthState.DEGRADED:
+            self._set_state(HealthState.HEALTHY)
+
+    def report_failure(self, reconnect: bool = False) -> None:
+        """Report a failed request, `reconnect` if the client must reconnect."""
+        if reconnect:
+            self._reconnect_required = True
+        if self.is_down:
+            return
+        self._failures += 1
+        if self._failures < self._max_failures:
+            self._set_state(HealthState.DEGRADED)
+            return
+
+        self._stats["outages"] += 1
+        self._probe_interval = self._probe_min_interval
+        self._next_probe = time.monotonic() + self._probe_interval
+        self._set_state(HealthState.DOWN)
+        _LOGGER.warning("ThinQ connection not available, device polling paused")
+
+    def reconnected(self) -> None:
+        """Report that the client reconnected."""
+        self._reconnect_required = False
+
+    def pause(self, key: str) -> None:
+        """Register a device that skipped polling while down."""
+        self._paused[key] = None
+
+    def begin_probe(self) -> bool:
+        """Return True and start recovering if a probe is due."""
+        if self._state != HealthState.DOWN or time.monotonic() < self._next_probe:
+            return False
+        self._stats["probes"] += 1
+        self._set_state(HealthState.RECOVERING)
+        return True
+
+    def end_probe(self, success: bool) -> None:
+        """Complete the running probe with its result."""
+        if self._state != HealthState.RECOVERING:
+            return
+        now = time.monotonic()
+        if not success:
+            self._stats["failed_probes"] += 1
+            self._probe_interval = min(
+                self._probe_interval * 2, self._probe_max_interval
+            )
+            self._next_probe = now + self._probe_interval
+            self._set_state(HealthState.DOWN)
+            return
+
+        self._failures = 0
+        self._reconnect_required = False
+        for slot, key in enumerate(self._paused):
+            self._resume_at[key] = now + slot * self._resume_step
+        self._paused.clear()
+        self._set_state(HealthState.HEALTHY)
+        _LOGGER.info("ThinQ connection restored, device polling resumed")
+
+    def resume_delay(self, key: str) -> float:
+        """Return the seconds a device must wait before polling after a recovery."""
+        if (resume_at := self._resume_at.pop(key, None)) is None:
+            return 0.0
+        return max(resume_at - time.monotonic(), 0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the health status."""
+        return {
+            "state": str(self._state),
+            "failures": self._failures,
+            "reconnect_required": self._reconnect_required,
+            "paused_devices": len(self._paused),
+            **self._stats,
+        }
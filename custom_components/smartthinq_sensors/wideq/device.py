@@ -7,13 +7,17 @@ from __future__ import annotations
 
 import asyncio
 import base64
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import json
 import logging
 from numbers import Number
 import os
+import time
 from typing import Any
 
 import aiohttp
@@ -48,15 +52,397 @@ LOCAL_LANG_PACK = {
     "NOT_USE": "Not Used",
 }
 
-MIN_TIME_BETWEEN_CLI_REFRESH = 10  # seconds
 MAX_RETRIES = 3
-MAX_UPDATE_FAIL_ALLOWED = 10
 MAX_INVALID_CREDENTIAL_ERR = 3
 SLEEP_BETWEEN_RETRIES = 2  # seconds
 
+# ThinQ1 monitor sessions are kept alive across empty polls
+# and restarted only on error or when expired
+MONITOR_SESSION_MAX_AGE = 1800  # seconds
+MONITOR_SESSION_MAX_EMPTY_POLLS = 10
+
+# values set by commands are kept until confirmed by a poll, contradicted
+# by a second poll or expired
+OPTIMISTIC_STATE_TTL = 60  # seconds
+
+# ThinQ2 dashboard snapshots older than these ages are replaced by a
+# dedicated device query when the device is on, the shorter age is
+# used by the devices that prefer the query
+SNAPSHOT_MAX_AGE = 60  # seconds
+SNAPSHOT_STALE_AGE = 300  # seconds
+
+# ThinQ2 events enabled by a command are active for the lease duration,
+# the lease is renewed when it is about to expire or the data are stale
+EVENT_LEASE_DURATION = 70  # seconds
+EVENT_LEASE_RENEW_MARGIN = 15  # seconds
+
+# number of samples kept for the rolling status update statistics
+POLL_STATS_SAMPLES = 20
+STAT_FETCH = "fetch"
+STAT_DECODE = "decode"
+STAT_FEATURES = "features"
+STAT_ENTITY_WRITES = "entity_writes"
+
+# status data keys that change on every update without a status change
+STATUS_VOLATILE_KEYS = {"timestamp"}
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class MonitorSession:
+    """
+    A ThinQ1 monitor session.
+
+    Track the work id returned by `rti/rtiMon Start` with its age,
+    so that the same session can be reused across empty polls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the monitor session."""
+        self._work_id: str | None = None
+        self._started: datetime | None = None
+        self._empty_polls = 0
+        self._restarts = 0
+
+    @property
+    def work_id(self) -> str | None:
+        """Return the active work id."""
+        return self._work_id
+
+    @property
+    def age(self) -> float:
+        """Return the age of the active session in seconds."""
+        if self._started is None:
+            return 0.0
+        return (datetime.now(timezone.utc) - self._started).total_seconds()
+
+    @property
+    def restarts(self) -> int:
+        """Return the number of times the session was restarted."""
+        return self._restarts
+
+    @property
+    def is_expired(self) -> bool:
+        """Return True if the active session should be restarted."""
+        if not self._work_id:
+            return False
+        if self._empty_polls >= MONITOR_SESSION_MAX_EMPTY_POLLS:
+            return True
+        return self.age >= MONITOR_SESSION_MAX_AGE
+
+    def open(self, work_id: str) -> None:
+        """Register a new work id."""
+        if self._started is not None:
+            self._restarts += 1
+        self._work_id = work_id
+        self._started = datetime.now(timezone.utc)
+        self._empty_polls = 0
+
+    def close(self) -> str | None:
+        """Invalidate the active session and return its work id."""
+        work_id = self._work_id
+        self._work_id = None
+        return work_id
+
+    def poll_result(self, has_data: bool) -> None:
+        """Register the result of a monitor poll."""
+        if has_data:
+            self._empty_polls = 0
+        else:
+            self._empty_polls += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the session information as dict."""
+        return {
+            "active": self._work_id is not None,
+            "age": round(self.age, 1) if self._work_id else None,
+            "empty_polls": self._empty_polls,
+            "restarts": self._restarts,
+        }
+
+
+class DeviceCommand:
+    """A device control command waiting to be sent."""
+
+    def __init__(
+        self,
+        ctrl_key,
+        command,
+        *,
+        key=None,
+        value=None,
+        data=None,
+        ctrl_path=None,
+    ) -> None:
+        """Initialize the command."""
+        self.ctrl_key = ctrl_key
+        self.command = command
+        self.key = key
+        self.value = value
+        self.data = data
+        self.ctrl_path = ctrl_path
+        self.waiters: list[asyncio.Future] = []
+
+    @property
+    def cmd_id(self) -> Any:
+        """
+        Return the identifier used to replace a pending command.
+        Commands without a key are never replaced.
+        """
+        if self.key is None or not isinstance(self.ctrl_key, str):
+            return id(self)
+        return (self.ctrl_key, self.command, self.key, self.ctrl_path)
+
+    def set_result(self, exc: Exception | None = None) -> None:
+        """Notify the result of the command to all waiters."""
+        for waiter in self.waiters:
+            if waiter.done():
+                continue
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
+
+class CommandQueue:
+    """
+    A per-device queue of control commands.
+
+    A command is sent at once when the queue is idle. Commands received
+    while a send is in flight are sent together when it completes, and a
+    command for a key already pending replaces the previous one, so that
+    callers of the replaced command are notified with the new result.
+    """
+
+    def __init__(
+        self, send_fn: Callable[[list[DeviceCommand]], Awaitable[None]]
+    ) -> None:
+        """Initialize the queue."""
+        self._send_fn = send_fn
+        self._pending: dict[Any, DeviceCommand] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._stats = {"queued": 0, "superseded": 0, "batches": 0, "errors": 0}
+
+    async def put(self, command: DeviceCommand) -> None:
+        """Queue a command and wait for it to be sent."""
+        waiter = asyncio.get_running_loop().create_future()
+        command.waiters.append(waiter)
+        self._stats["queued"] += 1
+
+        if old_cmd := self._pending.pop(command.cmd_id, None):
+            # last write wins, the new command is moved at the end of the queue
+            command.waiters[:0] = old_cmd.waiters
+            self._stats["superseded"] += 1
+        self._pending[command.cmd_id] = command
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        await waiter
+
+    async def _flush(self) -> None:
+        """Send the pending commands until no more commands are received."""
+        try:
+            while self._pending:
+                commands = list(self._pending.values())
+                self._pending.clear()
+                self._stats["batches"] += 1
+                try:
+                    await self._send_fn(commands)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self._stats["errors"] += 1
+                    for command in commands:
+                        command.set_result(exc)
+                else:
+                    for command in commands:
+                        command.set_result()
+        finally:
+            self._flush_task = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue statistics as dict."""
+        return {**self._stats, "pending": len(self._pending)}
+
+
+class OptimisticState:
+    """
+    Status values expected after a command.
+
+    Expected values are keyed by the status data key. A polled value that
+    differs from the expected one is replaced only on the first poll, to
+    cover the cloud update delay, then the polled value is used.
+    """
+
+    def __init__(self, ttl: float = OPTIMISTIC_STATE_TTL) -> None:
+        """Initialize the optimistic state."""
+        self._ttl = ttl
+        self._expected: dict[str, tuple[Any, datetime, bool]] = {}
+        self._stats = {"confirmed": 0, "disagreements": 0, "rolled_back": 0}
+
+    def expect(self, key: str, value) -> None:
+        """Record the value expected for a status data key."""
+        expire = datetime.now(timezone.utc) + timedelta(seconds=self._ttl)
+        self._expected[key] = (value, expire, False)
+
+    def reconcile(self, data: dict | None) -> None:
+        """Confirm or roll back the expected values using polled data."""
+        if not (self._expected and data):
+            return
+        now = datetime.now(timezone.utc)
+        for key, (value, expire, disagreed) in list(self._expected.items()):
+            if key not in data:
+                if expire < now:
+                    self._expected.pop(key)
+                continue
+            if str(data[key]) == str(value):
+                self._expected.pop(key)
+                self._stats["confirmed"] += 1
+                continue
+            self._stats["disagreements"] += 1
+            if disagreed or expire < now:
+                # the cloud did not confirm the value, use the polled one
+                self._expected.pop(key)
+                self._stats["rolled_back"] += 1
+                continue
+            self._expected[key] = (value, expire, True)
+            data[key] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the optimistic state statistics as dict."""
+        return {**self._stats, "pending": len(self._expected)}
+
+
+class EventLease:
+    """
+    A lease on the ThinQ2 device events enabled with a command.
+
+    Track the expiry of the enabled events, so that the command is sent
+    again only when the lease is about to expire or when the data provided
+    by the events are missing from the device snapshot.
+    """
+
+    def __init__(
+        self,
+        duration: float = EVENT_LEASE_DURATION,
+        renew_margin: float = EVENT_LEASE_RENEW_MARGIN,
+    ) -> None:
+        """Initialize the lease."""
+        self._duration = duration
+        self._renew_margin = renew_margin
+        self._expire: float | None = None
+        self._stats = {"renewals": 0, "skipped": 0, "stale": 0}
+
+    @property
+    def duration(self) -> int:
+        """Return the lease duration in seconds."""
+        return int(self._duration)
+
+    @property
+    def is_due(self) -> bool:
+        """Return True if the lease must be renewed."""
+        if self._expire is None:
+            return True
+        if time.monotonic() < self._expire - self._renew_margin:
+            self._stats["skipped"] += 1
+            return False
+        return True
+
+    def renewed(self) -> None:
+        """Record a successful renewal of the lease."""
+        self._expire = time.monotonic() + self._duration
+        self._stats["renewals"] += 1
+
+    def check_data(self, data: dict | None, keys: list[str]) -> None:
+        """Expire the lease if a key provided by the events is missing from data."""
+        if not data or self._expire is None:
+            return
+        if any(data.get(key) is None for key in keys):
+            self._stats["stale"] += 1
+            self._expire = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the lease statistics as dict."""
+        expires_in = None
+        if self._expire is not None:
+            expires_in = max(round(self._expire - time.monotonic(), 1), 0)
+        return {**self._stats, "expires_in": expires_in}
+
+
+class PollStats:
+    """
+    Rolling statistics of the device status updates.
+
+    Timings are in seconds, only the last samples are used to compute
+    the mean and max values.
+    """
+
+    def __init__(self, samples: int = POLL_STATS_SAMPLES) -> None:
+        """Initialize the statistics."""
+        self._max_samples = samples
+        self._samples: dict[str, deque[float]] = {}
+        self._stats = {
+            "updates": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "retries": 0,
+        }
+        self._last_success: datetime | None = None
+        self._last_failure: datetime | None = None
+
+    def add_sample(self, name: str, value: float) -> None:
+        """Add a sample for a statistic."""
+        if name not in self._samples:
+            self._samples[name] = deque(maxlen=self._max_samples)
+        self._samples[name].append(value)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Add the execution time of a code block as sample."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_sample(name, time.perf_counter() - start)
+
+    def add_retry(self) -> None:
+        """Count a retry of the status update."""
+        self._stats["retries"] += 1
+
+    def update_succeeded(self) -> None:
+        """Record a successful status update."""
+        self._stats["updates"] += 1
+        self._stats["consecutive_failures"] = 0
+        self._last_success = datetime.now(timezone.utc)
+
+    def update_failed(self) -> None:
+        """Record a failed status update."""
+        self._stats["updates"] += 1
+        self._stats["failures"] += 1
+        self._stats["consecutive_failures"] += 1
+        self._last_failure = datetime.now(timezone.utc)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as dict."""
+        samples = {
+            name: {
+                "last": round(values[-1], 6),
+                "mean": round(sum(values) / len(values), 6),
+                "max": round(max(values), 6),
+            }
+            for name, values in self._samples.items()
+            if values
+        }
+        return {
+            **self._stats,
+            "last_success": (
+                self._last_success.isoformat() if self._last_success else None
+            ),
+            "last_failure": (
+                self._last_failure.isoformat() if self._last_failure else None
+            ),
+            **samples,
+        }
+
+
 class Monitor:
     """
     A monitoring task for a device.
@@ -64,21 +450,27 @@ class Monitor:
     This task is robust to some API-level failures. If the monitoring
     task expires, it attempts to start a new one automatically. This
     makes one `Monitor` object suitable for long-term monitoring.
+    Connection errors are reported to the client health, polling is
+    skipped while the ThinQ account is down.
     """
 
-    _client_lock = asyncio.Lock()
-    _client_connected = True
-    _critical_error = False
-    _last_client_refresh = datetime.min.replace(tzinfo=timezone.utc)
-    _not_logged_count = 0
-
-    def __init__(self, client: ClientAsync, device_info: DeviceInfo) -> None:
+    def __init__(
+        self,
+        client: ClientAsync,
+        device_info: DeviceInfo,
+        poll_stats: PollStats | None = None,
+        query_required: Callable[[DeviceInfo | None], bool] | None = None,
+    ) -> None:
         """Initialize monitor class."""
         self._client: ClientAsync = client
+        self._poll_stats = poll_stats
+        self._query_required = query_required
+        self._last_query: float | None = None
+        self._snapshot_stats = {"dashboard": 0, "query": 0}
         self._device_id = device_info.device_id
         self._platform_type = device_info.platform_type
         self._device_descr = device_info.name
-        self._work_id: str | None = None
+        self._session = MonitorSession()
         self._has_error = False
         self._invalid_credential_count = 0
         self._error_log_count = 0
@@ -88,14 +480,16 @@ class Monitor:
         msg,
         *,
         not_logged=False,
+        conn_error=False,
         exc: Exception = None,
         exc_info=False,
         debug_count=0,
     ) -> None:
         """Log and raise error with different level depending on condition."""
 
-        if not_logged and Monitor._client_connected:
-            Monitor._client_connected = False
+        health = self._client.health
+        if not_logged or conn_error:
+            health.report_failure(reconnect=not_logged)
 
         self._error_log_count += 1
         if self._error_log_count > debug_count:
@@ -110,51 +504,36 @@ class Monitor:
             log_lev, "%s - Device: %s", msg, self._device_descr, exc_info=exc_info
         )
 
-        if (
-            not Monitor._critical_error
-            and Monitor._not_logged_count >= MAX_UPDATE_FAIL_ALLOWED
-        ):
-            Monitor._critical_error = True
-            _LOGGER.error(msg, exc_info=exc_info)
-
-        if Monitor._critical_error:
+        if health.is_down:
             raise core_exc.MonitorUnavailableError(self._device_id, msg) from exc
         raise core_exc.MonitorRefreshError(self._device_id, msg) from exc
 
-    async def _refresh_auth(self) -> bool:
-        """Refresh the devices shared client auth token"""
-        async with Monitor._client_lock:
-            if Monitor._client_connected:
-                await self._client.refresh_auth()
-                return True
-            return await self._refresh_client()
-
-    async def _refresh_client(self) -> bool:
-        """Refresh the devices shared client"""
-        if Monitor._client_connected:
-            return True
-        call_time = datetime.now(timezone.utc)
-        difference = (call_time - Monitor._last_client_refresh).total_seconds()
-        if difference <= MIN_TIME_BETWEEN_CLI_REFRESH:
-            return False
+    def _raise_not_connected(self) -> None:
+        """Raise the error for a poll skipped because client is not connected."""
+        if not (health := self._client.health).is_down:
+            # reconnection in progress or attempted too recently
+            self._raise_error(
+                "Connection to ThinQ not available. Client refresh error",
+                debug_count=2,
+            )
+        health.pause(self._device_id)
+        _LOGGER.debug(
+            "ThinQ connection not available, poll skipped - Device: %s",
+            self._device_descr,
+        )
+        raise core_exc.MonitorUnavailableError(
+            self._device_id, "ThinQ connection not available"
+        )
 
-        Monitor._last_client_refresh = call_time
-        refresh_gateway = False
-        if Monitor._not_logged_count >= 30:
-            Monitor._not_logged_count = 0
-            refresh_gateway = True
-        Monitor._not_logged_count += 1
-        _LOGGER.debug("ThinQ client not connected. Trying to reconnect...")
-        await self._client.refresh(refresh_gateway)
-        _LOGGER.warning("ThinQ client successfully reconnected")
-        Monitor._client_connected = True
-        Monitor._critical_error = False
-        Monitor._not_logged_count = 0
-        return True
+    async def _wait_resume(self) -> None:
+        """Wait the device turn to resume polling after an outage."""
+        if delay := self._client.health.resume_delay(self._device_id):
+            await asyncio.sleep(delay)
 
     async def refresh(self, query_device=False) -> Any | None:
         """Update device state"""
         _LOGGER.debug("Updating ThinQ device %s", self._device_descr)
+        await self._wait_resume()
         invalid_credential_count = self._invalid_credential_count
         self._invalid_credential_count = 0
 
@@ -166,10 +545,12 @@ class Monitor:
             # Wait one second between iteration
 
             if iteration > 0:
+                if self._poll_stats:
+                    self._poll_stats.add_retry()
                 await asyncio.sleep(SLEEP_BETWEEN_RETRIES)
 
             try:
-                if refresh_auth := await self._refresh_auth():
+                if connected := await self._client.ensure_connected():
                     state, retry = await self.poll(query_device)
 
             except core_exc.NotConnectedError:
@@ -204,7 +585,9 @@ class Monitor:
                 return None
 
             except core_exc.FailedRequestError:
-                self._raise_error("Status update request failed", debug_count=2)
+                self._raise_error(
+                    "Status update request failed", conn_error=True, debug_count=2
+                )
 
             except core_exc.DeviceNotFound:
                 self._raise_error(
@@ -247,13 +630,17 @@ class Monitor:
             except (asyncio.TimeoutError, aiohttp.ServerTimeoutError) as exc:
                 # These are network errors, refresh client is not required
                 self._raise_error(
-                    "Connection to ThinQ failed. Timeout error", exc=exc, debug_count=2
+                    "Connection to ThinQ failed. Timeout error",
+                    conn_error=True,
+                    exc=exc,
+                    debug_count=2,
                 )
 
             except aiohttp.ClientError as exc:
                 # These are network errors, refresh client is not required
                 self._raise_error(
                     "Connection to ThinQ failed. Network connection error",
+                    conn_error=True,
                     exc=exc,
                     debug_count=2,
                 )
@@ -267,37 +654,60 @@ class Monitor:
                 )
 
             else:
-                if not refresh_auth:
-                    self._raise_error(
-                        "Connection to ThinQ not available. Client refresh error",
-                        not_logged=True,
-                    )
+                if not connected:
+                    self._raise_not_connected()
 
                 if state or not retry:
                     break
 
                 _LOGGER.debug("No status available yet")
 
+        self._client.health.report_success()
         self._error_log_count = 0
         if self._has_error:
             _LOGGER.info("Connection is now available - Device: %s", self._device_descr)
             self._has_error = False
         return state
 
+    @property
+    def session(self) -> MonitorSession:
+        """Return the ThinQ1 monitor session."""
+        return self._session
+
+    @property
+    def last_query_age(self) -> float | None:
+        """Return the seconds elapsed from the last ThinQ2 device query."""
+        if self._last_query is None:
+            return None
+        return time.monotonic() - self._last_query
+
+    @property
+    def snapshot_stats(self) -> dict[str, int]:
+        """Return the count of ThinQ2 snapshots by source."""
+        return self._snapshot_stats
+
     async def start(self) -> None:
         """Start monitor for ThinQ1 device."""
         if self._platform_type != PlatformType.THINQ1:
             return
-        if self._work_id:
+        if self._session.is_expired:
+            _LOGGER.debug(
+                "Monitor session expired - Device: %s, Age: %s",
+                self._device_descr,
+                int(self._session.age),
+            )
+            try:
+                await self.stop()
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.debug("Error stopping expired monitor session: %s", exc)
+        if self._session.work_id:
             return
-        self._work_id = await self._client.session.monitor_start(self._device_id)
+        self._session.open(await self._client.session.monitor_start(self._device_id))
 
     async def stop(self) -> None:
         """Stop monitor for ThinQ1 device."""
-        if not self._work_id:
+        if not (work_id := self._session.close()):
             return
-        work_id = self._work_id
-        self._work_id = None
         await self._client.session.monitor_stop(self._device_id, work_id)
 
     async def poll(self, query_device=False) -> tuple[Any | None, bool]:
@@ -315,21 +725,25 @@ class Monitor:
         device is not yet ready.
         """
         await self.start()
-        if not self._work_id:
+        if not (work_id := self._session.work_id):
             return None, True
 
         try:
-            result = await self._client.session.monitor_poll(
-                self._device_id, self._work_id
+            result = await self._client.session.monitor_poll(self._device_id, work_id)
+        except core_exc.MonitorError as exc:
+            # the monitor task failed, a new one is started on next poll
+            _LOGGER.debug(
+                "Monitor session error %s - Device: %s", exc.code, self._device_descr
             )
-        except core_exc.MonitorError:
-            result = None
+            self._session.close()
+            return None, True
         except Exception:
-            self._work_id = None
+            self._session.close()
             raise
 
-        if not result:
-            self._work_id = None
+        # an empty result is returned during warm-up or when data
+        # is not changed, so we keep the session alive
+        self._session.poll_result(bool(result))
 
         return result, True
 
@@ -337,22 +751,27 @@ class Monitor:
         """
         Get the current status data (a json str) or None if the
         device is not yet ready.
+        The dashboard snapshot is used, unless a device query is
+        requested or required for the dashboard snapshot.
         """
         if self._platform_type != PlatformType.THINQ2:
             return None, False
 
         snapshot = None
-        if query_device:
-            result = await self._client.session.get_device_v2_settings(self._device_id)
-            if "snapshot" in result:
-                snapshot = deepcopy(result["snapshot"])
-            return snapshot, False
-
-        await self._client.refresh_devices()
-        if device_data := self._client.get_device(self._device_id):
-            if dev_snapshot := device_data.snapshot:
-                snapshot = deepcopy(dev_snapshot)
-
+        if not query_device:
+            await self._client.refresh_devices()
+            device_data = self._client.get_device(self._device_id)
+            if not (self._query_required and self._query_required(device_data)):
+                self._snapshot_stats["dashboard"] += 1
+                if device_data and (dev_snapshot := device_data.snapshot):
+                    snapshot = deepcopy(dev_snapshot)
+                return snapshot, False
+
+        self._snapshot_stats["query"] += 1
+        self._last_query = time.monotonic()
+        result = await self._client.session.get_device_v2_settings(self._device_id)
+        if "snapshot" in result:
+            snapshot = deepcopy(result["snapshot"])
         return snapshot, False
 
     @staticmethod
@@ -394,6 +813,11 @@ class Device:
     regarding the device.
     """
 
+    # command enabling the ThinQ2 events that provide the listed states,
+    # set in specific device to keep the events enabled with a lease
+    _event_lease_cmd: list | None = None
+    _event_lease_states: list = []
+
     def __init__(
         self,
         client: ClientAsync,
@@ -408,15 +832,24 @@ class Device:
         self._device_info = device_info
         self._status = status
         self._sub_device = sub_device
-        self._model_data = None
         self._model_info: ModelInfo | None = None
-        self._model_lang_pack = None
-        self._product_lang_pack = None
+        # only the text lookups of the language packs are kept
+        self._model_lang_pack: dict[str, str] | None = None
+        self._product_lang_pack: dict[str, str] | None = None
         self._local_lang_pack = None
         self._should_poll = device_info.platform_type == PlatformType.THINQ1
-        self._mon = Monitor(client, device_info)
+        self._poll_stats = PollStats()
+        self._mon = Monitor(
+            client, device_info, self._poll_stats, self._snapshot_query_required
+        )
+        self._query_preferred = False
         self._control_set = 0
-        self._last_additional_poll: datetime | None = None
+        self._command_queue = CommandQueue(self._send_commands)
+        self._optimistic = OptimisticState()
+        self._event_lease = EventLease() if self._event_lease_cmd else None
+        self._query_device_requested = False
+        self._additional_poll_off = False
+        self._additional_poll_init = False
         self._available_features = {}
 
         # attributes for properties
@@ -466,6 +899,20 @@ class Device:
         """Return available features."""
         return self._available_features
 
+    @property
+    def monitor_session(self) -> dict[str, Any] | None:
+        """Return information about the ThinQ1 monitor session."""
+        if not self._should_poll:
+            return None
+        return self._mon.session.as_dict()
+
+    @property
+    def snapshot_stats(self) -> dict[str, int] | None:
+        """Return the count of ThinQ2 snapshots by source."""
+        if self._should_poll:
+            return None
+        return self._mon.snapshot_stats
+
     @property
     def status(self) -> DeviceStatus | None:
         """Return status object associated to the device."""
@@ -478,33 +925,45 @@ class Device:
         self._status = None
         return self._status
 
+    def _apply_status(
+        self, status_cls: type[DeviceStatus], data: dict | None = None, **kwargs
+    ) -> DeviceStatus:
+        """
+        Update the status associated to the device with new raw data.
+        The status object is created once and then updated in place.
+        """
+        if type(self._status) is status_cls:
+            self._status.apply(data, **kwargs)
+        else:
+            self._status = status_cls(self, data, **kwargs)
+        return self._status
+
     async def init_device_info(self) -> bool:
         """Initialize the information for the device"""
 
         if self._model_info is None:
-            if self._model_data is None:
-                self._model_data = await self._client.model_url_info(
-                    self._device_info.model_info_url,
-                    self._device_info,
-                )
-                if self._model_data is None:
-                    return False
+            model_data = await self._client.model_url_info(
+                self._device_info.model_info_url,
+                self._device_info,
+            )
+            if model_data is None:
+                return False
 
             self._model_info = ModelInfo.get_model_info(
-                self._model_data, self._sub_device
+                model_data, self._sub_device, self._load_model_data
             )
             if self._model_info is None:
                 return False
 
         # load model language pack
         if self._model_lang_pack is None:
-            self._model_lang_pack = await self._client.model_url_info(
+            self._model_lang_pack = await self._load_lang_pack(
                 self._device_info.model_lang_pack_url
             )
 
         # load product language pack
         if self._product_lang_pack is None:
-            self._product_lang_pack = await self._client.model_url_info(
+            self._product_lang_pack = await self._load_lang_pack(
                 self._device_info.product_lang_pack_url
             )
 
@@ -514,6 +973,20 @@ class Device:
 
         return True
 
+    async def _load_model_data(self) -> dict | None:
+        """Return the raw model data if still loaded or in the disk cache."""
+        model_store = self._client.model_store
+        url = self._device_info.model_info_url
+        if not url or not (model_data := await model_store.async_get_cached(url)):
+            return None
+        return ModelInfo.device_data(model_data, self._sub_device)
+
+    async def _load_lang_pack(self, url: str) -> dict[str, str] | None:
+        """Load a language pack and return the texts lookup."""
+        if (lang_pack := await self._client.model_url_info(url)) is None:
+            return None
+        return lang_pack.get(LANG_PACK, {})
+
     def _get_state_key(self, key_name):
         """Get the key used for state from an array based on info type."""
         if isinstance(key_name, list):
@@ -579,11 +1052,10 @@ class Device:
         """
         return None
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
+    async def _send_command(self, cmd: DeviceCommand) -> None:
+        """Send a single command to the device."""
         log_level = logging.INFO if self._client.emulation else logging.DEBUG
+        ctrl_key, command, key, value = cmd.ctrl_key, cmd.command, cmd.key, cmd.value
         if full_key := self._prepare_command(ctrl_key, command, key, value):
             _LOGGER.log(
                 log_level,
@@ -591,7 +1063,7 @@ class Device:
                 self._device_info.device_id,
                 str(full_key),
             )
-            await self._set_control(full_key, ctrl_path=ctrl_path)
+            await self._set_control(full_key, ctrl_path=cmd.ctrl_path)
         else:
             _LOGGER.log(
                 log_level,
@@ -603,9 +1075,77 @@ class Device:
                 value,
             )
             await self._set_control(
-                ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
+                ctrl_key,
+                command,
+                key=key,
+                value=value,
+                data=cmd.data,
+                ctrl_path=cmd.ctrl_path,
             )
 
+    async def _send_commands(self, commands: list[DeviceCommand]) -> None:
+        """Send a batch of commands in the order they were queued."""
+        for cmd in commands:
+            await self._send_command(cmd)
+
+    @property
+    def command_queue(self) -> CommandQueue:
+        """Return the device command queue."""
+        return self._command_queue
+
+    @property
+    def optimistic_state(self) -> OptimisticState:
+        """Return the device optimistic state."""
+        return self._optimistic
+
+    @property
+    def event_lease(self) -> EventLease | None:
+        """Return the lease of the enabled device events, if used."""
+        return self._event_lease
+
+    @property
+    def poll_stats(self) -> PollStats:
+        """Return the device status update statistics."""
+        return self._poll_stats
+
+    def request_device_query(self) -> None:
+        """Request a dedicated query for ThinQ2 device on next poll."""
+        self._query_device_requested = True
+
+    def _update_status_optimistic(self, key, value) -> bool:
+        """
+        Update the status with the value expected after a command.
+        The value is confirmed or rolled back by next polls.
+        """
+        if key is None or value is None or not self._status:
+            return False
+        if not (data_key := self._status.get_data_key(key)):
+            return False
+        if not self._status.update_status(key, value):
+            return False
+        self._optimistic.expect(data_key, value)
+        return True
+
+    async def set(
+        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
+    ):
+        """
+        Set a device's control for `key` to `value`.
+        The command is sent at once, or with the others received while a
+        command is in flight, a pending command for same key is replaced.
+        """
+        await self._command_queue.put(
+            DeviceCommand(
+                ctrl_key,
+                command,
+                key=key,
+                value=value,
+                data=data,
+                ctrl_path=ctrl_path,
+            )
+        )
+        self._update_status_optimistic(key, value)
+
     async def _get_config_v2(
         self, ctrl_key, command, *, key=None, value=None, ctrl_path=None
     ):
@@ -670,6 +1210,32 @@ class Device:
             await self._client.session.delete_permission(self._device_info.device_id)
         self._control_set -= 1
 
+    @property
+    def _event_lease_keys(self) -> list[str]:
+        """Return the status keys provided by the enabled events."""
+        keys = [self._get_state_key(state) for state in self._event_lease_states]
+        return [key for key in keys if self.model_info.value_exist(key)]
+
+    async def _renew_event_lease(self):
+        """Enable again the ThinQ2 device events if the lease is due."""
+        # the events are enabled for a limited time, so the command is sent
+        # again only when expiring or when data are not available
+        if not (self._event_lease and self._event_lease.is_due):
+            return
+        # sent without the command queue, it must not be delayed and
+        # it does not change the device status
+        keys = self._get_cmd_keys(self._event_lease_cmd)
+        await self._send_command(
+            DeviceCommand(
+                keys[0],
+                keys[1],
+                key=keys[2],
+                value=str(self._event_lease.duration),
+                ctrl_path="control",
+            )
+        )
+        self._event_lease.renewed()
+
     async def _pre_update_v2(self):
         """
         Call additional methods before data update for v2 API.
@@ -694,42 +1260,88 @@ class Device:
     async def _get_device_snapshot(self, query_device=False):
         """
         Get snapshot for ThinQ2 devices.
-        Perform dedicated device query if query_device is set to true,
-        otherwise use the dashboard result.
+        Use the dashboard result when fresh and complete, otherwise perform
+        a dedicated device query. If query_device is set to true the
+        dashboard result is replaced by the query in a shorter time.
         """
+        # a requested query is not limited by the dashboard refresh rate
+        force_query = self._query_device_requested
+        self._query_device_requested = False
+
         if self._client.emulation:
-            query_device = False
+            query_device = force_query = False
+        self._query_preferred = query_device
 
-        if query_device:
+        if (query_device or force_query) and not self._client.health.is_down:
             try:
+                await self._renew_event_lease()
                 await self._pre_update_v2()
             except Exception as exc:  # pylint: disable=broad-except
                 _LOGGER.debug("Error calling pre_update function: %s", exc)
 
-        return await self._mon.refresh(query_device)
+        return await self._mon.refresh(force_query)
+
+    @property
+    def _snapshot_required_keys(self) -> list[str]:
+        """
+        Return the keys that must be in the dashboard snapshot to use it.
+        Override in specific device to require other keys.
+        """
+        return self._event_lease_keys if self._event_lease else []
+
+    def _snapshot_query_required(self, device_info: DeviceInfo | None) -> bool:
+        """Return True if the dashboard snapshot must be replaced by a device query."""
+        if self._client.emulation or not (device_info and device_info.isonline):
+            return False
+        if not (snapshot := device_info.snapshot):
+            return True
+        if any(key not in snapshot for key in self._snapshot_required_keys):
+            return True
+
+        # devices are queried only when on and the dashboard is stale,
+        # with a shorter max age for the devices that prefer the query
+        if not (self._status and self._status.is_on):
+            return False
+        max_age = SNAPSHOT_MAX_AGE if self._query_preferred else SNAPSHOT_STALE_AGE
+        if (query_age := self._mon.last_query_age) is not None:
+            if query_age < max_age:
+                return False
+        return device_info.snapshot_age > max_age
+
+    @property
+    def _additional_poll_supported(self) -> bool:
+        """
+        Return if the additional poll is supported by the device.
+        Override in specific device to disable the additional poll.
+        """
+        return True
 
     async def _additional_poll(self, poll_interval: int):
         """Perform dedicated additional device poll with a slower rate."""
         if poll_interval <= 0:
             return
-        call_time = datetime.now(timezone.utc)
-        if self._last_additional_poll is None:
-            difference = poll_interval
-        else:
-            difference = (call_time - self._last_additional_poll).total_seconds()
-        if difference < poll_interval:
+        scheduler = self._client.poll_scheduler
+        # the first poll is executed at device setup, because the entities
+        # are created from the features provided by the additional data
+        first_poll = not self._additional_poll_init
+        if not (first_poll or scheduler.is_due(self.unique_id, poll_interval)):
+            return
+        self._additional_poll_init = True
+
+        # when device is off a single poll is enough to get updated values
+        is_on = bool(self._status and self._status.is_on)
+        if not self._additional_poll_supported or (
+            not is_on and self._additional_poll_off
+        ):
+            scheduler.skip(self.unique_id, poll_interval)
             return
-        self._last_additional_poll = call_time
+
+        self._additional_poll_off = not is_on
         if self._should_poll:
-            try:
-                await self._get_device_info()
-            except Exception as exc:  # pylint: disable=broad-except
-                _LOGGER.debug("Error calling additional poll V1 methods: %s", exc)
+            target = self._get_device_info
         else:
-            try:
-                await self._get_device_info_v2()
-            except Exception as exc:  # pylint: disable=broad-except
-                _LOGGER.debug("Error calling additional poll V2 methods: %s", exc)
+            target = self._get_device_info_v2
+        await scheduler.run(self.unique_id, poll_interval, target, force=first_poll)
 
     def _load_emul_v1_payload(self):
         """
@@ -779,26 +1391,29 @@ class Device:
             if not await self.init_device_info():
                 return None
 
+        try:
+            data = await self._fetch_device_data(thinq2_query_device)
+        except Exception:
+            self._poll_stats.update_failed()
+            raise
+        self._poll_stats.update_succeeded()
+        if not data:
+            return None
+
         # ThinQ V2 - Monitor data is with device info
         if not self._should_poll:
-            snapshot = await self._get_device_snapshot(thinq2_query_device)
-            if not snapshot:
-                return None
             # do additional poll
             if additional_poll_interval_v2 > 0:
                 await self._additional_poll(additional_poll_interval_v2)
-            return self._model_info.decode_snapshot(snapshot, snapshot_key)
-
-        # ThinQ V1 - Monitor data must be polled """
-        data = None
-        if self._client.emulation:
-            data = await asyncio.to_thread(self._load_emul_v1_payload)
-        if not data:
-            data = await self._mon.refresh()
-        if not data:
-            return None
-
-        res = self._model_info.decode_monitor(data)
+            with self._poll_stats.measure(STAT_DECODE):
+                res = self._model_info.decode_snapshot(data, snapshot_key)
+            if self._event_lease:
+                self._event_lease.check_data(res, self._event_lease_keys)
+            self._optimistic.reconcile(res)
+            return res
+
+        with self._poll_stats.measure(STAT_DECODE):
+            res = self._model_info.decode_monitor(data)
         # do additional poll
         if res and additional_poll_interval_v1 > 0:
             await self._additional_poll(additional_poll_interval_v1)
@@ -806,8 +1421,24 @@ class Device:
         # remove control permission if previously set
         await self._delete_permission()
 
+        self._optimistic.reconcile(res)
         return res
 
+    async def _fetch_device_data(self, thinq2_query_device=False) -> Any | None:
+        """Fetch the device status data, a snapshot for ThinQ2 devices."""
+        with self._poll_stats.measure(STAT_FETCH):
+            # ThinQ V2 - Monitor data is with device info
+            if not self._should_poll:
+                return await self._get_device_snapshot(thinq2_query_device)
+
+            # ThinQ V1 - Monitor data must be polled
+            data = None
+            if self._client.emulation:
+                data = await asyncio.to_thread(self._load_emul_v1_payload)
+            if not data:
+                data = await self._mon.refresh()
+            return data
+
     async def poll(self) -> DeviceStatus | None:
         """Poll the device's current state."""
         return None
@@ -833,11 +1464,9 @@ class Device:
 
         text_value = LOCAL_LANG_PACK.get(enum_name)
         if not text_value and self._model_lang_pack:
-            if LANG_PACK in self._model_lang_pack:
-                text_value = self._model_lang_pack[LANG_PACK].get(enum_name)
+            text_value = self._model_lang_pack.get(enum_name)
         if not text_value and self._product_lang_pack:
-            if LANG_PACK in self._product_lang_pack:
-                text_value = self._product_lang_pack[LANG_PACK].get(enum_name)
+            text_value = self._product_lang_pack.get(enum_name)
         if not text_value and self._local_lang_pack:
             text_value = self._local_lang_pack.get(enum_name)
         if not text_value:
@@ -854,8 +1483,33 @@ class Device:
         return True
 
 
+def _changed_data_keys(data: dict, other: dict) -> frozenset[str]:
+    """Return the keys with a different value in two raw status data."""
+    return frozenset(
+        key
+        for key in data.keys() | other.keys()
+        if key not in STATUS_VOLATILE_KEYS and data.get(key) != other.get(key)
+    )
+
+
 class DeviceStatus:
-    """A higher-level interface to a specific device status."""
+    """
+    A higher-level interface to a specific device status.
+
+    The status is kept for the device lifetime and updated in place with
+    `apply`, values computed from the raw data are cached until it changes.
+    """
+
+    __slots__ = (
+        "_device",
+        "_data",
+        "_device_features",
+        "_features_updated",
+        "_notified_data",
+        "_notified_features",
+        "_changed_features",
+        "_data_changed",
+    )
 
     def __init__(self, device: Device, data: dict | None = None) -> None:
         """Initialize devicestatus object."""
@@ -863,6 +1517,29 @@ class DeviceStatus:
         self._data = data or {}
         self._device_features: dict[str, Any] = {}
         self._features_updated = False
+        self._notified_data: dict | None = None
+        self._notified_features: dict[str, Any] | None = None
+        self._changed_features: frozenset[str] | None = None
+        self._data_changed = True
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """Override this function to reset the values cached from status data."""
+
+    def apply(self, data: dict | None) -> frozenset[str]:
+        """
+        Update the status in place with new raw data.
+        Return the keys that changed, cached values and features are
+        invalidated only when some key changed.
+        """
+        data = data or {}
+        changed = _changed_data_keys(self._data, data)
+        self._data = data
+        if changed:
+            self._device_features.clear()
+            self._features_updated = False
+            self._reset_cache()
+        return changed
 
     @staticmethod
     def int_or_none(value):
@@ -980,6 +1657,10 @@ class DeviceStatus:
             return key_name[1 if self.is_info_v2 else 0]
         return key_name
 
+    def get_data_key(self, keys: str | list[str]) -> str:
+        """Return the key inside status data if match one of provided keys."""
+        return self._get_data_key(keys)
+
     def _get_data_key(self, keys: str | list[str]) -> str:
         """Return the key inside status data if match one of provided keys."""
         if not self._data:
@@ -1148,3 +1829,49 @@ class DeviceStatus:
             self._update_features()
             self._features_updated = True
         return self._device_features
+
+    @property
+    def changed_features(self) -> frozenset[str] | None:
+        """
+        Return the features changed since the previous status.
+        None means that changes are unknown and all features must be
+        considered changed.
+        """
+        return self._changed_features
+
+    @property
+    def data_changed(self) -> bool:
+        """Return True if the raw status data changed since the previous status."""
+        return self._data_changed
+
+    def update_changes(self, previous: DeviceStatus | None) -> None:
+        """
+        Compute the changes compared to the previous status.
+        If previous is this same status, the changes are computed against
+        the values at the last call, so in place updates are included.
+        """
+        features = self.device_features
+        if previous is self:
+            prev_features = self._notified_features
+            prev_data = self._notified_data
+        elif previous is not None:
+            prev_features = previous.device_features
+            prev_data = previous._data
+        else:
+            prev_features = prev_data = None
+
+        if prev_data is None:
+            self._data_changed = True
+        else:
+            self._data_changed = bool(_changed_data_keys(self._data, prev_data))
+
+        if prev_features is None:
+            self._changed_features = None
+        else:
+            self._changed_features = frozenset(
+                key
+                for key in features.keys() | prev_features.keys()
+                if features.get(key) != prev_features.get(key)
+            )
+        self._notified_data = dict(self._data)
+        self._notified_features = dict(features)
@@ -2,6 +2,7 @@
 
 from enum import Enum
 import logging
+import time
 from typing import Any
 
 from .const import StateOptions
@@ -102,6 +103,19 @@ class DeviceInfo:
         self._device_type = None
         self._platform_type = None
         self._network_type = None
+        self._snapshot_changed = time.monotonic()
+
+    def update_data(self, data: dict[str, Any]) -> bool:
+        """
+        Update in place the device data with the last received data.
+        The values parsed from the data are kept, because they don't change
+        for the same device. Return True if the device snapshot changed.
+        """
+        snapshot_changed = data.get("snapshot") != self._data.get("snapshot")
+        self._data = data
+        if snapshot_changed:
+            self._snapshot_changed = time.monotonic()
+        return snapshot_changed
 
     def as_dict(self):
         """Return the data dictionary"""
@@ -260,3 +274,14 @@ class DeviceInfo:
     def snapshot(self) -> dict[str, Any] | None:
         """Return the snapshot data associated to the device."""
         return self._data.get("snapshot")
+
+    @property
+    def snapshot_age(self) -> float:
+        """
+        Return the age in seconds of the snapshot, from its timestamp if
+        available, otherwise from the last time the snapshot changed.
+        """
+        snapshot = self.snapshot or {}
+        if isinstance(timestamp := snapshot.get("timestamp"), (int, float)):
+            return max(time.time() - timestamp / 1000, 0.0)
+        return time.monotonic() - self._snapshot_changed
@@ -277,6 +277,10 @@ class JetModeSupport(Enum):
 class AirConditionerDevice(Device):
     """A higher-level interface for a AC."""
 
+    # this command is to get power and temp info on V2 device
+    _event_lease_cmd = CMD_ENABLE_EVENT_V2
+    _event_lease_states = [STATE_POWER, STATE_CURRENT_TEMP]
+
     def __init__(
         self,
         client: ClientAsync,
@@ -885,26 +889,18 @@ class AirConditionerDevice(Device):
         keys = self._get_cmd_keys(CMD_RESERVATION_SLEEP_TIME)
         await self.set(keys[0], keys[1], key=keys[2], value=str(value))
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
-        await super().set(
-            ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
-        )
-        if self._status:
-            self._status.update_status(key, value)
-
     def reset_status(self):
         """Reset the device's status"""
-        self._status = AirConditionerStatus(self)
-        return self._status
+        return self._apply_status(AirConditionerStatus)
 
-    async def _pre_update_v2(self):
-        """Call additional methods before data update for v2 API."""
-        # this command is to get power and temp info on V2 device
-        keys = self._get_cmd_keys(CMD_ENABLE_EVENT_V2)
-        await self.set(keys[0], keys[1], key=keys[2], value="70", ctrl_path="control")
+    @property
+    def _additional_poll_supported(self) -> bool:
+        """Return if the additional poll is supported by the device."""
+        if self.is_air_to_water:
+            return False
+        if self._should_poll and self._current_power_supported:
+            return True
+        return self._filter_status_supported
 
     async def _get_device_info(self):
         """
@@ -943,15 +939,14 @@ class AirConditionerDevice(Device):
             if self._current_power is not None:
                 res[STATE_POWER_V1] = self._current_power
 
-        self._status = AirConditionerStatus(self, res)
+        self._apply_status(AirConditionerStatus, res, filter_status=self._filter_status)
         # adjust temperature step
         if self._temperature_step == TEMP_STEP_WHOLE:
             self._adjust_temperature_step(self._status.target_temp)
-        # update filter status
-        if self._filter_status:
-            if not self._status.update_filter_status(self._filter_status):
-                self._filter_status = None
-                self._filter_status_supported = False
+        # disable filter status if not supported
+        if self._filter_status and not self._status.filter_status_updated:
+            self._filter_status = None
+            self._filter_status_supported = False
 
         # manage duct devices, does nothing if not ducted
         try:
@@ -965,16 +960,46 @@ class AirConditionerDevice(Device):
 class AirConditionerStatus(DeviceStatus):
     """Higher-level information about a AC's current status."""
 
+    __slots__ = (
+        "_operation",
+        "_airmon_on",
+        "_filter_use_time_inverted",
+        "_filter_status_updated",
+        "_current_temp",
+    )
+
     _device: AirConditionerDevice
 
-    def __init__(self, device: AirConditionerDevice, data: dict | None = None):
+    def __init__(
+        self,
+        device: AirConditionerDevice,
+        data: dict | None = None,
+        *,
+        filter_status: dict | None = None,
+    ):
         """Initialize device status."""
-        super().__init__(device, data)
+        super().__init__(device)
+        self.apply(data, filter_status=filter_status)
+
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._operation = None
         self._airmon_on = None
-        self._filter_use_time_inverted = True
         self._current_temp = None
 
+    def apply(
+        self, data: dict | None, *, filter_status: dict | None = None
+    ) -> frozenset[str]:
+        """Update the status in place with new raw data."""
+        # filter status is added to the data before the update,
+        # so that it is part of the changed keys check
+        data = data or {}
+        self._filter_use_time_inverted = True
+        self._filter_status_updated = False
+        if filter_status:
+            self._filter_status_updated = self._add_filter_status(data, filter_status)
+        return super().apply(data)
+
     def _str_to_temp(self, str_temp):
         """Convert a string to either an `int` or a `float` temperature."""
         temp = self._str_to_num(str_temp)
@@ -995,12 +1020,17 @@ class AirConditionerStatus(DeviceStatus):
         except ValueError:
             return None
 
-    def update_filter_status(self, values: dict) -> bool:
-        """Update device filter status."""
+    @property
+    def filter_status_updated(self) -> bool:
+        """Return if the filter status was added to the status data."""
+        return self._filter_status_updated
+
+    def _add_filter_status(self, data: dict, values: dict) -> bool:
+        """Add the device filter status to the status data."""
         self._filter_use_time_inverted = False
 
         if not self.is_info_v2:
-            self._data.update(values)
+            data.update(values)
             return True
 
         # ACv2 could return filter value in the payload
@@ -1008,13 +1038,13 @@ class AirConditionerStatus(DeviceStatus):
         updated = False
         for filters in FILTER_TYPES:
             max_key = self._get_state_key(filters[2])  # this is the max_time key
-            cur_val = self.to_int_or_none(self._data.get(max_key, 0))
+            cur_val = self.to_int_or_none(data.get(max_key, 0))
             if cur_val:
                 continue
             for index in range(1, 3):
                 upd_key = self._get_state_key(filters[index])
                 if upd_key in values:
-                    self._data[upd_key] = values[upd_key]
+                    data[upd_key] = values[upd_key]
                     updated = True
 
         # for models that return use_time directly in the payload,
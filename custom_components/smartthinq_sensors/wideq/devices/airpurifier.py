@@ -174,19 +174,8 @@ class AirPurifierDevice(Device):
         )
         await self.set(keys[0], keys[1], key=keys[2], value=speed_value)
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
-        await super().set(
-            ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
-        )
-        if key is not None and self._status:
-            self._status.update_status(key, value)
-
     def reset_status(self):
-        self._status = AirPurifierStatus(self)
-        return self._status
+        return self._apply_status(AirPurifierStatus)
 
     async def poll(self) -> AirPurifierStatus | None:
         """Poll the device's current state."""
@@ -195,18 +184,18 @@ class AirPurifierDevice(Device):
         if not res:
             return None
 
-        self._status = AirPurifierStatus(self, res)
-        return self._status
+        return self._apply_status(AirPurifierStatus, res)
 
 
 class AirPurifierStatus(DeviceStatus):
     """Higher-level information about a Air Purifier's current status."""
 
+    __slots__ = ("_operation",)
+
     _device: AirPurifierDevice
 
-    def __init__(self, device: AirPurifierDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._operation = None
 
     def _get_operation(self):
@@ -128,7 +128,7 @@ class DeHumidifierDevice(Device):
             # different power command for ThinQ1 devices
             cmd = "Start" if turn_on else "Stop"
             await self.set(keys[0], keys[2], key=None, value=cmd)
-            self._status.update_status(keys[2], op_value)
+            self._update_status_optimistic(keys[2], op_value)
             return
         await self.set(keys[0], keys[1], key=keys[2], value=op_value)
 
@@ -172,19 +172,8 @@ class DeHumidifierDevice(Device):
             self._current_power_supported = False
             return 0
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
-        await super().set(
-            ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
-        )
-        if key is not None and self._status:
-            self._status.update_status(key, value)
-
     def reset_status(self):
-        self._status = DeHumidifierStatus(self)
-        return self._status
+        return self._apply_status(DeHumidifierStatus)
 
     # async def _get_device_info(self):
     #    """Call additional method to get device information for API v1.
@@ -213,19 +202,18 @@ class DeHumidifierDevice(Device):
         # if self._should_poll:
         #     res[AC_STATE_POWER_V1] = self._current_power
 
-        self._status = DeHumidifierStatus(self, res)
-
-        return self._status
+        return self._apply_status(DeHumidifierStatus, res)
 
 
 class DeHumidifierStatus(DeviceStatus):
     """Higher-level information about a DeHumidifier's current status."""
 
+    __slots__ = ("_operation",)
+
     _device: DeHumidifierDevice
 
-    def __init__(self, device: DeHumidifierDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._operation = None
 
     def _get_operation(self):
@@ -50,8 +50,7 @@ class DishWasherDevice(Device):
         return self._status.is_run_completed if self._status else False
 
     def reset_status(self):
-        self._status = DishWasherStatus(self)
-        return self._status
+        return self._apply_status(DishWasherStatus)
 
     async def poll(self) -> DishWasherStatus | None:
         """Poll the device's current state."""
@@ -60,8 +59,7 @@ class DishWasherDevice(Device):
         if not res:
             return None
 
-        self._status = DishWasherStatus(self, res)
-        return self._status
+        return self._apply_status(DishWasherStatus, res)
 
 
 class DishWasherStatus(DeviceStatus):
@@ -72,11 +70,12 @@ class DishWasherStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ("_run_state", "_process", "_error")
+
     _device: DishWasherDevice
 
-    def __init__(self, device: DishWasherDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._run_state = None
         self._process = None
         self._error = None
@@ -78,7 +78,7 @@ class FanDevice(Device):
             # different power command for ThinQ1 devices
             cmd = "Start" if turn_on else "Stop"
             await self.set(keys[0], keys[2], key=None, value=cmd)
-            self._status.update_status(keys[2], op_value)
+            self._update_status_optimistic(keys[2], op_value)
             return
         await self.set(keys[0], keys[1], key=keys[2], value=op_value)
 
@@ -96,19 +96,8 @@ class FanDevice(Device):
 
         raise ValueError(f"Invalid fan preset: {preset}")
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
-        await super().set(
-            ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
-        )
-        if key is not None and self._status:
-            self._status.update_status(key, value)
-
     def reset_status(self):
-        self._status = FanStatus(self)
-        return self._status
+        return self._apply_status(FanStatus)
 
     async def poll(self) -> FanStatus | None:
         """Poll the device's current state."""
@@ -117,19 +106,18 @@ class FanDevice(Device):
         if not res:
             return None
 
-        self._status = FanStatus(self, res)
-
-        return self._status
+        return self._apply_status(FanStatus, res)
 
 
 class FanStatus(DeviceStatus):
     """Higher-level information about a Fan's current status."""
 
+    __slots__ = ("_operation",)
+
     _device: FanDevice
 
-    def __init__(self, device: FanDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._operation = None
 
     def _get_operation(self):
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from enum import Enum
 
 from ..backports.functools import cached_property
@@ -81,8 +80,7 @@ class HoodDevice(Device):
         super().__init__(client, device_info, HoodStatus(self))
 
     def reset_status(self):
-        self._status = HoodStatus(self)
-        return self._status
+        return self._apply_status(HoodStatus)
 
     # Settings
     def _prepare_command_ventlamp_v1(self, command):
@@ -143,11 +141,15 @@ class HoodDevice(Device):
         else:
             full_cmd = {}
 
-        cmd = deepcopy(cmd_key)
-        def_cmd = cmd[KEY_DATASET].get(KEY_HOODSTATE, {})
-        cmd[KEY_DATASET][KEY_HOODSTATE] = {**def_cmd, **full_cmd, **command}
-
-        return cmd
+        data_set = cmd_key[KEY_DATASET]
+        def_cmd = data_set.get(KEY_HOODSTATE, {})
+        return {
+            **cmd_key,
+            KEY_DATASET: {
+                **data_set,
+                KEY_HOODSTATE: {**def_cmd, **full_cmd, **command},
+            },
+        }
 
     # Light
     @cached_property
@@ -204,8 +206,7 @@ class HoodDevice(Device):
     async def set_val(self, ctrl_key, command, key=None, value=None):
         """Set a device's control for hood and update status."""
         await self.set(ctrl_key, command)
-        if self._status and key is not None:
-            self._status.update_status(key, value)
+        self._update_status_optimistic(key, value)
 
     async def poll(self) -> HoodStatus | None:
         """Poll the device's current state."""
@@ -213,8 +214,7 @@ class HoodDevice(Device):
         if not res:
             return None
 
-        self._status = HoodStatus(self, res)
-        return self._status
+        return self._apply_status(HoodStatus, res)
 
 
 class HoodStatus(DeviceStatus):
@@ -225,6 +225,8 @@ class HoodStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ()
+
     _device: HoodDevice
 
     @property
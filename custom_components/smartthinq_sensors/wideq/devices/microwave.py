@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from datetime import datetime, time
 from enum import Enum
 
@@ -128,8 +127,7 @@ class MicroWaveDevice(Device):
         super().__init__(client, device_info, MicroWaveStatus(self))
 
     def reset_status(self):
-        self._status = MicroWaveStatus(self)
-        return self._status
+        return self._apply_status(MicroWaveStatus)
 
     # Settings
     def _prepare_command_ventlamp(self):
@@ -163,11 +161,15 @@ class MicroWaveDevice(Device):
         else:
             full_cmd = {}
 
-        cmd = deepcopy(cmd_key)
-        def_cmd = cmd[KEY_DATASET].get(KEY_OVENSTATE, {})
-        cmd[KEY_DATASET][KEY_OVENSTATE] = {**def_cmd, **full_cmd, **command}
-
-        return cmd
+        data_set = cmd_key[KEY_DATASET]
+        def_cmd = data_set.get(KEY_OVENSTATE, {})
+        return {
+            **cmd_key,
+            KEY_DATASET: {
+                **data_set,
+                KEY_OVENSTATE: {**def_cmd, **full_cmd, **command},
+            },
+        }
 
     # Clock
     async def set_clock_display(self, turn_on: bool):
@@ -279,8 +281,7 @@ class MicroWaveDevice(Device):
     async def set_val(self, ctrl_key, command, key=None, value=None):
         """Set a device's control for microwave and update status."""
         await self.set(ctrl_key, command)
-        if self._status and key is not None:
-            self._status.update_status(key, value)
+        self._update_status_optimistic(key, value)
 
     async def poll(self) -> MicroWaveStatus | None:
         """Poll the device's current state."""
@@ -288,8 +289,7 @@ class MicroWaveDevice(Device):
         if not res:
             return None
 
-        self._status = MicroWaveStatus(self, res)
-        return self._status
+        return self._apply_status(MicroWaveStatus, res)
 
 
 class MicroWaveStatus(DeviceStatus):
@@ -300,11 +300,12 @@ class MicroWaveStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ("_oven_temp_unit",)
+
     _device: MicroWaveDevice
 
-    def __init__(self, device: MicroWaveDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._oven_temp_unit = None
 
     @property
@@ -24,8 +24,7 @@ class RangeDevice(Device):
         super().__init__(client, device_info, RangeStatus(self))
 
     def reset_status(self):
-        self._status = RangeStatus(self)
-        return self._status
+        return self._apply_status(RangeStatus)
 
     async def poll(self) -> RangeStatus | None:
         """Poll the device's current state."""
@@ -34,8 +33,7 @@ class RangeDevice(Device):
         if not res:
             return None
 
-        self._status = RangeStatus(self, res)
-        return self._status
+        return self._apply_status(RangeStatus, res)
 
 
 class RangeStatus(DeviceStatus):
@@ -46,11 +44,12 @@ class RangeStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ("_oven_temp_unit", "_oven_target_temps")
+
     _device: RangeDevice
 
-    def __init__(self, device: RangeDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._oven_temp_unit = None
         self._oven_target_temps: list | None = None
 
@@ -10,7 +10,7 @@ from ..const import RefrigeratorFeatures, StateOptions, TemperatureUnit
 from ..core_async import ClientAsync
 from ..device import LABEL_BIT_OFF, LABEL_BIT_ON, Device, DeviceStatus
 from ..device_info import DeviceInfo
-from ..model_info import TYPE_ENUM
+from ..model_info import TYPE_ENUM, ControlTemplate
 
 FEATURE_DESCR = {
     "@RE_TERM_EXPRESS_FREEZE_W": "express_freeze",
@@ -102,52 +102,51 @@ class RefrigeratorDevice(Device):
             return feature_name
         return FEATURE_DESCR.get(title_value, feature_name)
 
-    def _prepare_command_v1(self, cmd, key, value):
+    def _prepare_command_v1(self, template: ControlTemplate, ctrl_key, key, value):
         """Prepare command for specific ThinQ1 device."""
         data_key = "value"
-        if cmd.get(data_key, "") == "ControlData":
+        if template.get(data_key, "") == "ControlData":
             data_key = "data"
-        str_data = cmd.get(data_key)
 
-        if str_data:
+        fields = {}
+        if template.data is not None:
+            fields["data"] = template.data
+        if template.get(data_key):
             status_data = self._status.as_dict
-            for dt_key, dt_value in status_data.items():
-                if dt_key == key:
-                    dt_value = value
-                str_data = str_data.replace(f"{{{{{dt_key}}}}}", dt_value)
-
-            json_data = json.loads(str_data)
+            if key in status_data:
+                status_data[key] = value
+            json_data = json.loads(template.fill(data_key, status_data))
             _LOGGER.debug("Command data content: %s", str(json_data))
             if self.model_info.binary_control_data:
-                cmd["format"] = "B64"
+                fields["format"] = "B64"
                 json_data = base64.b64encode(bytes(json_data)).decode("ascii")
-            cmd[data_key] = json_data
+            fields[data_key] = json_data
 
-        return cmd
+        return template.payload(ctrl_key, **fields)
 
-    def _prepare_command_v2(self, cmd, key, value):
+    def _prepare_command_v2(self, template: ControlTemplate, ctrl_key, key, value):
         """Prepare command for specific ThinQ2 device."""
-        data_set = cmd.pop("data", None)
-        if not data_set:
+        if not (data_set := template.data):
             data_set = {REFR_ROOT_DATA: {key: value}}
         else:
-            for cmd_key in data_set[REFR_ROOT_DATA].keys():
-                data_set[REFR_ROOT_DATA][cmd_key] = (
-                    value if cmd_key == key else "IGNORE"
-                )
-        cmd["dataSetList"] = data_set
+            data_set = {
+                **data_set,
+                REFR_ROOT_DATA: {
+                    cmd_key: value if cmd_key == key else "IGNORE"
+                    for cmd_key in data_set[REFR_ROOT_DATA]
+                },
+            }
 
-        return cmd
+        return template.payload(ctrl_key, dataSetList=data_set)
 
     def _prepare_command(self, ctrl_key, command, key, value):
         """Prepare command for specific device."""
-        cmd = self.model_info.get_control_cmd(command, ctrl_key)
-        if not cmd:
+        if not (template := self.model_info.control_template(command)):
             return None
 
         if self.model_info.is_info_v2:
-            return self._prepare_command_v2(cmd, key, value)
-        return self._prepare_command_v1(cmd, key, value)
+            return self._prepare_command_v2(template, ctrl_key, key, value)
+        return self._prepare_command_v1(template, ctrl_key, key, value)
 
     def _set_temp_unit(self, unit=None):
         """Set the configured temperature unit."""
@@ -357,8 +356,7 @@ class RefrigeratorDevice(Device):
         self._status.update_status_feat(status_key, temp_key, False)
 
     def reset_status(self):
-        self._status = RefrigeratorStatus(self)
-        return self._status
+        return self._apply_status(RefrigeratorStatus)
 
     async def poll(self) -> RefrigeratorStatus | None:
         """Poll the device's current state."""
@@ -367,8 +365,7 @@ class RefrigeratorDevice(Device):
         if not res:
             return None
 
-        self._status = RefrigeratorStatus(self, res)
-        return self._status
+        return self._apply_status(RefrigeratorStatus, res)
 
 
 class RefrigeratorStatus(DeviceStatus):
@@ -379,11 +376,12 @@ class RefrigeratorStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ("_temp_unit", "_eco_friendly_state", "_sabbath_state")
+
     _device: RefrigeratorDevice
 
-    def __init__(self, device: RefrigeratorDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._temp_unit = None
         self._eco_friendly_state = None
         self._sabbath_state = None
@@ -36,8 +36,7 @@ class StylerDevice(Device):
         return self._status.is_run_completed if self._status else False
 
     def reset_status(self):
-        self._status = StylerStatus(self)
-        return self._status
+        return self._apply_status(StylerStatus)
 
     async def poll(self) -> StylerStatus | None:
         """Poll the device's current state."""
@@ -46,8 +45,7 @@ class StylerDevice(Device):
         if not res:
             return None
 
-        self._status = StylerStatus(self, res)
-        return self._status
+        return self._apply_status(StylerStatus, res)
 
 
 class StylerStatus(DeviceStatus):
@@ -58,11 +56,12 @@ class StylerStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = ("_run_state", "_pre_state", "_error")
+
     _device: StylerDevice
 
-    def __init__(self, device: StylerDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._run_state = None
         self._pre_state = None
         self._error = None
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import base64
-from copy import deepcopy
 from enum import IntEnum
 import json
 import logging
@@ -14,6 +13,7 @@ from ..core_async import ClientAsync
 from ..core_exceptions import InvalidDeviceStatus
 from ..device import Device, DeviceStatus
 from ..device_info import DeviceInfo, DeviceType
+from ..model_info import ControlTemplate
 
 STATE_WM_POWER_OFF = "STATE_POWER_OFF"
 STATE_WM_INITIAL = "STATE_INITIAL"
@@ -41,13 +41,13 @@ CMD_REMOTE_START = [
     ["Start", "WMStart"],
 ]
 
+VT_CTRL_KEY = "vtCtrl"
 VT_CTRL_CMD = {
     "WMOff": {"cmd": "power", "type": "ABSOLUTE", "value": "POWER_OFF"},
     "WMWakeup": {"cmd": "power", "type": "ABSOLUTE", "value": "POWER_ON"},
     "WMStop": {"cmd": "wmControl", "type": "ABSOLUTE", "value": "PAUSE"},
     "WMStart": {"cmd": "wmControl", "type": "ABSOLUTE", "value": "START"},
 }
-VT_CTRL_COURSE_INFO = "vt_ctrl_course_info"
 
 BIT_FEATURES = {
     WashDeviceFeatures.ANTICREASE: ["AntiCrease", "antiCrease"],
@@ -97,6 +97,64 @@ _COURSE_TYPE = "courseType"
 _CURRENT_COURSE = "Current course"
 
 
+def _set_opt_bit(opt_val: str, bit_mask: int, bit_on: bool) -> str:
+    """Return the option value with a bit set or cleared."""
+    option_val = int(opt_val)
+    if bit_on:
+        return str(option_val | bit_mask)
+    return str(option_val & ~bit_mask)
+
+
+class CourseTemplate:
+    """
+    The command data of a course, precomputed from the model info.
+
+    `values` are the course keys set by the course, `functions` the course
+    function defaults and `bit_functions` the functions that for ThinQ1
+    devices update a bit of an option key, with the option key and bit mask.
+    """
+
+    __slots__ = ("values", "pop_keys", "functions", "bit_functions", "vt_functions")
+
+    def __init__(
+        self,
+        values: dict,
+        pop_keys: tuple[str, ...],
+        functions: tuple[tuple[str, str], ...],
+        bit_functions: tuple[tuple[str, int, bool], ...],
+        vt_functions: tuple[tuple[str, str | None], ...],
+    ) -> None:
+        """Initialize the template."""
+        self.values = values
+        self.pop_keys = pop_keys
+        self.functions = functions
+        self.bit_functions = bit_functions
+        self.vt_functions = vt_functions
+
+    def apply(self, data: dict, option_keys: list[str], course_set: bool) -> dict:
+        """
+        Return the course data to run the command, based on status data.
+        If course_set is True the course is the one in the status data and
+        only the missing function values are added.
+        """
+        ret_data = dict(data)
+        for opt_name in option_keys:
+            ret_data[opt_name] = data.get(opt_name, "0")
+        ret_data.update(self.values)
+        for key in self.pop_keys:
+            ret_data.pop(key, None)
+
+        if not course_set:
+            for opt_name, bit_mask, bit_on in self.bit_functions:
+                ret_data[opt_name] = _set_opt_bit(ret_data[opt_name], bit_mask, bit_on)
+        for ckey, cdata in self.functions:
+            if course_set and ckey in ret_data:
+                continue
+            ret_data[ckey] = cdata
+
+        return ret_data
+
+
 class WMDevice(Device):
     """A higher-level interface for washer and dryer."""
 
@@ -124,6 +182,10 @@ class WMDevice(Device):
         self._is_run_completed = False
         self._course_keys: dict[CourseType, str | None] | None = None
         self._course_infos: dict[str, str] | None = None
+        self._course_templates: dict[CourseType, dict] | None = None
+        self._default_course_id: str | None = None
+        self._option_keys: list[str] = []
+        self._initial_bits: dict[str, int] = {}
         self._selected_course: str | None = None
         self._is_cycle_finishing = False
         self._stand_by = False
@@ -218,6 +280,7 @@ class WMDevice(Device):
     async def init_device_info(self) -> bool:
         """Initialize the information for the device"""
         if result := await super().init_device_info():
+            self._init_course_templates()
             self._init_subkey_device()
         return result
 
@@ -282,18 +345,14 @@ class WMDevice(Device):
         if self._status and value:
             self._status.update_status(key, value)
 
-    def _update_opt_bit(self, opt_name: str, opt_val: str, bit_name: str, bit_val: int):
-        """Update the option bit with correct value."""
+    def _get_opt_bit(self, bit_name: str) -> tuple[str, int] | None:
+        """Return the option key and the bit mask for a bit name."""
         if self.model_info.is_info_v2:
             return None
 
-        option_val = int(opt_val)
-        if (bit_index := self.model_info.bit_index(opt_name, bit_name)) is not None:
-            if bit_val:
-                new_val = option_val | (2**bit_index)
-            else:
-                new_val = option_val ^ (option_val & (2**bit_index))
-            return str(new_val)
+        for opt_name in self._option_keys:
+            if (bit_index := self.model_info.bit_index(opt_name, bit_name)) is not None:
+                return opt_name, 2**bit_index
 
         return None
 
@@ -322,112 +381,127 @@ class WMDevice(Device):
             self._course_keys = {key: self._get_course_key(key) for key in _COURSE_KEYS}
         return self._course_keys[course_type]
 
-    def _get_course_infos(self) -> dict:
-        """Return a dict with available courses."""
-        if self._course_infos is not None:
-            return self._course_infos
-
-        if not (course_key := self.get_course_key(CourseType.COURSE)):
-            self._course_infos = {}
-            return {}
-        if not (course_infos := self.model_info.reference_values(course_key)):
-            self._course_infos = {}
-            return {}
-
-        ret_val = {}
-        for key, value in course_infos.items():
-            if enum_name := value.get("name"):
-                name = self.get_enum_text(enum_name)
-                if name == enum_name:
-                    name = value.get("_comment", enum_name)
-            else:
-                name = value.get("_comment", key)
-            ret_val[name] = key
-
-        self._course_infos = ret_val
-        return ret_val
-
-    def _get_course_details(self, course_key, course_id):
-        """Get definition for a specific course ID."""
-        if course_key is None:
-            return None
-        if courses := self.model_info.reference_values(course_key):
-            return courses.get(course_id)
-        return None
-
-    def _prepare_course_info(
-        self,
-        data: dict,
-        course_id: str,
-        course_info: dict,
-        course_type: CourseType,
-        course_set: bool,
-        n_course_key: str,
-        s_course_key: str | None,
-    ) -> dict:
-        """Prepare the course info used to run the command."""
-
-        ret_data = deepcopy(data)
-
-        # Prepare the course data initializing option for infoV1 device
-        option_keys = self.model_info.option_keys(self._sub_key)
-        if not self.model_info.is_info_v2:
-            for opt_name in option_keys:
-                ret_data[opt_name] = data.get(opt_name, "0")
+    def _build_course_template(
+        self, course_type: CourseType, course_id: str, course_info: dict
+    ) -> CourseTemplate:
+        """Build the command template for a specific course."""
+        is_info_v2 = self.model_info.is_info_v2
+        n_course_key = self.get_course_key(CourseType.COURSE)
+        s_course_key = self.get_course_key(CourseType.SMARTCOURSE)
 
+        values = {}
+        pop_keys = []
         if _COURSE_TYPE in course_info:
-            ret_data[_COURSE_TYPE] = course_info[_COURSE_TYPE]
+            values[_COURSE_TYPE] = course_info[_COURSE_TYPE]
 
         if course_type == CourseType.COURSE:
-            ret_data[n_course_key] = course_id
+            values[n_course_key] = course_id
             if s_course_key:
-                ret_data[s_course_key] = 0
-        elif course_type == CourseType.SMARTCOURSE:
-            ret_data[n_course_key] = 0
-            ret_data[s_course_key] = course_id
-            for key in ["Course", "APCourse"]:
-                if key in course_info:
-                    ret_data[n_course_key] = course_info[key]
-                    break
+                values[s_course_key] = 0
+        else:
+            if n_course_key:
+                values[n_course_key] = 0
+                for key in ["Course", "APCourse"]:
+                    if key in course_info:
+                        values[n_course_key] = course_info[key]
+                        break
+            values[s_course_key] = course_id
 
         if op_course_key := self.get_course_key(CourseType.OPCOURSE):
-            ref_opcourse_key = (
-                "OpCourse" if self.model_info.is_info_v2 else op_course_key
-            )
+            ref_opcourse_key = "OpCourse" if is_info_v2 else op_course_key
             if ref_opcourse_key in course_info:
-                ret_data[op_course_key] = course_info[ref_opcourse_key]
-            elif self.model_info.is_info_v2:
-                ret_data.pop(op_course_key, None)
-
-        for func_key in course_info["function"]:
-            ckey = func_key.get("value")
+                values[op_course_key] = course_info[ref_opcourse_key]
+            elif is_info_v2:
+                pop_keys.append(op_course_key)
+
+        functions = []
+        bit_functions = []
+        vt_functions = []
+        for func_key in course_info.get("function", []):
+            if not (ckey := func_key.get("value")):
+                continue
             cdata = func_key.get("default")
-            if not ckey or cdata is None:
+            vt_functions.append((ckey, cdata))
+            if cdata is None:
                 continue
-            opt_set = False
-            for opt_name in option_keys:
-                if opt_name not in ret_data:
-                    continue
-                opt_val = ret_data[opt_name]
-                new_val = self._update_opt_bit(opt_name, opt_val, ckey, int(cdata))
-                if new_val is not None:
-                    opt_set = True
-                    if not course_set:
-                        ret_data[opt_name] = new_val
-                    break
-            if opt_set or (course_set and ckey in ret_data):
+            if opt_bit := self._get_opt_bit(ckey):
+                bit_functions.append((*opt_bit, bool(int(cdata))))
+            else:
+                functions.append((ckey, cdata))
+
+        return CourseTemplate(
+            values,
+            tuple(pop_keys),
+            tuple(functions),
+            tuple(bit_functions),
+            tuple(vt_functions),
+        )
+
+    def _init_course_templates(self) -> None:
+        """
+        Build the index with the command templates of the available courses
+        and the names of the courses that can be selected.
+        """
+        if self._course_templates is not None or not self.model_info:
+            return
+
+        self._option_keys = self.model_info.option_keys(self._sub_key)
+        self._initial_bits = {}
+        if not self.model_info.is_info_v2:
+            for opt_name in self._option_keys:
+                bit_index = self.model_info.bit_index(opt_name, "InitialBit")
+                if bit_index is not None:
+                    self._initial_bits[opt_name] = 2**bit_index
+
+        if self.model_info.is_info_v2:
+            self._default_course_id = self.model_info.config_value(
+                f"default{self._getcmdkey('Course')}"
+            )
+        else:
+            self._default_course_id = str(
+                self.model_info.config_value("defaultCourseId")
+            )
+
+        templates = {}
+        course_infos = {}
+        for course_type in [CourseType.COURSE, CourseType.SMARTCOURSE]:
+            templates[course_type] = {}
+            if not (course_key := self.get_course_key(course_type)):
                 continue
-            ret_data[ckey] = cdata
+            if not (courses := self.model_info.reference_values(course_key)):
+                continue
+            for course_id, course_info in courses.items():
+                templates[course_type][course_id] = self._build_course_template(
+                    course_type, course_id, course_info
+                )
+                if course_type != CourseType.COURSE:
+                    continue
+                if enum_name := course_info.get("name"):
+                    name = self.get_enum_text(enum_name)
+                    if name == enum_name:
+                        name = course_info.get("_comment", enum_name)
+                else:
+                    name = course_info.get("_comment", course_id)
+                course_infos[name] = course_id
 
-        if not course_set:
-            ret_data[VT_CTRL_COURSE_INFO] = course_info
+        self._course_templates = templates
+        self._course_infos = course_infos
 
-        _LOGGER.debug("Prepared course data: %s", ret_data)
-        return ret_data
+    def _get_course_templates(self) -> dict[CourseType, dict[str, CourseTemplate]]:
+        """Return the command templates of the available courses."""
+        if self._course_templates is None:
+            self._init_course_templates()
+        return self._course_templates or {}
 
-    def _update_course_info(self) -> dict:
+    def _get_course_infos(self) -> dict:
+        """Return a dict with available courses."""
+        if self._course_infos is None:
+            self._init_course_templates()
+        return self._course_infos or {}
+
+    def _get_start_course(self) -> tuple[dict, CourseTemplate, bool]:
         """
-        Save information in the data payload for a specific course
+        Return the status data and the template for a specific course
         or default course if not already available.
         """
         data = None
@@ -440,108 +514,91 @@ class WMDevice(Device):
         if not data:
             raise ValueError("Course info not available")
 
-        course_type = CourseType.COURSE
-        n_course_key = self.get_course_key(CourseType.COURSE)
-        s_course_key = self.get_course_key(CourseType.SMARTCOURSE)
-        if self.model_info.is_info_v2:
-            def_course_id = self.model_info.config_value(
-                f"default{self._getcmdkey('Course')}"
-            )
-        else:
-            def_course_id = str(self.model_info.config_value("defaultCourseId"))
+        templates = self._get_course_templates()
+        if not (course_templates := templates.get(CourseType.COURSE)):
+            raise ValueError("Course info not available")
 
-        # Search valid course Info
+        # Search valid course template
         if self._selected_course:
             course_id = self._get_course_infos().get(self._selected_course)
         else:
             course_id = None
-        course_info = None
+        template = None
         course_set = False
         if course_id is None:
             # check if this course is defined in data payload
-            for course_key in [n_course_key, s_course_key]:
-                if not course_key:
+            for course_type in [CourseType.COURSE, CourseType.SMARTCOURSE]:
+                if not (course_key := self.get_course_key(course_type)):
                     continue
                 course_id = str(data.get(course_key))
-                if course_info := self._get_course_details(course_key, course_id):
-                    if course_key == s_course_key:
-                        course_type = CourseType.SMARTCOURSE
+                if template := templates[course_type].get(course_id):
                     course_set = True
                     break
         else:
-            course_info = self._get_course_details(n_course_key, course_id)
+            template = course_templates.get(course_id)
 
-        if not course_info:
-            course_id = def_course_id
-            course_info = self._get_course_details(n_course_key, course_id)
+        if not template:
+            template = course_templates.get(self._default_course_id)
 
-        if not course_info:
+        if not template:
             raise ValueError("Course info not available")
 
-        # Save information for specific or default course
-        return self._prepare_course_info(
-            data,
-            course_id,
-            course_info,
-            course_type,
-            course_set,
-            n_course_key,
-            s_course_key,
-        )
+        return data, template, course_set
+
+    def _update_course_info(self) -> dict:
+        """
+        Save information in the data payload for a specific course
+        or default course if not already available.
+        """
+        data, template, course_set = self._get_start_course()
+        ret_data = template.apply(data, self._option_keys, course_set)
+        _LOGGER.debug("Prepared course data: %s", ret_data)
+        return ret_data
 
     def _prepare_vtctrl_course_info(self) -> list:
         """Prepare course info for vtctrl command."""
+        data, template, course_set = self._get_start_course()
+        if course_set:
+            return []
+
         vt_cmd_data = []
-        course_data = self._update_course_info()
-        if course_info := course_data.get(VT_CTRL_COURSE_INFO):
-            for func_key in course_info["function"]:
-                ckey = func_key.get("value")
-                defdata = func_key.get("default")
-                cdata = course_data.get(ckey, defdata)
-                if not ckey or cdata is None:
-                    continue
-                vt_cmd_data.append(
-                    {"cmd": ckey, "type": "ABSOLUTE", "value": str(cdata)}
-                )
+        course_data = template.apply(data, self._option_keys, course_set)
+        for ckey, defdata in template.vt_functions:
+            if (cdata := course_data.get(ckey, defdata)) is None:
+                continue
+            vt_cmd_data.append({"cmd": ckey, "type": "ABSOLUTE", "value": str(cdata)})
 
         return vt_cmd_data
 
-    def _prepare_command_v1(self, cmd, key):
+    def _prepare_command_v1(self, template: ControlTemplate, ctrl_key, key):
         """Prepare command for specific ThinQ1 device."""
-        encode = cmd.pop("encode", False)
-
+        fields = {}
         str_data = ""
-        if "data" in cmd:
-            str_data = cmd["data"]
-            option_keys = self.model_info.option_keys(self._sub_key)
+        if template.data is not None:
             status_data = self._update_course_info()
 
-            for dt_key, dt_value in status_data.items():
-                repl_key = f"{{{{{dt_key}}}}}"
-                if repl_key not in str_data:
-                    continue
-                # for start command we set initial bit to 1
-                if key and key == "Start" and dt_key in option_keys:
-                    bit_val = 1 if self._initial_bit_start else 0
-                    new_value = self._update_opt_bit(
-                        dt_key, dt_value, "InitialBit", bit_val
-                    )
-                    if new_value is not None:
-                        dt_value = new_value
-                str_data = str_data.replace(repl_key, str(dt_value))
+            # for start command we set initial bit to 1
+            if key == "Start":
+                for opt_name, bit_mask in self._initial_bits.items():
+                    if opt_name in status_data:
+                        status_data[opt_name] = _set_opt_bit(
+                            status_data[opt_name], bit_mask, self._initial_bit_start
+                        )
+            str_data = template.fill("data", status_data)
             _LOGGER.debug("Command data content: %s", str_data)
-            if encode:
-                cmd["format"] = "B64"
+            if template.get("encode", False):
+                fields["format"] = "B64"
                 str_list = json.loads(str_data)
                 str_data = base64.b64encode(bytes(str_list)).decode("ascii")
 
-        return {**cmd, "data": str_data}
+        cmd = template.payload(ctrl_key, **fields, data=str_data)
+        cmd.pop("encode", None)
+        return cmd
 
-    def _prepare_command_v2(self, cmd, key: str):
+    def _prepare_command_v2(self, template: ControlTemplate, ctrl_key, key: str):
         """Prepare command for specific ThinQ2 device."""
-        data_set = cmd.pop("data", None)
-        if not data_set:
-            return cmd
+        if not (data_set := template.data):
+            return template.payload(ctrl_key)
 
         res_data_set = None
         if key and "WMStart" in key and WM_ROOT_DATA in data_set:
@@ -582,19 +639,18 @@ class WMDevice(Device):
                     cmd_data_set[cmd_key] = status_data.get(cmd_key, cmd_value)
             res_data_set = {WM_ROOT_DATA: cmd_data_set}
 
-        return {
-            **cmd,
-            "dataKey": None,
-            "dataValue": None,
-            "dataSetList": res_data_set or data_set,
-            "dataGetList": None,
-        }
+        return template.payload(
+            ctrl_key,
+            dataKey=None,
+            dataValue=None,
+            dataSetList=res_data_set or data_set,
+            dataGetList=None,
+        )
 
-    def _prepare_command_vtctrl(self, cmd: dict, command: str):
+    def _prepare_command_vtctrl(self, template: ControlTemplate, command: str):
         """Prepare vtCtrl command for specific ThinQ2 device."""
-        data_set: dict = cmd.pop("data", None)
-        if not data_set:
-            return cmd
+        if not (data_set := template.data):
+            return template.payload(VT_CTRL_KEY)
 
         cmd_data_set = {}
         vt_cmd_data = []
@@ -618,32 +674,32 @@ class WMDevice(Device):
             else:
                 cmd_data_set[cmd_key] = cmd_val
 
-        return {
-            **cmd,
-            "dataKey": None,
-            "dataValue": None,
-            "dataSetList": cmd_data_set,
-            "dataGetList": None,
-        }
+        return template.payload(
+            VT_CTRL_KEY,
+            dataKey=None,
+            dataValue=None,
+            dataSetList=cmd_data_set,
+            dataGetList=None,
+        )
 
     def _prepare_command(self, ctrl_key, command, key, value):
         """Prepare command for specific device."""
-        cmd = None
+        template = None
         vt_ctrl = True
         if command in VT_CTRL_CMD:
-            cmd = self.model_info.get_control_cmd("vtCtrl", "vtCtrl")
-        if not cmd:
+            template = self.model_info.control_template(VT_CTRL_KEY)
+        if not template:
             vt_ctrl = False
-            cmd = self.model_info.get_control_cmd(command, ctrl_key)
+            template = self.model_info.control_template(command)
 
-        if not cmd:
+        if not template:
             return None
 
         if self.model_info.is_info_v2:
             if vt_ctrl:
-                return self._prepare_command_vtctrl(cmd, command)
-            return self._prepare_command_v2(cmd, key)
-        return self._prepare_command_v1(cmd, key)
+                return self._prepare_command_vtctrl(template, command)
+            return self._prepare_command_v2(template, ctrl_key, key)
+        return self._prepare_command_v1(template, ctrl_key, key)
 
     def _get_runstate_key(self, state_name: str) -> str | None:
         """Return the run state key based on state name."""
@@ -767,8 +823,7 @@ class WMDevice(Device):
         tcl_count = None
         if self._status:
             tcl_count = self._status.tubclean_count
-        self._status = WMStatus(self, tcl_count=tcl_count)
-        return self._status
+        return self._apply_status(WMStatus, tcl_count=tcl_count)
 
     def _set_remote_start_opt(self):
         """Save the status to use for remote start."""
@@ -836,7 +891,7 @@ class WMDevice(Device):
             self._stand_by = False
             return None
 
-        self._status = WMStatus(self, res)
+        self._apply_status(WMStatus, res)
         self._set_remote_start_opt()
         self._set_cycle_finishing()
         return self._status
@@ -850,6 +905,15 @@ class WMStatus(DeviceStatus):
     :param data: JSON data from the API.
     """
 
+    __slots__ = (
+        "_internal_run_state",
+        "_run_state",
+        "_pre_state",
+        "_process_state",
+        "_error",
+        "_tcl_count",
+    )
+
     _device: WMDevice
 
     def __init__(
@@ -862,15 +926,28 @@ class WMStatus(DeviceStatus):
     ):
         """Initialize device status."""
         super().__init__(device, data)
+        self._tcl_count = tcl_count
+        if init_run_state:
+            # we call get_run_state to update device states
+            self._get_run_state()
+
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._internal_run_state = None
         self._run_state = None
         self._pre_state = None
         self._process_state = None
         self._error = None
+
+    def apply(
+        self, data: dict | None, *, tcl_count: str | None = None
+    ) -> frozenset[str]:
+        """Update the status in place with new raw data."""
         self._tcl_count = tcl_count
-        if init_run_state:
+        if changed := super().apply(data):
             # we call get_run_state to update device states
             self._get_run_state()
+        return changed
 
     def _getkeys(self, keys: str | list[str]) -> str | list[str]:
         """Add subkey prefix to a key or a list of keys if required."""
@@ -934,6 +1011,10 @@ class WMStatus(DeviceStatus):
                 self._error = error
         return self._error
 
+    def get_data_key(self, keys: str | list[str]) -> str:
+        """Return the key inside status data if match one of provided keys."""
+        return super().get_data_key(self._getkeys(keys))
+
     def update_status(self, key, value):
         """Update device status."""
         if not super().update_status(self._getkeys(key), value):
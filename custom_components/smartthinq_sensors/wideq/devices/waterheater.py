@@ -61,6 +61,10 @@ class WHMode(Enum):
 class WaterHeaterDevice(Device):
     """A higher-level interface for a Water Heater."""
 
+    # this command is to get power and temp info on V2 device
+    _event_lease_cmd = CMD_ENABLE_EVENT_V2
+    _event_lease_states = [STATE_POWER, STATE_CURRENT_TEMP]
+
     def __init__(
         self,
         client: ClientAsync,
@@ -161,20 +165,9 @@ class WaterHeaterDevice(Device):
             self._current_power_supported = False
             return 0
 
-    async def set(
-        self, ctrl_key, command, *, key=None, value=None, data=None, ctrl_path=None
-    ):
-        """Set a device's control for `key` to `value`."""
-        await super().set(
-            ctrl_key, command, key=key, value=value, data=data, ctrl_path=ctrl_path
-        )
-        if self._status:
-            self._status.update_status(key, value)
-
     def reset_status(self):
         """Reset the device's status"""
-        self._status = WaterHeaterStatus(self)
-        return self._status
+        return self._apply_status(WaterHeaterStatus)
 
     # async def _get_device_info(self):
     #    """
@@ -184,12 +177,6 @@ class WaterHeaterDevice(Device):
     #    # this command is to get power usage on V1 device
     #    self._current_power = await self.get_power()
 
-    async def _pre_update_v2(self):
-        """Call additional methods before data update for v2 API."""
-        # this command is to get power and temp info on V2 device
-        keys = self._get_cmd_keys(CMD_ENABLE_EVENT_V2)
-        await self.set(keys[0], keys[1], key=keys[2], value="70", ctrl_path="control")
-
     async def poll(self) -> WaterHeaterStatus | None:
         """Poll the device's current state."""
         res = await self._device_poll(
@@ -201,19 +188,18 @@ class WaterHeaterDevice(Device):
         # if self._should_poll:
         #    res[STATE_POWER_V1] = self._current_power
 
-        self._status = WaterHeaterStatus(self, res)
-
-        return self._status
+        return self._apply_status(WaterHeaterStatus, res)
 
 
 class WaterHeaterStatus(DeviceStatus):
     """Higher-level information about a Water Heater's current status."""
 
+    __slots__ = ("_operation",)
+
     _device: WaterHeaterDevice
 
-    def __init__(self, device: WaterHeaterDevice, data: dict | None = None):
-        """Initialize device status."""
-        super().__init__(device, data)
+    def _reset_cache(self) -> None:
+        """Reset the values cached from status data."""
         self._operation = None
 
     def _str_to_temp(self, str_temp):
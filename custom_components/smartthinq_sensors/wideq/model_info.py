@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from collections.abc import Awaitable, Callable
 from copy import deepcopy
 import json
 import logging
 from numbers import Number
+import re
 
 import xmltodict
 
@@ -29,29 +31,117 @@ RangeValue = namedtuple("RangeValue", ["min", "max", "step"])
 BitValue = namedtuple("BitValue", ["options"])
 ReferenceValue = namedtuple("ReferenceValue", ["reference"])
 
+_SLOT_PATTERN = re.compile(r"\{\{(.+?)\}\}")
+
+# model data sections used by the lookups, with the referenced sections
+_LOOKUP_SECTIONS = (
+    "Info",
+    "Config",
+    "ConvertingRule",
+    "ControlWifi",
+    "Monitoring",
+    "MonitoringValue",
+    "Value",
+)
+
+
+class ControlTemplate:
+    """
+    A control command of the model, compiled once from the ControlWifi section.
+
+    The template is never modified, `payload` return a new command for each
+    request. The substitution slots are the `{{key}}` placeholders in the
+    string fields of the command, the `data` set of ThinQ2 commands is
+    available to build the data set list.
+    """
+
+    __slots__ = ("_base", "_ctrl_field", "_fields", "data")
+
+    def __init__(self, control: dict, ctrl_field: str) -> None:
+        """Initialize the template."""
+        control = deepcopy(control)
+        self.data = control.pop("data", None)
+        self._base = control
+        self._ctrl_field = ctrl_field
+        self._fields: dict[str, list[str]] = {}
+        for field, value in [("data", self.data), *control.items()]:
+            if isinstance(value, str) and "{{" in value:
+                # even items are the text, odd items the slot names
+                self._fields[field] = _SLOT_PATTERN.split(value)
+
+    def get(self, field: str, default=None):
+        """Return the value of a field of the command."""
+        if field == "data":
+            return self.data
+        return self._base.get(field, default)
+
+    def slots(self, field: str = "data") -> list[str]:
+        """Return the substitution slots in a string field."""
+        if not (parts := self._fields.get(field)):
+            return []
+        return parts[1::2]
+
+    def fill(self, field: str, values: dict) -> str | None:
+        """
+        Return a string field with the slots filled with provided values.
+        The slots without a value are left unchanged.
+        """
+        if not (parts := self._fields.get(field)):
+            return self.get(field)
+
+        str_data = []
+        for idx, part in enumerate(parts):
+            if not idx % 2:
+                str_data.append(part)
+            elif part in values:
+                str_data.append(str(values[part]))
+            else:
+                str_data.append(f"{{{{{part}}}}}")
+        return "".join(str_data)
+
+    def payload(self, ctrl_key: str | None = None, **fields) -> dict:
+        """
+        Return a new command with the control key and fields set.
+        The command `data` is not included and must be provided in fields.
+        """
+        cmd = {**self._base}
+        if ctrl_key:
+            cmd[self._ctrl_field] = ctrl_key
+        cmd.update(fields)
+        return cmd
+
 
 class ModelInfo(ABC):
     """The base abstract class for a device model's capabilities."""
 
+    @staticmethod
+    def device_data(model_data: dict, sub_device: str | None = None) -> dict:
+        """Return the model data of a device or of one of its sub devices."""
+        if sub_device is not None:
+            return {"Info": model_data["Info"], **model_data[sub_device]}
+        return model_data
+
     @staticmethod
     def get_model_info(
-        model_data: dict, sub_device: str | None = None
+        model_data: dict,
+        sub_device: str | None = None,
+        loader: Callable[[], Awaitable[dict | None]] | None = None,
     ) -> ModelInfo | None:
-        """Return the correct model info."""
-        if sub_device is not None:
-            data = {"Info": model_data["Info"], **model_data[sub_device]}
-        else:
-            data = model_data
+        """
+        Return the correct model info.
+        The optional loader returns the raw model data used by `async_as_dict`.
+        """
+        data = ModelInfo.device_data(model_data, sub_device)
 
         if ModelInfoV2AC.is_valid_model_data(data):
             # this is new V2 model for AC
-            return ModelInfoV2AC(data)
+            return ModelInfoV2AC(data, loader)
         if ModelInfoV1.is_valid_model_data(data):
             # this is old V1 model
-            return ModelInfoV1(data)
+            return ModelInfoV1(data, loader)
         if ModelInfoV2.is_valid_model_data(data):
             # this is new V2 model
-            return ModelInfoV2(data)
+            return ModelInfoV2(data, loader)
         return None
 
     @staticmethod
@@ -59,9 +149,33 @@ class ModelInfo(ABC):
     def is_valid_model_data(model_data: dict) -> bool:
         """Determine if model data is valid for this model."""
 
-    def __init__(self, data):
+    _ctrl_field = "cmd"
+
+    def __init__(
+        self, data, loader: Callable[[], Awaitable[dict | None]] | None = None
+    ):
         """Initialize the class."""
-        self._data = data
+        self._data = self._lookup_data(data)
+        self._loader = loader
+        self._control_templates: dict[str, ControlTemplate | None] = {}
+
+    @staticmethod
+    def _lookup_data(data: dict) -> dict:
+        """
+        Return the sections of the model data used by the lookups, the
+        other sections of the raw data are not kept with the device.
+        """
+        sections = set(_LOOKUP_SECTIONS)
+        for values_key in ("Value", "MonitoringValue"):
+            for value in (data.get(values_key) or {}).values():
+                if not isinstance(value, dict):
+                    continue
+                if isinstance(ref := value.get("ref"), str):
+                    sections.add(ref)
+                option = value.get("option")
+                if isinstance(option, list) and option and isinstance(option[0], str):
+                    sections.add(option[0])
+        return {key: value for key, value in data.items() if key in sections}
 
     @property
     @abstractmethod
@@ -69,11 +183,17 @@ class ModelInfo(ABC):
         """Return the type of 'model_info' represented."""
 
     def as_dict(self):
-        """Return the data dictionary"""
+        """Return the data dictionary used by the lookups."""
         if not self._data:
             return {}
         return deepcopy(self._data)
 
+    async def async_as_dict(self):
+        """Return the raw data dictionary, if available from the loader."""
+        if self._loader and (data := await self._loader()):
+            return deepcopy(data)
+        return self.as_dict()
+
     @property
     @abstractmethod
     def model_type(self):
@@ -202,8 +322,17 @@ class ModelInfo(ABC):
         """Check that type of control is BINARY(BYTE)."""
 
     @abstractmethod
-    def get_control_cmd(self, cmd_key, ctrl_key=None):
-        """Get the payload used to send the command."""
+    def _control_data(self, cmd_key) -> dict | None:
+        """Return the ControlWifi definition of a command."""
+
+    def control_template(self, cmd_key) -> ControlTemplate | None:
+        """Return the template used to build the command payload."""
+        if cmd_key not in self._control_templates:
+            control = self._control_data(cmd_key)
+            self._control_templates[cmd_key] = (
+                ControlTemplate(control, self._ctrl_field) if control else None
+            )
+        return self._control_templates[cmd_key]
 
     @abstractmethod
     def decode_monitor(self, data):
@@ -227,9 +356,11 @@ class ModelInfoV1(ModelInfo):
         """Determine if model data is valid for this model."""
         return "Monitoring" in model_data and "Value" in model_data
 
-    def __init__(self, data):
+    def __init__(
+        self, data, loader: Callable[[], Awaitable[dict | None]] | None = None
+    ):
         """Initialize the class."""
-        super().__init__(data)
+        super().__init__(data, loader)
         self._monitor_type = None
         self._bit_keys = {}
 
@@ -414,16 +545,11 @@ class ModelInfoV1(ModelInfo):
         """Check that type of control is BINARY(BYTE)."""
         return self._data["ControlWifi"]["type"] == "BINARY(BYTE)"
 
-    def get_control_cmd(self, cmd_key, ctrl_key=None):
-        """Get the payload used to send the command."""
-        control = None
-        if "ControlWifi" in self._data:
-            control_data = self._data["ControlWifi"].get("action", {}).get(cmd_key)
-            if control_data:
-                control = deepcopy(control_data)  # we copy so that we can manipulate
-                if ctrl_key:
-                    control["cmd"] = ctrl_key
-        return control
+    def _control_data(self, cmd_key) -> dict | None:
+        """Return the ControlWifi definition of a command."""
+        if "ControlWifi" not in self._data:
+            return None
+        return self._data["ControlWifi"].get("action", {}).get(cmd_key)
 
     @property
     def monitor_type(self) -> str | None:
@@ -625,6 +751,8 @@ class ModelInfoV1(ModelInfo):
 class ModelInfoV2(ModelInfo):
     """A description of a device model's capabilities for type V2."""
 
+    _ctrl_field = "ctrlKey"
+
     @staticmethod
     def is_valid_model_data(model_data: dict) -> bool:
         """Determine if model data is valid for this model."""
@@ -745,16 +873,11 @@ class ModelInfoV2(ModelInfo):
         """Check that type of control is BINARY(BYTE)."""
         return False
 
-    def get_control_cmd(self, cmd_key, ctrl_key=None):
-        """Get the payload used to send the command."""
-        control = None
-        if "ControlWifi" in self._data:
-            control_data = self._data["ControlWifi"].get(cmd_key)
-            if control_data:
-                control = deepcopy(control_data)  # we copy so that we can manipulate
-                if ctrl_key:
-                    control["ctrlKey"] = ctrl_key
-        return control
+    def _control_data(self, cmd_key) -> dict | None:
+        """Return the ControlWifi definition of a command."""
+        if "ControlWifi" not in self._data:
+            return None
+        return self._data["ControlWifi"].get(cmd_key)
 
     @staticmethod
     def decode_monitor_json(data):
@@ -788,9 +911,11 @@ class ModelInfoV2AC(ModelInfoV1):
                 return True
         return False
 
-    def __init__(self, data):
+    def __init__(
+        self, data, loader: Callable[[], Awaitable[dict | None]] | None = None
+    ):
         """Initialize the class."""
-        super().__init__(data)
+        super().__init__(data, loader)
         self._has_monitoring = "Monitoring" in data
 
     @property
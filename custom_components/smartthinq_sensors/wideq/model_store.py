@@ -0,0 +1,249 @@
+"""
+Shared store for the model definition and language pack files.
+
+Model files are large and the same model is often used by several devices,
+also on different accounts, so the files are de-duplicated by content hash
+and the raw data kept resident is bounded in size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import hashlib
+import json
+import logging
+import os
+from typing import Any
+import weakref
+
+from charset_normalizer import from_bytes
+
+# max size in bytes of the raw files kept resident by the store
+DEFAULT_MAX_SIZE = 8 * 1024 * 1024
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ModelData(dict):
+    """A model file content, that can be referenced by the store weakly."""
+
+    __slots__ = ("__weakref__",)
+
+
+def decode_json_content(content: bytes, info_url: str = "") -> Any:
+    """Decode and load as json the content of a model file."""
+    try:
+        # we use charset_normalizer to detect correct encoding and convert to unicode string
+        str_content = str(from_bytes(content).best(), errors="replace")
+    except (LookupError, TypeError):
+        # A LookupError is raised if the encoding was not found which could
+        # indicate a misspelling or similar mistake.
+        #
+        # A TypeError can be raised if encoding is None
+        #
+        # So we try blindly encoding.
+        str_content = str(content, errors="replace")
+
+    enc_resp = str_content.encode()
+    try:
+        return json.loads(enc_resp)
+    except json.JSONDecodeError as ex:
+        _LOGGER.warning("Failed to load json info file: %s - error: %s", info_url, ex)
+        return None
+
+
+class ModelStore:
+    """
+    Store the model files shared by all the clients.
+
+    The files are indexed by url and de-duplicated by content hash. The most
+    recently used files are kept resident up to `max_size` bytes, files in
+    use by a device are always found with a weak reference. If `keep_raw` is
+    False no file is kept resident, devices only keep the data structures
+    used for the lookups. When a cache directory is set the files are saved
+    on disk and evicted files are read from there when requested again.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        keep_raw: bool = True,
+    ) -> None:
+        """Initialize the store."""
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._keep_raw = keep_raw
+        self._url_hash: dict[str, str] = {}
+        self._resident: OrderedDict[str, tuple[ModelData, int]] = OrderedDict()
+        self._resident_size = 0
+        self._in_use: weakref.WeakValueDictionary[str, ModelData] = (
+            weakref.WeakValueDictionary()
+        )
+        self._stats = {"hits": 0, "disk_loads": 0, "downloads": 0, "shared": 0}
+
+    def configure(
+        self,
+        cache_dir: str | None = None,
+        *,
+        max_size: int | None = None,
+        keep_raw: bool | None = None,
+    ) -> None:
+        """Update the store configuration."""
+        if cache_dir is not None:
+            self._cache_dir = cache_dir
+        if max_size is not None:
+            self._max_size = max_size
+        if keep_raw is not None:
+            self._keep_raw = keep_raw
+        self._evict()
+
+    def _cache_file(self, content_hash: str) -> str | None:
+        """Return the path of the disk file for a content hash."""
+        if not self._cache_dir:
+            return None
+        return os.path.join(self._cache_dir, f"{content_hash}.json")
+
+    def _write_cache_file(self, path: str, content: bytes) -> None:
+        """Save the content of a model file on disk."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as cache_file:
+            cache_file.write(content)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_cache_file(path: str) -> bytes | None:
+        """Read the content of a model file from disk."""
+        try:
+            with open(path, "rb") as cache_file:
+                return cache_file.read()
+        except OSError:
+            return None
+
+    def _evict(self) -> None:
+        """Release the least recently used files above the max size."""
+        max_size = self._max_size if self._keep_raw else 0
+        while self._resident and self._resident_size > max_size:
+            _, (_, size) = self._resident.popitem(last=False)
+            self._resident_size -= size
+
+    def _add_resident(self, content_hash: str, data: ModelData, size: int) -> None:
+        """Add a file to the resident files."""
+        self._in_use[content_hash] = data
+        if content_hash in self._resident:
+            self._resident.move_to_end(content_hash)
+            return
+        self._resident[content_hash] = (data, size)
+        self._resident_size += size
+        self._evict()
+
+    def _get_loaded(self, content_hash: str) -> ModelData | None:
+        """Return a file if resident or in use by a device."""
+        if entry := self._resident.get(content_hash):
+            self._resident.move_to_end(content_hash)
+            return entry[0]
+        return self._in_use.get(content_hash)
+
+    async def _async_decode(self, content: bytes, url: str) -> ModelData | None:
+        """Decode the content of a model file."""
+        data = await asyncio.to_thread(decode_json_content, content, url)
+        if not isinstance(data, dict):
+            return None
+        return ModelData(data)
+
+    async def _async_load_from_disk(
+        self, content_hash: str, url: str
+    ) -> ModelData | None:
+        """Load a file from the disk cache."""
+        if not (path := self._cache_file(content_hash)):
+            return None
+        if not (content := await asyncio.to_thread(self._read_cache_file, path)):
+            return None
+        if not (data := await self._async_decode(content, url)):
+            return None
+        self._stats["disk_loads"] += 1
+        self._add_resident(content_hash, data, len(content))
+        return data
+
+    async def async_get_cached(self, url: str) -> dict[str, Any] | None:
+        """
+        Return the content of a model file if loaded or in the disk cache,
+        the file is never downloaded.
+        """
+        if not (content_hash := self._url_hash.get(url)):
+            return None
+        if (data := self._get_loaded(content_hash)) is not None:
+            self._stats["hits"] += 1
+            return data
+        return await self._async_load_from_disk(content_hash, url)
+
+    async def async_get(
+        self, url: str, fetch: Callable[[str], Awaitable[bytes]]
+    ) -> dict[str, Any] | None:
+        """
+        Return the content of a model file, using fetch to download it.
+        Concurrent requests of a new file can download it more than once,
+        but the content is de-duplicated by hash.
+        """
+        if (data := await self.async_get_cached(url)) is not None:
+            return data
+
+        content = await fetch(url)
+        self._stats["downloads"] += 1
+        content_hash = hashlib.sha256(content).hexdigest()
+        if (data := self._get_loaded(content_hash)) is not None:
+            # same content already loaded from a different url
+            self._stats["shared"] += 1
+            self._url_hash[url] = content_hash
+            return data
+
+        if (data := await self._async_decode(content, url)) is None:
+            return None
+        if path := self._cache_file(content_hash):
+            try:
+                await asyncio.to_thread(self._write_cache_file, path, content)
+            except OSError as exc:
+                _LOGGER.warning("Failed to save model file %s: %s", path, exc)
+        self._url_hash[url] = content_hash
+        self._add_resident(content_hash, data, len(content))
+        return data
+
+    def add(self, url: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Add to the store a model file already decoded."""
+        content = json.dumps(data, sort_keys=True).encode()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if (model_data := self._get_loaded(content_hash)) is None:
+            model_data = ModelData(data)
+        self._url_hash[url] = content_hash
+        self._add_resident(content_hash, model_data, len(content))
+        return model_data
+
+    def clear(self) -> None:
+        """Release all the resident files."""
+        self._resident.clear()
+        self._resident_size = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the store status."""
+        return {
+            "urls": len(self._url_hash),
+            "resident": len(self._resident),
+            "resident_size": self._resident_size,
+            "in_use": len(self._in_use),
+            "max_size": self._max_size,
+            "keep_raw": self._keep_raw,
+            "disk_cache": self._cache_dir is not None,
+            **self._stats,
+        }
+
+
+_SHARED_STORE = ModelStore()
+
+
+def get_shared_store() -> ModelStore:
+    """Return the model store shared by all the clients."""
+    return _SHARED_STORE
@@ -0,0 +1 @@
+"""Benchmarks for the ThinQ library hot paths."""
@@ -0,0 +1,42 @@
+"""Fixtures for ThinQ library benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from .corpus import DeviceCorpus, async_build_devices, load_corpora
+
+CORPORA = load_corpora()
+
+
+def build_devices(corpus: DeviceCorpus):
+    """Build the initialized device objects described by a payload."""
+    return asyncio.run(async_build_devices(corpus))
+
+
+@pytest.fixture
+def measure(benchmark) -> Callable[..., Any]:
+    """
+    Benchmark a callable and record its allocations.
+
+    The callable is executed once under tracemalloc before the timed rounds,
+    peak and retained bytes are reported in benchmark extra info.
+    """
+
+    def _measure(func: Callable[..., Any], *args: Any) -> Any:
+        tracemalloc.start()
+        try:
+            func(*args)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["alloc_peak_bytes"] = peak
+        benchmark.extra_info["alloc_retained_bytes"] = retained
+        return benchmark(func, *args)
+
+    return _measure
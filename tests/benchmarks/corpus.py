@@ -0,0 +1,100 @@
+"""Recorded device payloads used by benchmarks."""
+
+from __future__ import annotations
+
+import base64
+from copy import deepcopy
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Any
+
+from custom_components.smartthinq_sensors.wideq.core_async import ClientAsync
+from custom_components.smartthinq_sensors.wideq.device import Device, DeviceStatus
+from custom_components.smartthinq_sensors.wideq.device_info import DeviceInfo
+from custom_components.smartthinq_sensors.wideq.factory import get_lge_device
+from custom_components.smartthinq_sensors.wideq.model_store import ModelStore
+
+FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "devices"
+
+MONITOR_BYTE = "byte"
+MONITOR_HEX = "hex"
+MONITOR_XML = "xml"
+MONITOR_JSON = "json"
+
+
+@dataclass
+class DeviceCorpus:
+    """
+    An anonymised device payload.
+
+    `device` is the entry returned by the dashboard, `model_info` the model
+    JSON and `monitor` the ThinQ1 monitor result, if the device is ThinQ1.
+    """
+
+    name: str
+    device: dict[str, Any]
+    model_info: dict[str, Any]
+    snapshot_key: str = ""
+    monitor: dict[str, str] | None = field(default=None)
+
+    @property
+    def monitor_encoding(self) -> str | None:
+        """Return the encoding of ThinQ1 monitor payload."""
+        if not self.monitor:
+            return None
+        return self.monitor["encoding"]
+
+    @property
+    def monitor_payload(self) -> bytes | None:
+        """Return the ThinQ1 monitor payload as received from the API."""
+        if not self.monitor:
+            return None
+        data = self.monitor["data"]
+        if self.monitor_encoding == MONITOR_BYTE:
+            return base64.b64decode(data)
+        return data.encode()
+
+
+def load_corpora(path: Path = FIXTURES_PATH) -> list[DeviceCorpus]:
+    """Load all the device payloads available in fixtures path."""
+    corpora = []
+    for file in sorted(path.glob("*.json")):
+        with file.open(encoding="utf-8") as corpus_file:
+            data = json.load(corpus_file)
+        corpora.append(DeviceCorpus(name=file.stem, **data))
+    return corpora
+
+
+def create_client(corpora: list[DeviceCorpus]) -> ClientAsync:
+    """Create a client with the model info of provided payloads preloaded."""
+    client = ClientAsync(auth=None, model_store=ModelStore())
+    for corpus in corpora:
+        client.model_store.add(corpus.device["modelJsonUri"], corpus.model_info)
+    return client
+
+
+async def async_build_devices(
+    corpus: DeviceCorpus, client: ClientAsync | None = None
+) -> list[Device]:
+    """Build the initialized device objects described by a payload."""
+    client = client or create_client([corpus])
+    devices = get_lge_device(client, DeviceInfo(deepcopy(corpus.device))) or []
+    for device in devices:
+        if not await device.init_device_info():
+            raise ValueError(f"Invalid model info in payload {corpus.name}")
+    return devices
+
+
+def decode_payload(device: Device, corpus: DeviceCorpus) -> dict[str, Any] | None:
+    """Decode the payload as done by the device poll."""
+    model_info = device.model_info
+    if corpus.monitor:
+        return model_info.decode_monitor(corpus.monitor_payload)
+    snapshot = deepcopy(corpus.device.get("snapshot", {}))
+    return model_info.decode_snapshot(snapshot, corpus.snapshot_key)
+
+
+def status_class(device: Device) -> type[DeviceStatus]:
+    """Return the status class used by a device."""
+    return type(device.reset_status())
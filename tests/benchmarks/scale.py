@@ -0,0 +1,187 @@
+"""Helpers for the integration scale benchmark."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import gc
+import json
+from pathlib import Path
+import platform
+import resource
+import statistics
+import sys
+import threading
+import time
+from types import FunctionType, ModuleType
+from typing import Any
+
+from ..mock_thinq import MockConfig, MockThinQServer
+from custom_components.smartthinq_sensors.const import __version__
+
+PAGE_SIZE = resource.getpagesize()
+
+
+class MockServerThread:
+    """
+    Run the mock ThinQ server on its own thread and event loop.
+
+    This keep the server work out of the measured event loop.
+    """
+
+    def __init__(self, config: MockConfig) -> None:
+        """Initialize the server thread."""
+        self.server = MockThinQServer(config=config)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mock-thinq", daemon=True
+        )
+
+    def start(self) -> str:
+        """Start the server and return its gateway url."""
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        except BaseException:
+            self.stop()
+            raise
+        return self.server.gateway_url
+
+    def stop(self) -> None:
+        """Stop the server and wait the thread completion, can be called twice."""
+        if self._thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.server.stop(), self._loop
+                ).result()
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+        if not self._loop.is_closed():
+            self._loop.close()
+
+
+class LoopLagProbe:
+    """Measure the event loop lag sampling a periodic sleep."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialize the probe."""
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.samples: list[float] = []
+
+    async def _run(self) -> None:
+        """Record the delay of each wake up compared to the expected one."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+
+    def start(self) -> None:
+        """Start sampling."""
+        self.samples.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def percentiles(samples: Iterable[float], scale: float = 1.0) -> dict[str, float]:
+    """Return the p50, p95, p99 and max of samples."""
+    values = sorted(samples)
+    if not values:
+        return {}
+
+    def _pct(pct: float) -> float:
+        return round(values[min(int(len(values) * pct), len(values) - 1)] * scale, 3)
+
+    return {
+        "p50": _pct(0.50),
+        "p95": _pct(0.95),
+        "p99": _pct(0.99),
+        "max": round(values[-1] * scale, 3),
+    }
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    """Return the mean and max of samples."""
+    if not samples:
+        return {}
+    return {"mean": round(statistics.mean(samples), 4), "max": round(max(samples), 4)}
+
+
+def deep_sizeof(obj: Any, exclude: Iterable[Any] = ()) -> int:
+    """
+    Return the memory used by an object and all the objects it references.
+
+    Objects in `exclude` and everything reachable only through them are not
+    counted; classes, modules and functions are always skipped.
+    """
+    seen = {id(item) for item in exclude}
+    size = 0
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        pending.extend(gc.get_referents(item))
+    return size
+
+
+def rss_bytes() -> int | None:
+    """Return the current resident set size, if available."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class CycleTimer:
+    """Measure wall time and event loop thread CPU time of a code block."""
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.wall: list[float] = []
+        self.cpu: list[float] = []
+        self._start = (0.0, 0.0)
+
+    def __enter__(self) -> CycleTimer:
+        """Start measuring."""
+        self._start = (time.perf_counter(), time.thread_time())
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Record the measure."""
+        self.wall.append(time.perf_counter() - self._start[0])
+        self.cpu.append(time.thread_time() - self._start[1])
+
+
+def write_report(path: str | Path, results: list[dict[str, Any]]) -> None:
+    """Write the scale benchmark JSON report."""
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": sorted(results, key=lambda result: result["devices"]),
+    }
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
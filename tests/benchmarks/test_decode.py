@@ -0,0 +1,51 @@
+"""Benchmarks for monitor and snapshot payload decoding."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+
+from .conftest import CORPORA, build_devices
+from .corpus import MONITOR_BYTE, MONITOR_HEX, MONITOR_XML, DeviceCorpus
+
+MONITOR_DECODERS = {
+    MONITOR_BYTE: "decode_monitor_byte",
+    MONITOR_HEX: "decode_monitor_hex",
+    MONITOR_XML: "decode_monitor_xml",
+}
+
+
+def _corpus_id(corpus: DeviceCorpus) -> str:
+    return corpus.name
+
+
+@pytest.mark.parametrize(
+    "corpus",
+    [corpus for corpus in CORPORA if corpus.monitor_encoding in MONITOR_DECODERS],
+    ids=_corpus_id,
+)
+def test_decode_monitor(measure, corpus: DeviceCorpus):
+    """Benchmark ThinQ1 binary and xml monitor payloads decoding."""
+    device = build_devices(corpus)[0]
+    decoder = getattr(device.model_info, MONITOR_DECODERS[corpus.monitor_encoding])
+    result = measure(decoder, corpus.monitor_payload)
+    assert result
+
+
+@pytest.mark.parametrize(
+    "corpus",
+    [corpus for corpus in CORPORA if corpus.device.get("snapshot")],
+    ids=_corpus_id,
+)
+def test_decode_snapshot(measure, corpus: DeviceCorpus):
+    """Benchmark snapshot decoding for V1, V2 and V2AC models."""
+    device = build_devices(corpus)[0]
+    model_info = device.model_info
+    snapshot = corpus.device["snapshot"]
+
+    def _decode():
+        return model_info.decode_snapshot(deepcopy(snapshot), corpus.snapshot_key)
+
+    result = measure(_decode)
+    assert result
@@ -0,0 +1,132 @@
+"""
+Scale benchmark of the integration against the mock ThinQ server.
+
+By default only a small fleet is used, run `scripts/benchmark_scale` to
+measure all the fleet sizes and write the JSON report. The mock server
+listens on a local socket, so the sockets disabled by the Home Assistant
+test plugin are enabled for this test.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from ..mock_thinq import MockConfig
+from ..mock_thinq.server import MOCK_REFRESH_TOKEN
+from .scale import (
+    CycleTimer,
+    LoopLagProbe,
+    MockServerThread,
+    deep_sizeof,
+    peak_rss_bytes,
+    percentiles,
+    rss_bytes,
+    summary,
+    write_report,
+)
+from custom_components.smartthinq_sensors import lge_devices_setup
+from custom_components.smartthinq_sensors.wideq.core_async import ClientAsync
+
+SCALE_SIZES = [int(size) for size in os.environ.get("SCALE_SIZES", "10").split(",")]
+SCALE_POLL_CYCLES = int(os.environ.get("SCALE_POLL_CYCLES", "5"))
+SCALE_REPORT = os.environ.get("SCALE_REPORT")
+
+
+@pytest.fixture(scope="module")
+def scale_results():
+    """Collect the results and write the report at the end of the module."""
+    results = []
+    yield results
+    if SCALE_REPORT and results:
+        write_report(SCALE_REPORT, results)
+
+
+def _mean_size(objects: list, exclude: list) -> int:
+    """Return the mean deep size of a list of objects."""
+    if not objects:
+        return 0
+    return int(statistics.mean(deep_sizeof(obj, exclude) for obj in objects))
+
+
+@pytest.mark.parametrize("fleet_size", SCALE_SIZES)
+async def test_scale(
+    hass: HomeAssistant, socket_enabled, scale_results, fleet_size: int
+):
+    """Measure startup, poll cycles and memory with a fleet of devices."""
+    server = MockServerThread(MockConfig(fleet_size=fleet_size, seed=fleet_size))
+    probe = LoopLagProbe()
+    client = None
+    rss_start = rss_bytes()
+    try:
+        gateway_url = await hass.async_add_executor_job(server.start)
+        probe.start()
+        start = time.perf_counter()
+        client = await ClientAsync.from_token(
+            MOCK_REFRESH_TOKEN, gateway_url=gateway_url
+        )
+        lge_devices, unsupported, _ = await lge_devices_setup(hass, client)
+        startup = time.perf_counter() - start
+        await probe.stop()
+        startup_lag = percentiles(probe.samples, 1000)
+
+        devices = [device for devs in lge_devices.values() for device in devs]
+        assert not unsupported
+        assert len(client.devices) == fleet_size
+
+        probe.start()
+        timer = CycleTimer()
+        for _ in range(SCALE_POLL_CYCLES):
+            with timer:
+                # pylint: disable=protected-access
+                await client._load_devices(True)
+                await asyncio.gather(
+                    *(device.coordinator.async_refresh() for device in devices)
+                )
+        await probe.stop()
+
+        thinq_devices = [device.device for device in devices]
+        model_infos = list(
+            {id(dev.model_info): dev.model_info for dev in thinq_devices}.values()
+        )
+        statuses = [dev.status for dev in thinq_devices]
+        shared = [hass, hass.loop, client]
+        rss_end = rss_bytes()
+        scale_results.append(
+            {
+                "devices": fleet_size,
+                "entities_devices": len(devices),
+                "startup_s": round(startup, 3),
+                "startup_loop_lag_ms": startup_lag,
+                "poll_cycles": SCALE_POLL_CYCLES,
+                "cycle_wall_s": summary(timer.wall),
+                "cycle_cpu_s": summary(timer.cpu),
+                "loop_lag_ms": percentiles(probe.samples, 1000),
+                "rss_peak_bytes": peak_rss_bytes(),
+                "rss_delta_bytes": (
+                    rss_end - rss_start if rss_end and rss_start else None
+                ),
+                "memory_bytes": {
+                    "Device": _mean_size(
+                        thinq_devices, [*shared, *model_infos, *statuses]
+                    ),
+                    "ModelInfo": _mean_size(model_infos, shared),
+                    "DeviceStatus": _mean_size(
+                        statuses, [*shared, *thinq_devices, *model_infos]
+                    ),
+                },
+                "requests": sum(server.server.requests.values()),
+            }
+        )
+
+    finally:
+        await probe.stop()
+        if client:
+            await client.close()
+        await hass.async_add_executor_job(server.stop)
@@ -0,0 +1,39 @@
+"""Benchmarks for device status features evaluation."""
+
+from __future__ import annotations
+
+import pytest
+
+from .conftest import CORPORA, build_devices
+from .corpus import DeviceCorpus, decode_payload, status_class
+
+
+@pytest.mark.parametrize("corpus", CORPORA, ids=lambda corpus: corpus.name)
+def test_device_features(measure, corpus: DeviceCorpus):
+    """Benchmark full status features evaluation for every device type."""
+    device = build_devices(corpus)[0]
+    data = decode_payload(device, corpus)
+    assert data is not None
+    status_cls = status_class(device)
+
+    def _features():
+        return status_cls(device, dict(data)).device_features
+
+    measure(_features)
+
+
+@pytest.mark.parametrize("corpus", CORPORA, ids=lambda corpus: corpus.name)
+def test_status_apply(measure, corpus: DeviceCorpus):
+    """Benchmark the in place status update with unchanged data."""
+    device = build_devices(corpus)[0]
+    data = decode_payload(device, corpus)
+    assert data is not None
+    status = device.reset_status()
+    status.apply(dict(data))
+    features = status.device_features
+
+    def _apply():
+        status.apply(dict(data))
+        return status.device_features
+
+    assert measure(_apply) is features
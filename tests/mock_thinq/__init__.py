@@ -0,0 +1,5 @@
+"""Local mock of the ThinQ cloud API."""
+
+from .server import MockConfig, MockThinQServer
+
+__all__ = ["MockConfig", "MockThinQServer"]
@@ -0,0 +1,65 @@
+"""
+Run the ThinQ mock server.
+
+Set the environment variable `thinq2_gateway_url` to the logged gateway url
+and use the logged refresh token to connect the integration to the server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from .server import MOCK_REFRESH_TOKEN, MockConfig, MockThinQServer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="ThinQ cloud mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fleet-size", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-validity", type=int, default=3600, help="seconds")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the server until cancelled."""
+    server = MockThinQServer(
+        config=MockConfig(
+            fleet_size=args.fleet_size,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            token_validity=args.token_validity,
+            seed=args.seed,
+        )
+    )
+    await server.start(args.host, args.port)
+    _LOGGER.info("Gateway url: %s", server.gateway_url)
+    _LOGGER.info("Refresh token: %s", MOCK_REFRESH_TOKEN)
+    _LOGGER.info("Simulated devices: %s", len(server.devices))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Run the ThinQ mock server."""
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_run(_parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+An aiohttp mock of the ThinQ cloud API driven by device fixtures.
+
+The mock serves the gateway, OAuth, dashboard, `service/devices/{id}`,
+`control-sync` and `rti/*` endpoints used by the library, so that the
+whole stack (HTTP, authentication and retries) can be exercised offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import Counter
+from copy import deepcopy
+from dataclasses import dataclass
+import logging
+import random
+import time
+from typing import Any
+import uuid
+
+from aiohttp import web
+
+from ..benchmarks.corpus import DeviceCorpus, load_corpora
+
+MOCK_REFRESH_TOKEN = "mock-refresh-token"
+MOCK_USER_NUMBER = "MOCK0000000001"
+
+RESULT_OK = "0000"
+RESULT_DEVICE_NOT_FOUND = "0101"
+RESULT_NOT_LOGGED_IN = "0102"
+RESULT_NOT_CONNECTED = "0106"
+
+V1_ROOT = "/api"
+V2_ROOT = "/v1"
+GATEWAY_PATH = f"{V2_ROOT}/service/application/gateway-uri"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class MockConfig:
+    """
+    Behaviour of the mock server.
+
+    `error_codes` items are used for injected errors: a `str` is returned as
+    API result code, an `int` as HTTP status.
+    """
+
+    fleet_size: int | None = None
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_codes: tuple[str | int, ...] = (RESULT_NOT_CONNECTED, 503)
+    token_validity: int = 3600
+    seed: int | None = None
+
+
+class MockDevice:
+    """A simulated device of the mock fleet."""
+
+    def __init__(self, corpus: DeviceCorpus, index: int, model_url: str) -> None:
+        """Initialize the simulated device."""
+        self.corpus = corpus
+        self.info = deepcopy(corpus.device)
+        self.device_id = str(uuid.UUID(int=index + 1))
+        self.info["deviceId"] = self.device_id
+        self.info["alias"] = f"{corpus.device.get('alias', corpus.name)} {index + 1}"
+        self.info["macAddress"] = ":".join(
+            f"{(index >> shift) & 0xFF:02x}" for shift in (40, 32, 24, 16, 8, 0)
+        )
+        self.info["modelJsonUri"] = model_url
+        self.work_id: str | None = None
+
+    @property
+    def online(self) -> bool:
+        """Return if the device is online."""
+        return self.info.get("online", True)
+
+    @online.setter
+    def online(self, value: bool) -> None:
+        """Set the device online state."""
+        self.info["online"] = value
+        if snapshot := self.info.get("snapshot"):
+            snapshot["online"] = value
+
+    @property
+    def monitor_data(self) -> str | None:
+        """Return the base64 ThinQ1 monitor payload."""
+        if not (payload := self.corpus.monitor_payload):
+            return None
+        return base64.b64encode(payload).decode()
+
+    def apply_control(self, keys: list[str], values: list[Any]) -> None:
+        """Apply a ThinQ2 control command to the device snapshot."""
+        snapshot = self.info.get("snapshot")
+        if snapshot is None:
+            return
+        for key, value in zip(keys, values):
+            if key:
+                snapshot[key] = value
+        snapshot["timestamp"] = int(time.time() * 1000)
+
+
+class MockThinQServer:
+    """A local ThinQ cloud server built from device fixtures."""
+
+    def __init__(
+        self,
+        corpora: list[DeviceCorpus] | None = None,
+        config: MockConfig | None = None,
+    ) -> None:
+        """Initialize the mock server."""
+        self._corpora = corpora if corpora is not None else load_corpora()
+        self.config = config or MockConfig()
+        self._random = random.Random(self.config.seed)
+        self._runner: web.AppRunner | None = None
+        self._base_url = ""
+        self._tokens: dict[str, float] = {}
+        self._injected: list[list[Any]] = []
+        self.devices: dict[str, MockDevice] = {}
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.app = self._create_app()
+
+    @property
+    def base_url(self) -> str:
+        """Return the server base url."""
+        return self._base_url
+
+    @property
+    def gateway_url(self) -> str:
+        """Return the gateway url to use as client `gateway_url`."""
+        return f"{self._base_url}{GATEWAY_PATH}"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start the server, a free port is used if `port` is 0."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self._base_url = f"http://{host}:{bound_port}"
+        self._create_fleet()
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockThinQServer:
+        """Start the server as context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Stop the server on context exit."""
+        await self.stop()
+
+    def inject_error(self, path: str, code: str | int, count: int = 1) -> None:
+        """Return `code` for the next `count` requests whose path contains `path`."""
+        self._injected.append([path, code, count])
+
+    def expire_tokens(self) -> None:
+        """Invalidate all the issued access tokens."""
+        self._tokens.clear()
+
+    def _create_fleet(self) -> None:
+        """Create the simulated devices from the fixtures."""
+        self.devices.clear()
+        if not self._corpora:
+            return
+        size = self.config.fleet_size or len(self._corpora)
+        for index in range(size):
+            corpus = self._corpora[index % len(self._corpora)]
+            device = MockDevice(
+                corpus, index, f"{self._base_url}/model/{corpus.name}.json"
+            )
+            self.devices[device.device_id] = device
+
+    def _create_app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(GATEWAY_PATH, self._gateway)
+        app.router.add_post("/oauth/1.0/oauth2/token", self._oauth_token)
+        app.router.add_get("/users/profile", self._user_profile)
+        app.router.add_get("/model/{name}.json", self._model_info)
+        app.router.add_get("/lang/common.json", self._lang_pack)
+        app.router.add_get(f"{V2_ROOT}/service/application/dashboard", self._dashboard)
+        app.router.add_get(f"{V2_ROOT}/service/devices/{{device_id}}", self._device)
+        app.router.add_post(
+            f"{V2_ROOT}/service/devices/{{device_id}}/{{ctrl_path}}", self._control
+        )
+        app.router.add_post(f"{V1_ROOT}/rti/rtiMon", self._rti_mon)
+        app.router.add_post(f"{V1_ROOT}/rti/rtiResult", self._rti_result)
+        app.router.add_post(f"{V1_ROOT}/rti/rtiControl", self._rti_control)
+        app.router.add_post(f"{V1_ROOT}/rti/delControlPermission", self._rti_ack)
+        return app
+
+    def _next_error(self, path: str) -> str | int | None:
+        """Return the error to inject for a request, if any."""
+        for injected in self._injected:
+            inj_path, code, count = injected
+            if inj_path in path:
+                if count <= 1:
+                    self._injected.remove(injected)
+                else:
+                    injected[2] = count - 1
+                return code
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return self._random.choice(self.config.error_codes)
+        return None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Add latency and error injection to all requests."""
+        route = request.match_info.route.resource
+        name = route.canonical if route else request.path
+        self.requests[name] += 1
+
+        if delay := self.config.latency + self._random.random() * self.config.jitter:
+            await asyncio.sleep(delay)
+
+        if (code := self._next_error(request.path)) is not None:
+            self.errors[name] += 1
+            if isinstance(code, int):
+                return web.Response(status=code, text="Mock injected error")
+            if request.path.startswith(V1_ROOT):
+                return self._v1_result(code)
+            return self._v2_result(code=code)
+
+        return await handler(request)
+
+    @staticmethod
+    def _v2_result(result: Any = None, code: str = RESULT_OK) -> web.Response:
+        """Return a response in the APIv2 format."""
+        if code != RESULT_OK:
+            return web.json_response({"resultCode": code, "result": "Mock error"})
+        return web.json_response({"resultCode": code, "result": result})
+
+    @staticmethod
+    def _v1_result(code: str = RESULT_OK, **kwargs: Any) -> web.Response:
+        """Return a response in the APIv1 format."""
+        msg = {"returnCd": code}
+        if code != RESULT_OK:
+            msg["returnMsg"] = "Mock error"
+        return web.json_response({"lgedmRoot": {**msg, **kwargs}})
+
+    def _check_token(self, request: web.Request) -> bool:
+        """Check that the request has a valid access token."""
+        token = request.headers.get("x-emp-token")
+        return self._tokens.get(token, 0) > time.monotonic()
+
+    async def _gateway(self, request: web.Request) -> web.Response:
+        """Return the gateway information."""
+        base = self._base_url
+        return self._v2_result(
+            {
+                "countryCode": request.headers.get("x-country-code"),
+                "languageCode": request.headers.get("x-language-code"),
+                "thinq1Uri": f"{base}{V1_ROOT}",
+                "thinq2Uri": f"{base}{V2_ROOT}",
+                "empUri": base,
+                "empTermsUri": base,
+                "oauthUri": base,
+                "empSpxUri": base,
+                "empOauthBaseUri": base,
+                "langPackCommonUri": f"{base}/lang/common.json",
+            }
+        )
+
+    async def _oauth_token(self, request: web.Request) -> web.Response:
+        """Issue a new access token."""
+        data = await request.post()
+        if data.get("refresh_token") != MOCK_REFRESH_TOKEN and not data.get("code"):
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        access_token = uuid.uuid4().hex
+        validity = self.config.token_validity
+        self._tokens[access_token] = time.monotonic() + validity
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "expires_in": str(validity),
+                "refresh_token": MOCK_REFRESH_TOKEN,
+            }
+        )
+
+    async def _user_profile(self, request: web.Request) -> web.Response:
+        """Return the user profile."""
+        return web.json_response({"status": 1, "account": {"userNo": MOCK_USER_NUMBER}})
+
+    async def _model_info(self, request: web.Request) -> web.Response:
+        """Return the model info of a fixture."""
+        name = request.match_info["name"]
+        for corpus in self._corpora:
+            if corpus.name == name:
+                return web.json_response(corpus.model_info)
+        raise web.HTTPNotFound()
+
+    async def _lang_pack(self, request: web.Request) -> web.Response:
+        """Return the common lang pack."""
+        return web.json_response({"pack": {}})
+
+    async def _dashboard(self, request: web.Request) -> web.Response:
+        """Return the devices dashboard."""
+        if not self._check_token(request):
+            return self._v2_result(code=RESULT_NOT_LOGGED_IN)
+        return self._v2_result(
+            {
+                "item": [device.info for device in self.devices.values()],
+                "langPackCommonUri": f"{self._base_url}/lang/common.json",
+            }
+        )
+
+    async def _device(self, request: web.Request) -> web.Response:
+        """Return a device status."""
+        if not self._check_token(request):
+            return self._v2_result(code=RESULT_NOT_LOGGED_IN)
+        if not (device := self.devices.get(request.match_info["device_id"])):
+            return self._v2_result(code=RESULT_DEVICE_NOT_FOUND)
+        return self._v2_result(device.info)
+
+    async def _control(self, request: web.Request) -> web.Response:
+        """Execute a ThinQ2 control command."""
+        if not self._check_token(request):
+            return self._v2_result(code=RESULT_NOT_LOGGED_IN)
+        if not (device := self.devices.get(request.match_info["device_id"])):
+            return self._v2_result(code=RESULT_DEVICE_NOT_FOUND)
+        if not device.online:
+            return self._v2_result(code=RESULT_NOT_CONNECTED)
+        payload = await request.json()
+        if "dataKeyList" in payload:
+            device.apply_control(payload["dataKeyList"], payload["dataValueList"])
+        elif "dataKey" in payload:
+            device.apply_control([payload["dataKey"]], [payload.get("dataValue")])
+        return self._v2_result({})
+
+    async def _v1_device(self, request: web.Request) -> tuple[dict, MockDevice | None]:
+        """Return the APIv1 request payload and the target device."""
+        payload = (await request.json()).get("lgedmRoot", {})
+        return payload, self.devices.get(payload.get("deviceId"))
+
+    async def _rti_mon(self, request: web.Request) -> web.Response:
+        """Start or stop a ThinQ1 monitor session."""
+        if not self._check_token(request):
+            return self._v1_result(RESULT_NOT_LOGGED_IN)
+        payload, device = await self._v1_device(request)
+        if not device:
+            return self._v1_result(RESULT_DEVICE_NOT_FOUND)
+        if payload.get("cmdOpt") == "Start":
+            device.work_id = payload.get("workId") or uuid.uuid4().hex
+        else:
+            device.work_id = None
+        return self._v1_result(workId=payload.get("workId"))
+
+    async def _rti_result(self, request: web.Request) -> web.Response:
+        """Return the result of a ThinQ1 monitor session."""
+        if not self._check_token(request):
+            return self._v1_result(RESULT_NOT_LOGGED_IN)
+        work_list = (await request.json()).get("lgedmRoot", {}).get("workList", [])
+        work = work_list[0] if work_list else {}
+        result = {"deviceId": work.get("deviceId"), "workId": work.get("workId")}
+        device = self.devices.get(work.get("deviceId"))
+        if not device or not device.online:
+            result["returnCode"] = RESULT_NOT_CONNECTED
+        elif device.work_id != work.get("workId"):
+            result["returnCode"] = RESULT_DEVICE_NOT_FOUND
+        else:
+            result["returnCode"] = RESULT_OK
+            if data := device.monitor_data:
+                result["returnData"] = data
+        return self._v1_result(workList=result)
+
+    async def _rti_control(self, request: web.Request) -> web.Response:
+        """Execute a ThinQ1 control command."""
+        if not self._check_token(request):
+            return self._v1_result(RESULT_NOT_LOGGED_IN)
+        payload, device = await self._v1_device(request)
+        if not device:
+            return self._v1_result(RESULT_DEVICE_NOT_FOUND)
+        if not device.online:
+            return self._v1_result(RESULT_NOT_CONNECTED)
+        return self._v1_result(workId=payload.get("workId"), returnData="")
+
+    async def _rti_ack(self, request: web.Request) -> web.Response:
+        """Acknowledge a ThinQ1 request."""
+        if not self._check_token(request):
+            return self._v1_result(RESULT_NOT_LOGGED_IN)
+        return self._v1_result()
@@ -6,6 +6,7 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from homeassistant import config_entries, data_entry_flow
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     CONF_BASE,
     CONF_CLIENT_ID,
@@ -16,11 +17,14 @@ from homeassistant.const import (
 )
 
 from custom_components.smartthinq_sensors.const import (
+    CONF_ENTITY_PROFILE,
     CONF_LANGUAGE,
     CONF_OAUTH2_URL,
     CONF_USE_API_V2,
     CONF_USE_REDIRECT,
+    DEFAULT_ENTITY_PROFILE,
     DOMAIN,
+    ENTITY_PROFILE_MINIMAL,
 )
 from custom_components.smartthinq_sensors.wideq.core_exceptions import (
     AuthenticationError,
@@ -31,6 +35,7 @@ TEST_USER = "test-email@test-domain.com"
 TEST_TOKEN = "test-token"
 TEST_URL = "test-url"
 TEST_CLIENT_ID = "abcde"
+TEST_USER_NUMBER = "12345"
 
 CONFIG_DATA = {
     CONF_USERNAME: TEST_USER,
@@ -56,6 +61,7 @@ class MockClient:
         """Initialize a fake client to test config flow."""
         self.has_devices = has_devices
         self.client_id = TEST_CLIENT_ID
+        self.user_number = TEST_USER_NUMBER
 
     async def close(self):
         """Fake close method."""
@@ -99,9 +105,57 @@ async def test_form(hass, connect):
 
     assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
     assert result2["data"] == CONFIG_RESULT
+    assert result2["result"].unique_id == TEST_USER_NUMBER
     assert len(mock_setup_entry.mock_calls) == 1
 
 
+async def test_form_second_account(hass, connect):
+    """Test a different account is added as a new entry."""
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN, data=CONFIG_RESULT, unique_id="other-user-number"
+    )
+    mock_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+
+    with PATCH_SETUP_ENTRY:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=CONFIG_DATA
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 2
+
+
+@pytest.mark.parametrize("unique_id", [TEST_USER_NUMBER, None])
+async def test_form_already_configured(hass, connect, unique_id):
+    """Test a loaded entry for the same or an unknown account is not added again."""
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=CONFIG_RESULT,
+        unique_id=unique_id,
+        state=ConfigEntryState.LOADED,
+    )
+    mock_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with PATCH_SETUP_ENTRY:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=CONFIG_DATA
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result2["reason"] == "already_configured"
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 1
+
+
 @pytest.mark.parametrize(
     "error,reason",
     [
@@ -174,3 +228,25 @@ async def test_token_refresh(hass, connect):
 
     entry = entries[0]
     assert entry.data[CONF_TOKEN] == TEST_TOKEN
+    assert entry.unique_id == TEST_USER_NUMBER
+
+
+async def test_options_flow(hass):
+    """Test the entity profile option is stored in the entry options."""
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN, data=CONFIG_RESULT, unique_id=TEST_USER_NUMBER
+    )
+    mock_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_entry.entry_id)
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+    schema = result["data_schema"]({})
+    assert schema[CONF_ENTITY_PROFILE] == DEFAULT_ENTITY_PROFILE
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_ENTITY_PROFILE: ENTITY_PROFILE_MINIMAL}
+    )
+
+    assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert mock_entry.options == {CONF_ENTITY_PROFILE: ENTITY_PROFILE_MINIMAL}
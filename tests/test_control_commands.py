@@ -0,0 +1,330 @@
+"""Test the refrigerator, hood and microwave control command payloads."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from copy import deepcopy
+from datetime import time
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from .benchmarks.corpus import (
+    DeviceCorpus,
+    async_build_devices,
+    decode_payload,
+    load_corpora,
+    status_class,
+)
+from custom_components.smartthinq_sensors.wideq.devices import hood, microwave
+from custom_components.smartthinq_sensors.wideq.devices.refrigerator import (
+    CMD_STATE_ECO_FRIENDLY,
+    CMD_STATE_EXPRESS_FRIDGE,
+    CMD_STATE_EXPRESS_MODE,
+    CMD_STATE_FREEZER_TEMP,
+    CMD_STATE_FRIDGE_TEMP,
+    CMD_STATE_ICE_PLUS,
+    REFR_ROOT_DATA,
+    RefrigeratorDevice,
+)
+
+REFR_CMD_KEYS = [
+    CMD_STATE_ECO_FRIENDLY,
+    CMD_STATE_EXPRESS_FRIDGE,
+    CMD_STATE_EXPRESS_MODE,
+    CMD_STATE_FREEZER_TEMP,
+    CMD_STATE_FRIDGE_TEMP,
+    CMD_STATE_ICE_PLUS,
+]
+
+# control sections added to the fixtures, the ThinQ1 model use binary data
+# and the ThinQ2 device with a V1 model use a JSON value with a missing slot
+CONTROL_EXTENSIONS = {
+    "refrigerator_thinq1": {
+        "type": "BINARY(BYTE)",
+        "action": {
+            "SetControl": {
+                "cmd": "Control",
+                "cmdOpt": "Set",
+                "value": "ControlData",
+                "data": "[{{TempRefrigerator}},{{TempFreezer}},255,{{IcePlus}},255]",
+                "encode": True,
+            },
+        },
+    },
+    "refrigerator_thinq2": {
+        "type": "JSON",
+        "action": {
+            "SetControl": {
+                "cmd": "Control",
+                "cmdOpt": "Set",
+                "value": json.dumps(
+                    {
+                        "TempRefrigerator": "{{TempRefrigerator_C}}",
+                        "TempFreezer": "{{TempFreezer_C}}",
+                        "IcePlus": "{{IcePlus}}",
+                        "EcoFriendly": "{{EcoFriendly}}",
+                        "Unknown": "{{NotInStatus}}",
+                    }
+                ),
+            },
+        },
+    },
+}
+
+REFR_V2_MODEL = {
+    "Info": {"productType": "REF", "modelType": "REF", "model": "REF_0012"},
+    "MonitoringValue": {
+        "fridgeTemp": {"dataType": "range", "valueMapping": {"min": 1, "max": 7}},
+        "freezerTemp": {
+            "dataType": "range",
+            "valueMapping": {"min": -23, "max": -15},
+        },
+        "tempUnit": {
+            "dataType": "enum",
+            "valueMapping": {
+                "CELSIUS": {"index": "0", "label": "CELSIUS"},
+                "FAHRENHEIT": {"index": "1", "label": "FAHRENHEIT"},
+            },
+        },
+        "expressMode": {
+            "dataType": "enum",
+            "valueMapping": {
+                "OFF": {"index": "0", "label": "@CP_OFF_EN_W"},
+                "ON": {"index": "1", "label": "@CP_ON_EN_W"},
+            },
+        },
+        "ecoFriendly": {
+            "dataType": "enum",
+            "valueMapping": {
+                "OFF": {"index": "0", "label": "@CP_OFF_EN_W"},
+                "ON": {"index": "1", "label": "@CP_ON_EN_W"},
+            },
+        },
+    },
+    "ControlWifi": {
+        "basicCtrl": {
+            "command": "Set",
+            "ctrlKey": "basicCtrl",
+            "data": {
+                REFR_ROOT_DATA: {
+                    "fridgeTemp": "IGNORE",
+                    "freezerTemp": "IGNORE",
+                    "expressMode": "IGNORE",
+                    "ecoFriendly": "IGNORE",
+                },
+            },
+        },
+        "expressCtrl": {"command": "Set", "ctrlKey": "expressCtrl"},
+    },
+}
+
+
+def _refrigerator_corpora() -> list[DeviceCorpus]:
+    """Return the refrigerator payloads with a control section in the model."""
+    corpora = []
+    for corpus in load_corpora():
+        if not (extension := CONTROL_EXTENSIONS.get(corpus.name)):
+            continue
+        corpus.model_info = {**corpus.model_info, "ControlWifi": deepcopy(extension)}
+        corpora.append(corpus)
+        if corpus.name == "refrigerator_thinq2":
+            v2_corpus = deepcopy(corpus)
+            v2_corpus.name = f"{corpus.name}_v2"
+            v2_corpus.model_info = deepcopy(REFR_V2_MODEL)
+            corpora.append(v2_corpus)
+    return corpora
+
+
+REFR_CORPORA = _refrigerator_corpora()
+
+# the lamp and vent levels are range values in the models with these controls
+LEVEL_EXTENSIONS = {
+    "hood_thinq2": {
+        "LampLevel": {"type": "Range", "option": {"min": 0, "max": 2}},
+        "VentLevel": {"type": "Range", "option": {"min": 0, "max": 3}},
+    },
+    "microwave_thinq2": {
+        "MwoLampLevel": {"type": "Range", "option": {"min": 0, "max": 2}},
+        "MwoVentSpeedLevel": {"type": "Range", "option": {"min": 0, "max": 5}},
+    },
+}
+
+
+def _state_corpora() -> list[DeviceCorpus]:
+    """Return the hood and microwave payloads with range levels in the model."""
+    corpora = []
+    for corpus in load_corpora():
+        if not (extension := LEVEL_EXTENSIONS.get(corpus.name)):
+            continue
+        model_info = deepcopy(corpus.model_info)
+        model_info["Value"].update(deepcopy(extension))
+        corpus.model_info = model_info
+        corpora.append(corpus)
+    return corpora
+
+
+STATE_CORPORA = _state_corpora()
+
+
+def _legacy_control_cmd(model_data: dict, is_info_v2: bool, cmd_key, ctrl_key):
+    """Return the command as built by the old get_control_cmd."""
+    if "ControlWifi" not in model_data:
+        return None
+    if is_info_v2:
+        control_data = model_data["ControlWifi"].get(cmd_key)
+    else:
+        control_data = model_data["ControlWifi"].get("action", {}).get(cmd_key)
+    if not control_data:
+        return None
+    control = deepcopy(control_data)
+    if ctrl_key:
+        control["ctrlKey" if is_info_v2 else "cmd"] = ctrl_key
+    return control
+
+
+def _legacy_refrigerator_v1(device: RefrigeratorDevice, cmd: dict, key, value):
+    """Return the ThinQ1 command as built by the old refrigerator builder."""
+    data_key = "value"
+    if cmd.get(data_key, "") == "ControlData":
+        data_key = "data"
+    str_data = cmd.get(data_key)
+
+    if str_data:
+        status_data = device.status.as_dict
+        for dt_key, dt_value in status_data.items():
+            if dt_key == key:
+                dt_value = value
+            str_data = str_data.replace(f"{{{{{dt_key}}}}}", dt_value)
+
+        json_data = json.loads(str_data)
+        if device.model_info.binary_control_data:
+            cmd["format"] = "B64"
+            json_data = base64.b64encode(bytes(json_data)).decode("ascii")
+        cmd[data_key] = json_data
+
+    return cmd
+
+
+def _legacy_refrigerator_v2(cmd: dict, key, value):
+    """Return the ThinQ2 command as built by the old refrigerator builder."""
+    data_set = cmd.pop("data", None)
+    if not data_set:
+        data_set = {REFR_ROOT_DATA: {key: value}}
+    else:
+        for cmd_key in data_set[REFR_ROOT_DATA].keys():
+            data_set[REFR_ROOT_DATA][cmd_key] = value if cmd_key == key else "IGNORE"
+    cmd["dataSetList"] = data_set
+
+    return cmd
+
+
+def _legacy_state_command(cmd_key: dict, state_key: str, full_cmd: dict, command):
+    """Return the command as built by the old hood and microwave builders."""
+    cmd = deepcopy(cmd_key)
+    def_cmd = cmd[hood.KEY_DATASET].get(state_key, {})
+    cmd[hood.KEY_DATASET][state_key] = {**def_cmd, **full_cmd, **command}
+    return cmd
+
+
+def _build_device(corpus: DeviceCorpus):
+    """Return the device of a payload with the payload status applied."""
+    device = asyncio.run(async_build_devices(corpus))[0]
+    data = decode_payload(device, corpus)
+    assert data
+    device._apply_status(status_class(device), data)
+    return device
+
+
+def _refrigerator_value(device: RefrigeratorDevice, key: str) -> str:
+    """Return a value to set for a key, different from the current status."""
+    if (value := device.model_info.value(key)) and hasattr(value, "options"):
+        return list(value.options)[-1]
+    return "1"
+
+
+@pytest.mark.parametrize("corpus", REFR_CORPORA, ids=lambda corpus: corpus.name)
+def test_refrigerator_command(corpus: DeviceCorpus):
+    """Test the refrigerator payloads are the ones of the old builder."""
+    device = _build_device(corpus)
+    assert isinstance(device, RefrigeratorDevice)
+    model_data = deepcopy(corpus.model_info)
+    is_info_v2 = device.model_info.is_info_v2
+    commands = model_data["ControlWifi"]
+    if not is_info_v2:
+        commands = commands["action"]
+
+    cases = 0
+    for cmd_keys in REFR_CMD_KEYS:
+        ctrl_key, _, key = device._get_cmd_keys(cmd_keys)
+        if not key:
+            continue
+        value = _refrigerator_value(device, key)
+        for command in commands:
+            payload = device._prepare_command(ctrl_key, command, key, value)
+            expected = _legacy_control_cmd(model_data, is_info_v2, command, ctrl_key)
+            if is_info_v2:
+                expected = _legacy_refrigerator_v2(expected, key, value)
+            else:
+                expected = _legacy_refrigerator_v1(device, expected, key, value)
+            assert payload == expected, (command, key)
+
+            # the payloads never share the template data
+            payload.get("dataSetList", {}).get(REFR_ROOT_DATA, {}).clear()
+            assert device._prepare_command(ctrl_key, command, key, value) == expected
+            cases += 1
+
+    assert cases >= len(commands) * 3
+    assert device._prepare_command("Control", "NoCommand", "IcePlus", "1") is None
+    assert corpus.model_info == model_data
+
+
+@pytest.mark.parametrize("corpus", STATE_CORPORA, ids=lambda corpus: corpus.name)
+def test_hood_microwave_command(corpus: DeviceCorpus):
+    """Test the hood and microwave payloads are the ones of the old builder."""
+    device = _build_device(corpus)
+    device.set = AsyncMock()
+    if isinstance(device, hood.HoodDevice):
+        module, state_key = hood, hood.KEY_HOODSTATE
+        cmd_dicts, ventlamp = hood.HOOD_CMD, device._prepare_command_ventlamp_v2
+        setters = []
+    else:
+        assert isinstance(device, microwave.MicroWaveDevice)
+        module, state_key = microwave, microwave.KEY_OVENSTATE
+        cmd_dicts, ventlamp = microwave.MW_CMD, device._prepare_command_ventlamp
+        setters = [
+            device.set_clock_display(True),
+            device.set_clock_display(False),
+            device.set_sound(False),
+            device.set_time(time(10, 25, 30)),
+            *(device.set_defrost_weight_unit(u) for u in device.defrost_weight_units),
+            *(
+                device.set_display_scroll_speed(speed)
+                for speed in device.display_scroll_speeds
+            ),
+        ]
+    setters.extend(device.set_light_mode(mode) for mode in device.light_modes)
+    setters.extend(device.set_vent_speed(speed) for speed in device.vent_speeds)
+    assert not device._should_poll
+    default_cmds = deepcopy(cmd_dicts)
+
+    async def _set_all():
+        for setter in setters:
+            await setter
+            ctrl_key, command = device.set.await_args.args
+            payload = device._prepare_command(ctrl_key, command, None, None)
+            full_cmd = ventlamp() if ctrl_key == module.CMD_SET_VENTLAMP else {}
+            expected = _legacy_state_command(
+                default_cmds[ctrl_key], state_key, full_cmd, command
+            )
+            assert payload == expected, command
+
+            # the payloads never share the default command
+            payload[hood.KEY_DATASET][state_key].clear()
+            assert cmd_dicts == default_cmds
+
+    asyncio.run(_set_all())
+    assert device.set.await_count == len(setters) > 6
+    assert device._prepare_command("NoCommand", {}, None, None) is None
@@ -0,0 +1,112 @@
+"""Test the ThinQ client."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.smartthinq_sensors.wideq.core_async import ClientAsync
+from custom_components.smartthinq_sensors.wideq.core_exceptions import (
+    InvalidCredentialError,
+)
+from custom_components.smartthinq_sensors.wideq.core_util import (
+    MAX_ACCOUNT_FAILURES,
+    HealthState,
+)
+from custom_components.smartthinq_sensors.wideq.model_store import ModelStore
+
+
+def _down_client() -> ClientAsync:
+    """Return a client with the account connection down."""
+    auth = MagicMock()
+    auth.refresh = AsyncMock(return_value=auth)
+    client = ClientAsync(auth, model_store=ModelStore())
+    client._reconnect = AsyncMock()
+    for _ in range(MAX_ACCOUNT_FAILURES):
+        client.health.report_failure()
+    # the first probe is allowed immediately
+    client.health._next_probe = 0.0
+    assert client.health.is_down
+    return client
+
+
+async def test_ensure_connected_probe():
+    """Test the account is probed with a single token refresh."""
+    client = _down_client()
+
+    assert await client.ensure_connected()
+    client.auth.refresh.assert_awaited_once_with(True)
+    client._reconnect.assert_not_awaited()
+    assert client.health.state == HealthState.HEALTHY
+
+
+async def test_ensure_connected_probe_failed():
+    """Test a failed probe keeps the polling paused."""
+    client = _down_client()
+    client.auth.refresh.side_effect = TimeoutError
+
+    assert not await client.ensure_connected()
+    assert client.health.state == HealthState.DOWN
+    assert not await client.ensure_connected()
+    client.auth.refresh.assert_awaited_once()
+
+
+async def test_ensure_connected_invalid_credential():
+    """Test an invalid credential error of the probe is raised."""
+    client = _down_client()
+    client.auth.refresh.side_effect = InvalidCredentialError("0110")
+
+    with pytest.raises(InvalidCredentialError):
+        await client.ensure_connected()
+    assert client.health.state == HealthState.DOWN
+
+
+def _dashboard_device(device_id: str, alias: str, timestamp: float) -> dict:
+    """Return the dashboard data of a device."""
+    return {
+        "deviceId": device_id,
+        "alias": alias,
+        "snapshot": {"timestamp": timestamp * 1000, "state": alias},
+    }
+
+
+async def test_device_info_refresh():
+    """Test the DeviceInfo objects are updated in place by a dashboard refresh."""
+    client = ClientAsync(MagicMock(), model_store=ModelStore())
+    client._session = MagicMock()
+    now = time.time()
+    client._session.get_devices = AsyncMock(
+        return_value=[
+            _dashboard_device("dev-1", "Washer", now - 600),
+            _dashboard_device("dev-2", "Dryer", now - 600),
+        ]
+    )
+    await client._load_devices()
+    device_info = client.get_device("dev-1")
+    other_info = client.get_device("dev-2")
+    assert device_info.snapshot_age == pytest.approx(600, abs=5)
+
+    snapshot_listener = MagicMock()
+    client.add_snapshot_listener("dev-1", snapshot_listener)
+    client._session.get_devices.return_value = [
+        _dashboard_device("dev-1", "New washer", now),
+        _dashboard_device("dev-2", "Dryer", now - 600),
+    ]
+    await client._load_devices(force_update=True)
+
+    assert client.get_device("dev-1") is device_info
+    assert client.get_device("dev-2") is other_info
+    assert device_info.name == "New washer"
+    assert device_info.snapshot["state"] == "New washer"
+    assert device_info.snapshot_age == pytest.approx(0, abs=5)
+    snapshot_listener.assert_called_once_with(device_info)
+
+    client._session.get_devices.return_value = [
+        _dashboard_device("dev-1", "New washer", now)
+    ]
+    await client._load_devices(force_update=True)
+    assert client.get_device("dev-1") is device_info
+    assert client.get_device("dev-2") is None
+    snapshot_listener.assert_called_once()
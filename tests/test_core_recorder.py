@@ -0,0 +1,169 @@
+"""Test the ThinQ traffic recorder and replay session."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.smartthinq_sensors.wideq.core_recorder import (
+    REDACTED,
+    ReplaySession,
+    TrafficRecorder,
+    pseudonym,
+    redact_url,
+)
+
+DEVICE_ID = "6f2e1c3a-8b4d-4e5f-9a0b-1c2d3e4f5a6b"
+OTHER_DEVICE_ID = "0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d"
+HOME_ID = "home-98765"
+BASE_URL = "https://aic-service.lgthinq.com:46030/v1/"
+
+SECRETS = {
+    "access_token": "secret-access-token",
+    "refresh_token": "secret-refresh-token",
+    "token": "secret-token",
+    "userNo": "US2109876543210",
+    "macAddress": "a4:36:c7:12:34:56",
+    "serialNo": "901KWAB123456",
+    "ssid": "my-home-wifi",
+}
+
+
+def _control_url(device_id: str) -> str:
+    """Return the control url of a device."""
+    return f"{BASE_URL}service/devices/{device_id}/control-sync"
+
+
+async def _record(path, *requests) -> str:
+    """Record the requests and return the content of the recording."""
+    recorder = TrafficRecorder(str(path))
+    for method, url, data, response in requests:
+        await recorder.record(method, url, data, 200, response, 0.1)
+    return path.read_text(encoding="utf-8")
+
+
+def test_redact_url():
+    """Test the ids in the path and the query values are not kept."""
+    url = f"{BASE_URL}service/homes/{HOME_ID}?token=abc&deviceId={DEVICE_ID}"
+    redacted = redact_url(url)
+    assert HOME_ID not in redacted
+    assert DEVICE_ID not in redacted
+    assert "abc" not in redacted
+    assert redacted.startswith("https://aic-service.lgthinq.com:46030/v1/")
+    assert f"service/homes/{pseudonym(HOME_ID)}" in redacted
+    assert redact_url(redacted) == redacted
+
+    redacted = redact_url(f"{BASE_URL}service/{DEVICE_ID.upper()}/info")
+    assert redacted == f"{BASE_URL}service/{pseudonym(DEVICE_ID.upper())}/info"
+    assert redact_url(f"{BASE_URL}service/application/dashboard") == (
+        f"{BASE_URL}service/application/dashboard"
+    )
+
+
+def test_pseudonym():
+    """Test the pseudonyms are stable, distinct and not changed again."""
+    assert pseudonym(DEVICE_ID) == pseudonym(DEVICE_ID)
+    assert pseudonym(DEVICE_ID) != pseudonym(OTHER_DEVICE_ID)
+    assert pseudonym(pseudonym(DEVICE_ID)) == pseudonym(DEVICE_ID)
+    assert DEVICE_ID not in pseudonym(DEVICE_ID)
+
+
+async def test_record_redacted(tmp_path):
+    """Test the sensitive values never reach the recording file."""
+    content = await _record(
+        tmp_path / "traffic.jsonl",
+        (
+            "POST",
+            f"{_control_url(DEVICE_ID)}?token={SECRETS['token']}",
+            {
+                "ctrlKey": "basicCtrl",
+                "deviceId": DEVICE_ID,
+                "auth": {"token": SECRETS["token"], "userNo": SECRETS["userNo"]},
+            },
+            {"resultCode": "0000", "result": {"userNo": SECRETS["userNo"]}},
+        ),
+        (
+            "GET",
+            f"{BASE_URL}service/application/dashboard",
+            None,
+            {
+                "resultCode": "0000",
+                "result": {
+                    "item": [
+                        {
+                            "deviceId": DEVICE_ID,
+                            "macAddress": SECRETS["macAddress"],
+                            "ssid": SECRETS["ssid"],
+                            "snapshot": {"serialNo": SECRETS["serialNo"]},
+                        }
+                    ]
+                },
+            },
+        ),
+        (
+            "POST",
+            "https://us.lgeapi.com/oauth/1.0/oauth2/token",
+            {"grant_type": "refresh_token", "refresh_token": SECRETS["refresh_token"]},
+            {"access_token": SECRETS["access_token"], "expires_in": "3600"},
+        ),
+    )
+
+    for value in [*SECRETS.values(), DEVICE_ID]:
+        assert value not in content
+    records = [json.loads(line) for line in content.splitlines()]
+    assert len(records) == 3
+    assert records[0]["data"]["auth"]["token"] == REDACTED
+    assert records[0]["data"]["deviceId"] == pseudonym(DEVICE_ID)
+    assert records[1]["body"]["result"]["item"][0]["macAddress"] == REDACTED
+    assert records[2]["data"]["grant_type"] == "refresh_token"
+
+
+async def test_replay_redacted_requests(tmp_path):
+    """Test the replay matches the live requests with the redacted recordings."""
+    path = tmp_path / "traffic.jsonl"
+    await _record(
+        path,
+        (
+            "POST",
+            f"{_control_url(DEVICE_ID)}?token={SECRETS['token']}",
+            {"ctrlKey": "basicCtrl", "value": "1", "workId": "work-1"},
+            {"resultCode": "0000", "result": {"device": 1}},
+        ),
+        (
+            "POST",
+            _control_url(OTHER_DEVICE_ID),
+            {"ctrlKey": "basicCtrl", "value": "1"},
+            {"resultCode": "0000", "result": {"device": 2}},
+        ),
+        (
+            "POST",
+            f"{BASE_URL}rti/rtiMon",
+            {"cmd": "Mon", "deviceId": DEVICE_ID, "token": SECRETS["token"]},
+            {"lgedmRoot": {"workId": "work-2"}},
+        ),
+    )
+    session = ReplaySession(str(path))
+
+    async with session.post(
+        f"{_control_url(DEVICE_ID)}?token=new-token",
+        json={"ctrlKey": "basicCtrl", "value": "1", "workId": "work-9"},
+    ) as resp:
+        assert resp.status == 200
+        assert (await resp.json())["result"] == {"device": 1}
+
+    # the device ids returned by the recording are matched as well
+    async with session.post(
+        _control_url(pseudonym(OTHER_DEVICE_ID)),
+        json={"ctrlKey": "basicCtrl", "value": "1"},
+    ) as resp:
+        assert (await resp.json())["result"] == {"device": 2}
+
+    async with session.post(
+        f"{BASE_URL}rti/rtiMon",
+        json={"cmd": "Mon", "deviceId": DEVICE_ID, "token": "other-token"},
+    ) as resp:
+        assert (await resp.json()) == {"lgedmRoot": {"workId": "work-2"}}
+
+    async with session.post(
+        _control_url(DEVICE_ID), json={"ctrlKey": "basicCtrl", "value": "2"}
+    ) as resp:
+        assert resp.status == 404
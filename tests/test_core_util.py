@@ -0,0 +1,214 @@
+"""Test the ThinQ client helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from custom_components.smartthinq_sensors.wideq import core_util
+from custom_components.smartthinq_sensors.wideq.core_util import (
+    ClientHealth,
+    HealthState,
+    PollScheduler,
+)
+
+POLL_INTERVAL = 3600
+
+
+class FakeTime:
+    """A monotonic clock moved forward by the tests."""
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def _fake_time(monkeypatch) -> FakeTime:
+    """Replace the clock used by the scheduler."""
+    fake_time = FakeTime()
+    monkeypatch.setattr(core_util, "time", fake_time)
+    return fake_time
+
+
+async def test_poll_scheduler_run(monkeypatch):
+    """Test a task runs at its slot and then waits for its next slot."""
+    fake_time = _fake_time(monkeypatch)
+    scheduler = PollScheduler()
+    target = AsyncMock()
+
+    scheduler.register("dev-1")
+    offset = scheduler._slot_offset("dev-1", POLL_INTERVAL)
+    assert not await scheduler.run("dev-1", POLL_INTERVAL, target)
+    fake_time.now += offset
+    assert scheduler.is_due("dev-1", POLL_INTERVAL)
+    assert await scheduler.run("dev-1", POLL_INTERVAL, target)
+    target.assert_awaited_once()
+    assert not scheduler.is_due("dev-1", POLL_INTERVAL)
+
+    fake_time.now += POLL_INTERVAL - 1
+    assert not await scheduler.run("dev-1", POLL_INTERVAL, target)
+    fake_time.now += 1
+    assert await scheduler.run("dev-1", POLL_INTERVAL, target)
+    stats = scheduler.as_dict("dev-1")
+    assert stats["runs"] == 2
+    assert stats["errors"] == 0
+
+
+def test_poll_scheduler_first_run(monkeypatch):
+    """Test the keys registered together do not all run on the first tick."""
+    fake_time = _fake_time(monkeypatch)
+    scheduler = PollScheduler()
+    keys = [f"dev-{idx}" for idx in range(20)]
+
+    due = [key for key in keys if scheduler.is_due(key, POLL_INTERVAL)]
+    assert len(due) <= 1
+
+    due_times = set()
+    for step in range(POLL_INTERVAL):
+        fake_time.now += 1
+        for key in keys:
+            if key not in due and scheduler.is_due(key, POLL_INTERVAL):
+                due.append(key)
+                due_times.add(step)
+    assert sorted(due) == sorted(keys)
+    assert len(due_times) > len(keys) // 2
+
+
+async def test_poll_scheduler_force():
+    """Test a forced task runs when not due and then waits for its slot."""
+    scheduler = PollScheduler()
+    target = AsyncMock()
+
+    assert await scheduler.run("dev-1", POLL_INTERVAL, target, force=True)
+    target.assert_awaited_once()
+    assert not scheduler.is_due("dev-1", POLL_INTERVAL)
+
+
+async def test_poll_scheduler_error():
+    """Test a failing task is counted and scheduled to its next slot."""
+    scheduler = PollScheduler()
+    target = AsyncMock(side_effect=ValueError("poll failed"))
+
+    assert await scheduler.run("dev-1", POLL_INTERVAL, target, force=True)
+    assert not scheduler.is_due("dev-1", POLL_INTERVAL)
+    assert scheduler.as_dict("dev-1")["errors"] == 1
+
+
+async def test_poll_scheduler_running():
+    """Test a task is not due while it is running."""
+    scheduler = PollScheduler()
+    due_while_running = []
+
+    async def _target():
+        due_while_running.append(scheduler.is_due("dev-1", POLL_INTERVAL))
+        forced = await scheduler.run("dev-1", POLL_INTERVAL, _target, force=True)
+        due_while_running.append(forced)
+
+    assert await scheduler.run("dev-1", POLL_INTERVAL, _target, force=True)
+    assert due_while_running == [False, False]
+
+
+def test_poll_scheduler_skip(monkeypatch):
+    """Test a skipped task waits for its next slot."""
+    fake_time = _fake_time(monkeypatch)
+    scheduler = PollScheduler()
+    scheduler.register("dev-1")
+    assert not scheduler.is_due("dev-1", POLL_INTERVAL)
+    fake_time.now += scheduler._slot_offset("dev-1", POLL_INTERVAL)
+    assert scheduler.is_due("dev-1", POLL_INTERVAL)
+
+    scheduler.skip("dev-1", POLL_INTERVAL)
+    assert not scheduler.is_due("dev-1", POLL_INTERVAL)
+    assert scheduler.as_dict("dev-1")["skipped"] == 1
+
+
+def test_poll_scheduler_stable_slots():
+    """Test the slot of a key does not move when other keys change."""
+    scheduler = PollScheduler()
+    keys = [f"dev-{idx}" for idx in range(5)]
+    for key in keys:
+        scheduler.register(key)
+    offsets = {key: scheduler._slot_offset(key, POLL_INTERVAL) for key in keys}
+    assert len(set(offsets.values())) == len(keys)
+    assert all(0 <= offset < POLL_INTERVAL for offset in offsets.values())
+
+    scheduler.unregister("dev-0")
+    scheduler.register("dev-new")
+    assert scheduler.as_dict("dev-0") == {}
+    for key in keys[1:]:
+        assert scheduler._slot_offset(key, POLL_INTERVAL) == offsets[key]
+
+    other = PollScheduler()
+    other.register("dev-3")
+    assert other._slot_offset("dev-3", POLL_INTERVAL) == offsets["dev-3"]
+
+
+def _down_health(**kwargs) -> ClientHealth:
+    """Return a client health in down state."""
+    health = ClientHealth(max_failures=2, **kwargs)
+    health.report_failure()
+    health.report_failure()
+    assert health.state == HealthState.DOWN
+    return health
+
+
+def test_client_health_failures():
+    """Test failures degrade the health and then pause the polling."""
+    health = ClientHealth(max_failures=3)
+    assert health.state == HealthState.HEALTHY
+
+    health.report_failure()
+    assert health.state == HealthState.DEGRADED
+    health.report_success()
+    assert health.state == HealthState.HEALTHY
+
+    for _ in range(3):
+        health.report_failure(reconnect=True)
+    assert health.state == HealthState.DOWN
+    assert health.is_down
+    assert health.reconnect_required
+    assert health.as_dict()["outages"] == 1
+
+    health.reconnected()
+    assert not health.reconnect_required
+
+
+def test_client_health_probe_backoff():
+    """Test a single probe is allowed, at the probe interval."""
+    health = _down_health(probe_min_interval=0, probe_max_interval=0)
+    assert health.begin_probe()
+    assert health.state == HealthState.RECOVERING
+    assert health.is_down
+    assert not health.begin_probe()
+
+    health.end_probe(False)
+    assert health.state == HealthState.DOWN
+    assert health.as_dict()["failed_probes"] == 1
+
+    health = _down_health(probe_min_interval=60)
+    assert not health.begin_probe()
+    assert health.as_dict()["probes"] == 0
+
+
+def test_client_health_recovery():
+    """Test the paused devices resume with staggered delays after a probe."""
+    health = _down_health(probe_min_interval=0, resume_step=10)
+    health.pause("dev-1")
+    health.pause("dev-2")
+    health.pause("dev-1")
+    assert health.as_dict()["paused_devices"] == 2
+
+    assert health.begin_probe()
+    health.end_probe(True)
+    assert health.state == HealthState.HEALTHY
+    assert not health.reconnect_required
+    assert health.resume_delay("dev-1") == 0
+    assert 0 < health.resume_delay("dev-2") <= 10
+    assert health.resume_delay("dev-2") == 0
+    assert health.resume_delay("dev-3") == 0
+
+    health.report_failure()
+    assert health.state == HealthState.DEGRADED
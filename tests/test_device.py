@@ -0,0 +1,526 @@
+"""Test the ThinQ device helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.smartthinq_sensors.wideq import (
+    device as wideq_device,
+    device_info as wideq_device_info,
+)
+from custom_components.smartthinq_sensors.wideq.core_exceptions import MonitorError
+from custom_components.smartthinq_sensors.wideq.core_util import PollScheduler
+from custom_components.smartthinq_sensors.wideq.device import (
+    MONITOR_SESSION_MAX_EMPTY_POLLS,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_STALE_AGE,
+    CommandQueue,
+    Device,
+    DeviceCommand,
+    DeviceStatus,
+    EventLease,
+    Monitor,
+    MonitorSession,
+    OptimisticState,
+)
+from custom_components.smartthinq_sensors.wideq.device_info import DeviceInfo
+
+TEST_DEVICE_ID = "test-device-id"
+
+
+def _thinq1_monitor() -> tuple[Monitor, MagicMock]:
+    """Return a ThinQ1 monitor with a mocked client session."""
+    client = MagicMock()
+    client.session.monitor_start = AsyncMock(side_effect=["work-1", "work-2"])
+    client.session.monitor_stop = AsyncMock()
+    client.session.monitor_poll = AsyncMock(return_value=None)
+    device_info = DeviceInfo({"deviceId": TEST_DEVICE_ID, "platformType": "thinq1"})
+    return Monitor(client, device_info), client
+
+
+def test_monitor_session_empty_polls():
+    """Test the session expires after the max number of empty polls."""
+    session = MonitorSession()
+    assert not session.is_expired
+
+    session.open("work-1")
+    for _ in range(MONITOR_SESSION_MAX_EMPTY_POLLS - 1):
+        session.poll_result(False)
+    assert not session.is_expired
+
+    session.poll_result(True)
+    session.poll_result(False)
+    assert not session.is_expired
+
+    for _ in range(MONITOR_SESSION_MAX_EMPTY_POLLS):
+        session.poll_result(False)
+    assert session.is_expired
+
+
+def test_monitor_session_max_age(monkeypatch):
+    """Test the session expires when older than the max age."""
+    session = MonitorSession()
+    session.open("work-1")
+    assert not session.is_expired
+
+    monkeypatch.setattr(wideq_device, "MONITOR_SESSION_MAX_AGE", 0)
+    assert session.is_expired
+
+
+def test_monitor_session_restart():
+    """Test a closed session is opened again as a restart."""
+    session = MonitorSession()
+    session.open("work-1")
+    assert session.restarts == 0
+
+    assert session.close() == "work-1"
+    assert session.work_id is None
+    assert session.close() is None
+    assert not session.is_expired
+
+    session.open("work-2")
+    assert session.work_id == "work-2"
+    assert session.restarts == 1
+    assert session.as_dict()["empty_polls"] == 0
+
+
+async def test_monitor_keeps_session_on_empty_polls():
+    """Test the monitor reuses the session and restarts it when expired."""
+    monitor, client = _thinq1_monitor()
+
+    for _ in range(MONITOR_SESSION_MAX_EMPTY_POLLS):
+        assert await monitor.poll() == (None, True)
+    client.session.monitor_start.assert_awaited_once()
+    client.session.monitor_stop.assert_not_awaited()
+    assert monitor.session.is_expired
+
+    await monitor.poll()
+    client.session.monitor_stop.assert_awaited_once_with(TEST_DEVICE_ID, "work-1")
+    assert client.session.monitor_start.await_count == 2
+    assert monitor.session.work_id == "work-2"
+    assert monitor.session.restarts == 1
+
+
+async def test_monitor_restarts_session_on_error():
+    """Test a monitor error closes the session and next poll starts a new one."""
+    monitor, client = _thinq1_monitor()
+    client.session.monitor_poll.side_effect = [
+        MonitorError(TEST_DEVICE_ID, "0106"),
+        b"data",
+    ]
+
+    assert await monitor.poll() == (None, True)
+    assert monitor.session.work_id is None
+    client.session.monitor_stop.assert_not_awaited()
+
+    assert await monitor.poll() == (b"data", True)
+    assert monitor.session.work_id == "work-2"
+    assert monitor.session.restarts == 1
+
+
+def _command(key, value, **kwargs) -> DeviceCommand:
+    """Return a basic control command."""
+    return DeviceCommand("basicCtrl", "Set", key=key, value=value, **kwargs)
+
+
+async def test_command_queue_idle():
+    """Test a command is sent at once when the queue is idle."""
+    send_fn = AsyncMock()
+    queue = CommandQueue(send_fn)
+    commands = [_command("airState.opMode", "1"), _command("airState.windStrength", 2)]
+
+    for command in commands:
+        await queue.put(command)
+    assert [call.args[0] for call in send_fn.await_args_list] == [
+        [command] for command in commands
+    ]
+    assert queue.as_dict() == {
+        "queued": 2,
+        "superseded": 0,
+        "batches": 2,
+        "errors": 0,
+        "pending": 0,
+    }
+
+
+async def test_command_queue_burst():
+    """Test a burst received while a send is in flight needs less requests."""
+    in_flight = asyncio.Event()
+    release = asyncio.Event()
+    requests = []
+
+    async def _send_fn(commands):
+        requests.append([(cmd.key, cmd.value) for cmd in commands])
+        in_flight.set()
+        await release.wait()
+
+    queue = CommandQueue(_send_fn)
+    first = asyncio.create_task(queue.put(_command("airState.opMode", "1")))
+    await in_flight.wait()
+
+    burst = [_command("airState.tempState.target", temp) for temp in range(18, 23)]
+    burst.append(_command("airState.windStrength", 2))
+    burst_tasks = [asyncio.create_task(queue.put(command)) for command in burst]
+    await asyncio.sleep(0)
+    assert queue.as_dict()["pending"] == 2
+
+    release.set()
+    await asyncio.gather(first, *burst_tasks)
+    assert requests == [
+        [("airState.opMode", "1")],
+        [("airState.tempState.target", 22), ("airState.windStrength", 2)],
+    ]
+    assert queue.as_dict() == {
+        "queued": 7,
+        "superseded": 4,
+        "batches": 2,
+        "errors": 0,
+        "pending": 0,
+    }
+
+
+async def test_command_queue_last_write_wins():
+    """Test a pending command for same key is replaced by the new one."""
+    send_fn = AsyncMock()
+    queue = CommandQueue(send_fn)
+    old_cmd = _command("airState.opMode", "1")
+    other_cmd = _command("airState.windStrength", 2)
+    new_cmd = _command("airState.opMode", "4")
+
+    await asyncio.gather(queue.put(old_cmd), queue.put(other_cmd), queue.put(new_cmd))
+    send_fn.assert_awaited_once_with([other_cmd, new_cmd])
+    assert queue.as_dict()["superseded"] == 1
+
+
+async def test_command_queue_error():
+    """Test a send error is raised to all the callers of the batch."""
+    send_fn = AsyncMock(side_effect=ValueError("send failed"))
+    queue = CommandQueue(send_fn)
+
+    results = await asyncio.gather(
+        queue.put(_command("airState.opMode", "1")),
+        queue.put(_command("airState.opMode", "4")),
+        queue.put(_command("airState.windStrength", 2)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert queue.as_dict()["errors"] == 1
+
+    # the queue is still usable after an error
+    send_fn.side_effect = None
+    await queue.put(_command("airState.opMode", "1"))
+    assert send_fn.await_count == 2
+    assert queue.as_dict()["errors"] == 1
+
+
+def test_device_command_ids():
+    """Test which commands can be replaced by a new one."""
+    command = _command("airState.opMode", "1")
+    assert command.cmd_id == _command("airState.opMode", "4").cmd_id
+    assert command.cmd_id != _command("airState.windStrength", 2).cmd_id
+
+    no_key = DeviceCommand("basicCtrl", "Set")
+    assert no_key.cmd_id != DeviceCommand("basicCtrl", "Set").cmd_id
+    other_path = _command("airState.opMode", "1", ctrl_path="control")
+    assert other_path.cmd_id != command.cmd_id
+
+
+async def test_device_send_commands():
+    """Test the commands of a batch are sent in order."""
+    device = Device(MagicMock(), DeviceInfo({"deviceId": TEST_DEVICE_ID}))
+    device._send_command = AsyncMock()
+    commands = [
+        _command("airState.opMode", "1"),
+        _command("airState.windStrength", 2),
+        DeviceCommand("basicCtrl", "Operation", key="airState.operation", value=0),
+    ]
+
+    await device._send_commands(commands)
+    assert [call.args[0] for call in device._send_command.await_args_list] == commands
+
+
+async def test_device_additional_poll():
+    """Test the first additional poll runs at setup and then at its slot."""
+    client = MagicMock()
+    client.poll_scheduler = PollScheduler()
+    device_info = DeviceInfo({"deviceId": TEST_DEVICE_ID, "platformType": "thinq2"})
+    device = Device(client, device_info)
+    device._get_device_info_v2 = AsyncMock()
+
+    await device._additional_poll(3600)
+    device._get_device_info_v2.assert_awaited_once()
+    await device._additional_poll(3600)
+    device._get_device_info_v2.assert_awaited_once()
+    assert client.poll_scheduler.as_dict(device.unique_id)["runs"] == 1
+
+
+def test_optimistic_state_confirmed():
+    """Test an expected value is confirmed by a poll with same value."""
+    state = OptimisticState()
+    state.expect("airState.opMode", 4)
+
+    data = {"airState.opMode": "4"}
+    state.reconcile(data)
+    assert data == {"airState.opMode": "4"}
+    assert state.as_dict() == {
+        "confirmed": 1,
+        "disagreements": 0,
+        "rolled_back": 0,
+        "pending": 0,
+    }
+
+
+def test_optimistic_state_disagreement():
+    """Test only the first disagreeing poll is overridden."""
+    state = OptimisticState()
+    state.expect("airState.opMode", "4")
+
+    data = {"airState.opMode": "1"}
+    state.reconcile(data)
+    assert data == {"airState.opMode": "4"}
+    assert state.as_dict()["pending"] == 1
+
+    data = {"airState.opMode": "1"}
+    state.reconcile(data)
+    assert data == {"airState.opMode": "1"}
+    assert state.as_dict() == {
+        "confirmed": 0,
+        "disagreements": 2,
+        "rolled_back": 1,
+        "pending": 0,
+    }
+
+
+def test_optimistic_state_expired():
+    """Test an expired value is rolled back without overriding the poll."""
+    state = OptimisticState(ttl=-1)
+    state.expect("airState.opMode", "4")
+    state.expect("airState.windStrength", "2")
+
+    data = {"airState.opMode": "1"}
+    state.reconcile(data)
+    assert data == {"airState.opMode": "1"}
+    assert state.as_dict() == {
+        "confirmed": 0,
+        "disagreements": 1,
+        "rolled_back": 1,
+        "pending": 0,
+    }
+
+
+def test_optimistic_state_missing_key():
+    """Test a value missing from polled data is kept until expired."""
+    state = OptimisticState()
+    state.expect("airState.opMode", "4")
+    state.reconcile({"airState.windStrength": "2"})
+    assert state.as_dict()["pending"] == 1
+
+    state.reconcile(None)
+    assert state.as_dict()["pending"] == 1
+
+
+def test_device_optimistic_status_key():
+    """Test the expected value is keyed by the key used in status data."""
+    status = DeviceStatus(None, {"opMode": "1"})
+    device = Device(MagicMock(), DeviceInfo({"deviceId": TEST_DEVICE_ID}), status)
+
+    assert not device._update_status_optimistic("airState.windStrength", "2")
+    assert device._update_status_optimistic(["airState.opMode", "opMode"], "4")
+
+    data = {"opMode": "1"}
+    device.optimistic_state.reconcile(data)
+    assert data == {"opMode": "4"}
+
+
+class EventLeaseDevice(Device):
+    """A device that enables its events with a lease."""
+
+    _event_lease_cmd = ["allEventEnable", "Set", "airState.mon.timeout"]
+    _event_lease_states = ["airState.operation"]
+
+
+def test_event_lease_renewal():
+    """Test the lease is due only when about to expire."""
+    lease = EventLease(duration=70, renew_margin=15)
+    assert lease.is_due
+
+    lease.renewed()
+    assert not lease.is_due
+    assert lease.as_dict()["renewals"] == 1
+    assert lease.as_dict()["skipped"] == 1
+    assert 0 < lease.as_dict()["expires_in"] <= 70
+
+    lease = EventLease(duration=10, renew_margin=15)
+    lease.renewed()
+    assert lease.is_due
+
+
+def test_event_lease_stale_data():
+    """Test the lease expires when data provided by the events are missing."""
+    lease = EventLease()
+    lease.check_data({}, ["airState.operation"])
+    assert lease.as_dict()["stale"] == 0
+
+    lease.renewed()
+    lease.check_data({"airState.operation": "1"}, ["airState.operation"])
+    assert not lease.is_due
+
+    lease.check_data({"airState.opMode": "1"}, ["airState.operation"])
+    assert lease.is_due
+    assert lease.as_dict()["stale"] == 1
+    assert lease.as_dict()["expires_in"] is None
+
+
+async def test_device_event_lease():
+    """Test the lease command is sent directly and only when due."""
+    device = EventLeaseDevice(MagicMock(), DeviceInfo({"deviceId": TEST_DEVICE_ID}))
+    device._send_command = AsyncMock()
+
+    await device._renew_event_lease()
+    device._send_command.assert_awaited_once()
+    command = device._send_command.await_args.args[0]
+    assert (command.ctrl_key, command.command, command.key) == (
+        "allEventEnable",
+        "Set",
+        "airState.mon.timeout",
+    )
+    assert command.value == str(device.event_lease.duration)
+    assert command.ctrl_path == "control"
+    assert device.command_queue.as_dict()["queued"] == 0
+    assert device.optimistic_state.as_dict()["pending"] == 0
+
+    await device._renew_event_lease()
+    device._send_command.assert_awaited_once()
+
+    device = Device(MagicMock(), DeviceInfo({"deviceId": TEST_DEVICE_ID}))
+    device._send_command = AsyncMock()
+    await device._renew_event_lease()
+    assert device.event_lease is None
+    device._send_command.assert_not_awaited()
+
+
+class FakeTime:
+    """A clock moved forward by the tests."""
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current monotonic time."""
+        return self.now
+
+    def time(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_device_info_snapshot_age(monkeypatch):
+    """Test the snapshot age uses the timestamp or the last snapshot change."""
+    fake_time = FakeTime()
+    monkeypatch.setattr(wideq_device_info, "time", fake_time)
+    device_info = DeviceInfo({"deviceId": TEST_DEVICE_ID, "snapshot": {"state": 1}})
+
+    fake_time.now += 100
+    assert device_info.snapshot_age == 100
+    assert not device_info.update_data(
+        {"deviceId": TEST_DEVICE_ID, "snapshot": {"state": 1}}
+    )
+    assert device_info.snapshot_age == 100
+    assert device_info.update_data(
+        {"deviceId": TEST_DEVICE_ID, "snapshot": {"state": 2}}
+    )
+    assert device_info.snapshot_age == 0
+
+    device_info.update_data(
+        {
+            "deviceId": TEST_DEVICE_ID,
+            "snapshot": {"timestamp": (fake_time.now - 30) * 1000},
+        }
+    )
+    assert device_info.snapshot_age == 30
+    device_info.update_data(
+        {
+            "deviceId": TEST_DEVICE_ID,
+            "snapshot": {"timestamp": (fake_time.now + 5) * 1000},
+        }
+    )
+    assert device_info.snapshot_age == 0
+
+
+def _snapshot_device(is_on: bool = True) -> Device:
+    """Return a ThinQ2 device with a mocked client and status."""
+    client = MagicMock()
+    client.emulation = False
+    device_info = DeviceInfo({"deviceId": TEST_DEVICE_ID, "platformType": "thinq2"})
+    device = Device(client, device_info)
+    device._status = MagicMock()
+    device._status.is_on = is_on
+    return device
+
+
+def _dashboard_info(snapshot_age: float, online: bool = True) -> DeviceInfo:
+    """Return the dashboard info of a device with a snapshot of a given age."""
+    device_info = DeviceInfo(
+        {
+            "deviceId": TEST_DEVICE_ID,
+            "platformType": "thinq2",
+            "online": online,
+            "snapshot": {"state": 1},
+        }
+    )
+    device_info._snapshot_changed -= snapshot_age
+    return device_info
+
+
+def test_snapshot_query_required():
+    """Test a query replaces only the stale snapshots of a device on."""
+    device = _snapshot_device()
+
+    assert not device._snapshot_query_required(_dashboard_info(10))
+    assert not device._snapshot_query_required(_dashboard_info(SNAPSHOT_MAX_AGE + 10))
+    assert device._snapshot_query_required(_dashboard_info(SNAPSHOT_STALE_AGE + 10))
+    assert not device._snapshot_query_required(
+        _dashboard_info(SNAPSHOT_STALE_AGE + 10, online=False)
+    )
+    assert not device._snapshot_query_required(None)
+
+    no_snapshot = DeviceInfo({"deviceId": TEST_DEVICE_ID, "online": True})
+    assert device._snapshot_query_required(no_snapshot)
+
+    # the devices that prefer the query use the shorter max age
+    device._query_preferred = True
+    assert not device._snapshot_query_required(_dashboard_info(10))
+    assert device._snapshot_query_required(_dashboard_info(SNAPSHOT_MAX_AGE + 10))
+
+
+def test_snapshot_query_device_off():
+    """Test a device off uses the dashboard snapshot even when stale."""
+    device = _snapshot_device(is_on=False)
+    assert not device._snapshot_query_required(_dashboard_info(SNAPSHOT_STALE_AGE + 10))
+
+    device._status = None
+    assert not device._snapshot_query_required(_dashboard_info(SNAPSHOT_STALE_AGE + 10))
+
+
+async def test_snapshot_query_min_interval():
+    """Test a device is queried again only after the snapshot max age."""
+    device = _snapshot_device()
+    client = device.client
+    stale_info = _dashboard_info(SNAPSHOT_STALE_AGE + 10)
+    client.refresh_devices = AsyncMock()
+    client.get_device.return_value = stale_info
+    client.session.get_device_v2_settings = AsyncMock(
+        return_value={"snapshot": {"state": 2}}
+    )
+
+    assert await device._mon._poll_v2() == ({"state": 2}, False)
+    assert await device._mon._poll_v2() == ({"state": 1}, False)
+    client.session.get_device_v2_settings.assert_awaited_once()
+    assert device.snapshot_stats == {"dashboard": 1, "query": 1}
+
+    device._mon._last_query -= SNAPSHOT_STALE_AGE
+    await device._mon._poll_v2()
+    assert client.session.get_device_v2_settings.await_count == 2
+    assert device.snapshot_stats == {"dashboard": 1, "query": 2}
@@ -0,0 +1,127 @@
+"""Test the SmartThinQ sensors entity helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.smartthinq_sensors import LGEDevice
+from custom_components.smartthinq_sensors.device_helpers import (
+    LGEBaseDevice,
+    LGEStateChangeMixin,
+)
+from custom_components.smartthinq_sensors.wideq import DeviceType
+
+
+class MockEntity(LGEStateChangeMixin, CoordinatorEntity):
+    """A coordinator entity depending on the device features."""
+
+    def __init__(
+        self, api: LGEDevice, update_keys: frozenset[str] | None = None
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(api.coordinator)
+        self._api = api
+        self._update_keys = update_keys
+        self.async_write_ha_state = MagicMock()
+        self.attrs_count = 0
+
+    def _get_state_attributes(self) -> dict[str, int]:
+        """Return the optional state attributes."""
+        self.attrs_count += 1
+        return {"count": self.attrs_count}
+
+
+def _lge_device() -> LGEDevice:
+    """Return a LGE device with a mocked state and coordinator."""
+    device = MagicMock()
+    device.name = "Test device"
+    device.unique_id = "device-0"
+    device.device_info.type = DeviceType.AC
+    device.device_info.macaddress = None
+    device.device_info.firmware = None
+    device.device_info.model_name = "test-model"
+    lge_device = LGEDevice(device, MagicMock())
+    lge_device._state = MagicMock()
+    lge_device._state.changed_features = frozenset()
+    lge_device._state.data_changed = False
+    lge_device._coordinator = MagicMock()
+    return lge_device
+
+
+def _update(lge_device: LGEDevice, entity: MockEntity, **changes) -> bool:
+    """Apply the changes to the device and return True if the entity is written."""
+    lge_device._avail_changed = changes.pop("avail_changed", False)
+    for key, value in changes.items():
+        setattr(lge_device.state, key, value)
+    entity.async_write_ha_state.reset_mock()
+    lge_device.coordinator.async_entity_written.reset_mock()
+    entity._handle_coordinator_update()
+    written = entity.async_write_ha_state.called
+    assert lge_device.coordinator.async_entity_written.called == written
+    return written
+
+
+def test_state_change_feature_keys():
+    """Test an entity is written only when its features or availability changed."""
+    lge_device = _lge_device()
+    entity = MockEntity(lge_device, frozenset({"feat_a"}))
+
+    assert not _update(lge_device, entity)
+    assert not _update(lge_device, entity, changed_features=frozenset({"feat_b"}))
+    assert not _update(lge_device, entity, data_changed=True)
+    assert _update(lge_device, entity, changed_features=frozenset({"feat_a", "feat_b"}))
+    assert _update(lge_device, entity, changed_features=frozenset(), avail_changed=True)
+    # the changed features are unknown after a full status update
+    assert _update(lge_device, entity, changed_features=None)
+
+
+def test_state_change_availability_only():
+    """Test an entity without feature keys is written on availability changes."""
+    lge_device = _lge_device()
+    entity = MockEntity(lge_device, frozenset())
+
+    assert not _update(lge_device, entity, changed_features=frozenset({"feat_a"}))
+    assert _update(lge_device, entity, avail_changed=True)
+
+
+def test_state_change_any_feature():
+    """Test an entity with default keys is written on any status change."""
+    lge_device = _lge_device()
+    entity = MockEntity(lge_device)
+
+    assert not _update(lge_device, entity)
+    assert _update(lge_device, entity, changed_features=frozenset({"feat_b"}))
+    assert _update(lge_device, entity, changed_features=frozenset(), data_changed=True)
+    assert _update(lge_device, entity, data_changed=False, avail_changed=True)
+
+    lge_device._state = None
+    assert _update(lge_device, entity)
+
+
+def test_state_attributes_cache():
+    """Test the state attributes are computed once per state version."""
+    lge_device = _lge_device()
+    entity = MockEntity(lge_device)
+
+    assert entity.extra_state_attributes == {"count": 1}
+    assert entity.extra_state_attributes == {"count": 1}
+    lge_device._state_version += 1
+    assert entity.extra_state_attributes == {"count": 2}
+    assert entity.attrs_count == 2
+
+
+def test_device_state_attributes_cache():
+    """Test the wrapped device attributes are refreshed on a new state version."""
+    lge_device = _lge_device()
+    lge_device._device.available_features = {"feat_a": "feature_a"}
+    lge_device.state.device_features = {"feat_a": "on"}
+    wrapped_device = LGEBaseDevice(lge_device)
+
+    attrs = wrapped_device.extra_state_attributes
+    assert attrs == {"feature_a": "on"}
+    lge_device.state.device_features = {"feat_a": "off"}
+    assert wrapped_device.extra_state_attributes is attrs
+    lge_device._state_version += 1
+    assert wrapped_device.extra_state_attributes == {"feature_a": "off"}
@@ -0,0 +1,122 @@
+"""Test the in place update of the ThinQ device status."""
+
+from __future__ import annotations
+
+import pytest
+
+from .benchmarks.corpus import (
+    DeviceCorpus,
+    async_build_devices,
+    decode_payload,
+    load_corpora,
+)
+from custom_components.smartthinq_sensors.wideq.device import DeviceStatus
+from custom_components.smartthinq_sensors.wideq.devices.ac import (
+    FILTER_STATUS_MAP,
+    AirConditionerStatus,
+)
+
+CORPORA = load_corpora()
+
+
+class CountingStatus(DeviceStatus):
+    """A device status that counts the cache resets."""
+
+    __slots__ = ("resets",)
+
+    def _reset_cache(self) -> None:
+        """Count the cache resets."""
+        self.resets = getattr(self, "resets", 0) + 1
+
+
+async def _build_status(corpus: DeviceCorpus):
+    """Return the first device of a payload with its decoded data."""
+    device = (await async_build_devices(corpus))[0]
+    data = decode_payload(device, corpus)
+    assert data is not None
+    return device, data
+
+
+def _changed_key(data: dict) -> str:
+    """Return a key of the status data that can be changed."""
+    return next(
+        key
+        for key, value in data.items()
+        if isinstance(value, (str, int)) and key != "timestamp"
+    )
+
+
+@pytest.mark.parametrize("corpus", CORPORA, ids=lambda corpus: corpus.name)
+async def test_apply_unchanged_data(corpus: DeviceCorpus):
+    """Test apply with same data reports no change and keeps the features."""
+    device, data = await _build_status(corpus)
+    status = device.reset_status()
+    status.apply(dict(data))
+    features = status.device_features
+
+    assert status.apply(dict(data)) == frozenset()
+    assert status.device_features is features
+
+
+@pytest.mark.parametrize("corpus", CORPORA, ids=lambda corpus: corpus.name)
+async def test_apply_changed_data(corpus: DeviceCorpus):
+    """Test apply reports the changed key and evaluates the features again."""
+    device, data = await _build_status(corpus)
+    status = device.reset_status()
+    status.apply(dict(data))
+    features = dict(status.device_features)
+
+    key = _changed_key(data)
+    new_data = {**data, key: "0" if data[key] != "0" else "1"}
+    assert status.apply(dict(new_data)) == frozenset({key})
+
+    ref_device, _ = await _build_status(corpus)
+    ref_status = type(status)(ref_device, dict(new_data))
+    assert status.device_features == ref_status.device_features
+
+    assert status.apply(dict(data)) == frozenset({key})
+    assert status.device_features == features
+
+
+async def test_apply_volatile_keys():
+    """Test a change of the update timestamp only is not reported."""
+    status = CountingStatus(None, {"state": "ON", "timestamp": 1})
+
+    assert status.apply({"state": "ON", "timestamp": 2}) == frozenset()
+    assert status.apply({"state": "OFF", "timestamp": 3}) == frozenset({"state"})
+    assert status.apply({"state": "OFF"}) == frozenset()
+
+
+async def test_apply_reset_cache():
+    """Test cached values are reset only when the data change."""
+    status = CountingStatus(None, {"state": "ON"})
+    assert status.resets == 1
+
+    status.apply({"state": "ON"})
+    assert status.resets == 1
+
+    status.apply({"state": "OFF"})
+    assert status.resets == 2
+
+    status.apply({"state": "OFF", "remain": "10"})
+    assert status.resets == 3
+
+    assert status.apply(None) == frozenset({"state", "remain"})
+    assert status.resets == 4
+
+
+async def test_apply_filter_status():
+    """Test an unchanged AC filter status is not reported as changed."""
+    corpus = next(corpus for corpus in CORPORA if corpus.name == "ac_thinq1")
+    device, data = await _build_status(corpus)
+    filter_status = {key: 100 for key in FILTER_STATUS_MAP}
+    status = AirConditionerStatus(device, dict(data), filter_status=filter_status)
+    assert status.filter_status_updated
+    features = status.device_features
+
+    assert status.apply(dict(data), filter_status=filter_status) == frozenset()
+    assert status.device_features is features
+
+    filter_status = {**filter_status, next(iter(filter_status)): 50}
+    changed = status.apply(dict(data), filter_status=filter_status)
+    assert changed == frozenset({next(iter(filter_status))})
@@ -0,0 +1,244 @@
+"""Test the SmartThinQ sensors devices setup."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.smartthinq_sensors import (
+    DISCOVERED_DEVICES,
+    MIN_PHASE_DELAY,
+    POST_COMMAND_REFRESH_DELAY,
+    POST_COMMAND_REFRESH_MIN_INTERVAL,
+    SCAN_INTERVAL,
+    UNSUPPORTED_DEVICES,
+    LGEDevice,
+    _async_migrate_unique_id,
+    start_devices_discovery,
+)
+from custom_components.smartthinq_sensors.const import (
+    DOMAIN,
+    ENTRIES,
+    LGE_DEVICES,
+    LGE_DISCOVERY_NEW,
+)
+from custom_components.smartthinq_sensors.wideq import DeviceType
+
+
+def _lge_device(hass, device_id: str) -> LGEDevice:
+    """Return a LGE device wrapping a mocked ThinQ device."""
+    device = MagicMock()
+    device.name = f"Test device {device_id}"
+    device.unique_id = device_id
+    device.device_info.type = DeviceType.AC
+    device.device_info.macaddress = None
+    device.device_info.firmware = None
+    device.device_info.model_name = "test-model"
+    return LGEDevice(device, hass)
+
+
+def test_device_phase():
+    """Test the update phase is stable per device and spread across devices."""
+    hass = MagicMock()
+    scan_interval = SCAN_INTERVAL.total_seconds()
+    device_ids = [f"device-{idx}" for idx in range(10)]
+
+    phases = [_lge_device(hass, dev_id).phase for dev_id in device_ids]
+    assert phases == [_lge_device(hass, dev_id).phase for dev_id in device_ids]
+    assert len(set(phases)) == len(phases)
+    assert all(0 <= phase < scan_interval for phase in phases)
+    assert max(phases) - min(phases) > scan_interval / 2
+
+
+def test_device_phase_update_interval():
+    """Test the next update is aligned to the device phase within the bounds."""
+    hass = MagicMock()
+    scan_interval = SCAN_INTERVAL.total_seconds()
+
+    for dev_id in ("device-0", "device-4", "device-9"):
+        lge_device = _lge_device(hass, dev_id)
+        for now in range(0, 120, 7):
+            hass.loop.time.return_value = now + 0.5
+            delay = lge_device._phase_update_interval().total_seconds()
+            assert MIN_PHASE_DELAY <= delay < MIN_PHASE_DELAY + scan_interval
+            # the update runs at the device phase inside the scan interval
+            offset = (now + 0.5 + delay - lge_device.phase) % scan_interval
+            assert min(offset, scan_interval - offset) == pytest.approx(0, abs=1e-6)
+
+
+def _refresh_device(hass) -> LGEDevice:
+    """Return a LGE device with a mocked coordinator and state."""
+    lge_device = _lge_device(hass, "device-0")
+    lge_device._state = MagicMock()
+    lge_device._coordinator = MagicMock()
+    lge_device._coordinator.async_refresh = AsyncMock()
+    return lge_device
+
+
+async def test_post_command_refresh():
+    """Test a command schedules one refresh of the device only."""
+    hass = MagicMock()
+    hass.loop.time.return_value = 100.0
+    lge_device = _refresh_device(hass)
+
+    with patch(
+        "custom_components.smartthinq_sensors.async_call_later"
+    ) as mock_call_later:
+        lge_device.async_set_updated()
+    mock_call_later.assert_called_once()
+    _, delay, action = mock_call_later.call_args.args
+    assert delay == POST_COMMAND_REFRESH_DELAY
+    lge_device._coordinator.async_set_updated_data.assert_called_once()
+
+    await action(None)
+    lge_device.device.request_device_query.assert_called_once()
+    lge_device._coordinator.async_refresh.assert_awaited_once()
+
+
+async def test_post_command_refresh_burst():
+    """Test a burst of commands results in a single refresh."""
+    hass = MagicMock()
+    hass.loop.time.return_value = 100.0
+    lge_device = _refresh_device(hass)
+
+    with patch(
+        "custom_components.smartthinq_sensors.async_call_later"
+    ) as mock_call_later:
+        unsubs = [MagicMock() for _ in range(3)]
+        mock_call_later.side_effect = unsubs
+        for _ in range(3):
+            lge_device.async_set_updated()
+
+    # each command postpones the pending refresh
+    assert mock_call_later.call_count == 3
+    unsubs[0].assert_called_once()
+    unsubs[1].assert_called_once()
+    unsubs[2].assert_not_called()
+
+    await mock_call_later.call_args.args[2](None)
+    lge_device._coordinator.async_refresh.assert_awaited_once()
+
+    lge_device.async_cancel_refresh()
+    unsubs[2].assert_not_called()
+
+
+async def test_post_command_refresh_min_interval():
+    """Test the refreshes are delayed to honour the minimum interval."""
+    hass = MagicMock()
+    hass.loop.time.return_value = 100.0
+    lge_device = _refresh_device(hass)
+
+    with patch(
+        "custom_components.smartthinq_sensors.async_call_later"
+    ) as mock_call_later:
+        lge_device.async_set_updated()
+        await mock_call_later.call_args.args[2](None)
+
+        hass.loop.time.return_value = 105.0
+        lge_device.async_set_updated()
+        delay = mock_call_later.call_args.args[1]
+        assert delay == 100.0 + POST_COMMAND_REFRESH_MIN_INTERVAL - 105.0
+
+        hass.loop.time.return_value = 200.0
+        lge_device.async_set_updated()
+        assert mock_call_later.call_args.args[1] == POST_COMMAND_REFRESH_DELAY
+
+
+def _mock_lge_device(device_id: str) -> MagicMock:
+    """Return a mocked LGE device."""
+    lge_device = MagicMock()
+    lge_device.device_id = device_id
+    return lge_device
+
+
+async def test_devices_discovery(hass: HomeAssistant):
+    """Test only added devices are set up and only removed devices deleted."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    dev_1, dev_2, dev_new = (
+        _mock_lge_device(dev_id) for dev_id in ("dev-1", "dev-2", "dev-new")
+    )
+    entry_data = {
+        LGE_DEVICES: {DeviceType.AC: [dev_1, dev_2]},
+        UNSUPPORTED_DEVICES: {},
+        DISCOVERED_DEVICES: {"dev-1": ["dev-1"], "dev-2": ["dev-2"]},
+    }
+    hass.data[DOMAIN] = {ENTRIES: {entry.entry_id: entry_data}}
+
+    client = MagicMock()
+    listeners = []
+
+    def _add_devices_listener(listener):
+        listeners.append(listener)
+        return MagicMock()
+
+    client.add_devices_listener.side_effect = _add_devices_listener
+
+    with patch(
+        "custom_components.smartthinq_sensors.lge_devices_setup",
+        AsyncMock(
+            return_value=(
+                {DeviceType.AC: [dev_new]},
+                {},
+                {"dev-new": ["dev-new"]},
+            )
+        ),
+    ) as mock_setup, patch(
+        "custom_components.smartthinq_sensors.remove_lge_devices"
+    ) as mock_remove, patch(
+        "custom_components.smartthinq_sensors.async_dispatcher_send"
+    ) as mock_send, patch(
+        "custom_components.smartthinq_sensors.async_track_time_interval"
+    ):
+        start_devices_discovery(hass, entry, client)
+        assert len(listeners) == 1
+
+        # an added device is set up once, the others are untouched
+        listeners[0]({"dev-new"}, set())
+        await hass.async_block_till_done()
+        mock_setup.assert_awaited_once()
+        assert mock_setup.await_args.kwargs["device_ids"] == {"dev-new"}
+        mock_send.assert_called_once_with(
+            hass, f"{LGE_DISCOVERY_NEW}_{entry.entry_id}", {DeviceType.AC: [dev_new]}
+        )
+        mock_remove.assert_not_called()
+        assert entry_data[LGE_DEVICES] == {DeviceType.AC: [dev_1, dev_2, dev_new]}
+        assert set(entry_data[DISCOVERED_DEVICES]) == {"dev-1", "dev-2", "dev-new"}
+
+        # a removed device is deleted, the others are untouched
+        listeners[0](set(), {"dev-1"})
+        await hass.async_block_till_done()
+        mock_setup.assert_awaited_once()
+        mock_send.assert_called_once()
+        mock_remove.assert_called_once_with(hass, {"dev-1"})
+        client.poll_scheduler.unregister.assert_called_once_with("dev-1")
+        dev_1.async_cancel_refresh.assert_called_once()
+        dev_2.async_cancel_refresh.assert_not_called()
+        dev_new.async_cancel_refresh.assert_not_called()
+        assert entry_data[LGE_DEVICES] == {DeviceType.AC: [dev_2, dev_new]}
+        assert set(entry_data[DISCOVERED_DEVICES]) == {"dev-2", "dev-new"}
+
+
+async def test_migrate_unique_id(hass: HomeAssistant):
+    """Test the entries without unique id get the account user number."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(domain=DOMAIN, data={}, unique_id="user-2")
+    other_entry.add_to_hass(hass)
+
+    _async_migrate_unique_id(hass, entry, None)
+    assert entry.unique_id is None
+    _async_migrate_unique_id(hass, entry, "user-1")
+    assert entry.unique_id == "user-1"
+    _async_migrate_unique_id(hass, entry, "user-3")
+    assert entry.unique_id == "user-1"
+
+    # an account already configured by another entry is not migrated
+    duplicated_entry = MockConfigEntry(domain=DOMAIN, data={})
+    duplicated_entry.add_to_hass(hass)
+    _async_migrate_unique_id(hass, duplicated_entry, "user-2")
+    assert duplicated_entry.unique_id is None
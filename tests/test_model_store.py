@@ -0,0 +1,143 @@
+"""Test the shared store of the ThinQ model files."""
+
+from __future__ import annotations
+
+import gc
+import json
+from unittest.mock import AsyncMock
+
+from custom_components.smartthinq_sensors.wideq.model_info import ModelInfo
+from custom_components.smartthinq_sensors.wideq.model_store import ModelStore
+
+MODEL_URL = "https://test-host/model/test-model.json"
+OTHER_URL = "https://test-host/model/other-model.json"
+
+
+MODEL_DATA = {
+    "Info": {"model": "model-1", "modelType": "FL"},
+    "MonitoringValue": {
+        "state": {
+            "dataType": "enum",
+            "valueMapping": {"POWEROFF": {"label": "@WM_STATE_POWER_OFF_W"}},
+        },
+        "course": {"ref": "Course"},
+    },
+    "Course": {"COTTON": {"_comment": "Cotton"}},
+    "Module": {"WPages": ["a large section not used by the lookups"]},
+}
+
+
+def _content(model: str) -> bytes:
+    """Return the content of a model file."""
+    return json.dumps({"Info": {"model": model}, "Value": {}}).encode()
+
+
+async def test_model_store_hit():
+    """Test a file is downloaded once and then returned from the store."""
+    store = ModelStore()
+    fetch = AsyncMock(return_value=_content("model-1"))
+
+    data = await store.async_get(MODEL_URL, fetch)
+    assert data["Info"]["model"] == "model-1"
+    assert await store.async_get(MODEL_URL, fetch) is data
+    fetch.assert_awaited_once_with(MODEL_URL)
+    assert store.as_dict()["downloads"] == 1
+    assert store.as_dict()["hits"] == 1
+
+
+async def test_model_store_shared_content():
+    """Test the same content from different urls is stored once."""
+    store = ModelStore()
+    fetch = AsyncMock(return_value=_content("model-1"))
+
+    data = await store.async_get(MODEL_URL, fetch)
+    assert await store.async_get(OTHER_URL, fetch) is data
+    assert store.as_dict()["shared"] == 1
+    assert store.as_dict()["resident"] == 1
+
+    assert store.add(OTHER_URL, {"Info": {"model": "model-2"}, "Value": {}}) is not data
+    assert store.as_dict()["resident"] == 2
+
+
+async def test_model_store_invalid_content():
+    """Test an invalid file is not stored."""
+    store = ModelStore()
+    fetch = AsyncMock(return_value=b"not a json")
+
+    assert await store.async_get(MODEL_URL, fetch) is None
+    assert await store.async_get(MODEL_URL, fetch) is None
+    assert fetch.await_count == 2
+    assert store.as_dict()["urls"] == 0
+
+
+async def test_model_store_eviction():
+    """Test resident files are bounded and files in use are still found."""
+    content = _content("model-1")
+    store = ModelStore(max_size=len(content))
+    fetch = AsyncMock(side_effect=[content, _content("model-2")])
+
+    data = await store.async_get(MODEL_URL, fetch)
+    await store.async_get(OTHER_URL, fetch)
+    assert store.as_dict()["resident"] == 1
+
+    # the evicted file is found while in use
+    assert await store.async_get(MODEL_URL, fetch) is data
+    assert fetch.await_count == 2
+
+
+async def test_model_store_disk_cache(tmp_path):
+    """Test a released file is loaded from the disk cache."""
+    store = ModelStore(str(tmp_path), keep_raw=False)
+    fetch = AsyncMock(return_value=_content("model-1"))
+
+    data = await store.async_get(MODEL_URL, fetch)
+    assert store.as_dict()["resident"] == 0
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    del data
+    gc.collect()
+
+    data = await store.async_get(MODEL_URL, fetch)
+    assert data["Info"]["model"] == "model-1"
+    fetch.assert_awaited_once()
+    assert store.as_dict()["disk_loads"] == 1
+
+
+async def test_model_store_cached(tmp_path):
+    """Test the cached files are returned without downloading them."""
+    store = ModelStore(str(tmp_path), keep_raw=False)
+    fetch = AsyncMock(return_value=_content("model-1"))
+
+    assert await store.async_get_cached(MODEL_URL) is None
+    await store.async_get(MODEL_URL, fetch)
+    gc.collect()
+
+    data = await store.async_get_cached(MODEL_URL)
+    assert data["Info"]["model"] == "model-1"
+    fetch.assert_awaited_once()
+    assert store.as_dict()["disk_loads"] == 1
+
+
+async def test_model_info_raw_data(tmp_path):
+    """Test the model info keeps the lookups and loads the raw data lazily."""
+    store = ModelStore(str(tmp_path), keep_raw=False)
+    fetch = AsyncMock(return_value=json.dumps(MODEL_DATA).encode())
+
+    async def _loader():
+        return await store.async_get_cached(MODEL_URL)
+
+    model_info = ModelInfo.get_model_info(
+        await store.async_get(MODEL_URL, fetch), loader=_loader
+    )
+    gc.collect()
+    assert model_info.enum_name("state", "POWEROFF") == "@WM_STATE_POWER_OFF_W"
+    assert model_info.reference_name("course", "COTTON") == "Cotton"
+    assert "Module" not in model_info.as_dict()
+
+    assert await model_info.async_as_dict() == MODEL_DATA
+    assert store.as_dict()["disk_loads"] == 1
+    fetch.assert_awaited_once()
+
+    model_info = ModelInfo.get_model_info(
+        MODEL_DATA, loader=AsyncMock(return_value=None)
+    )
+    assert await model_info.async_as_dict() == model_info.as_dict()
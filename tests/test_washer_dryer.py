@@ -0,0 +1,522 @@
+"""Test the washer and dryer course command templates."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from copy import deepcopy
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from .benchmarks.corpus import (
+    DeviceCorpus,
+    async_build_devices,
+    decode_payload,
+    load_corpora,
+)
+from custom_components.smartthinq_sensors.wideq.devices.washerDryer import (
+    CMD_REMOTE_START,
+    CourseType,
+    WMDevice,
+)
+
+VT_CTRL_COURSE_INFO = "vt_ctrl_course_info"
+
+# model sections added to the fixtures to have courses with function
+# defaults, option bits, smart courses and the remote start commands
+MODEL_EXTENSIONS = {
+    "dryer_thinq1": {
+        "Config": {"defaultCourseId": "1"},
+        "Course": {
+            "2": {
+                "_comment": "Delicates",
+                "function": [
+                    {"value": "DryLevel", "default": "2"},
+                    {"value": "TempControl", "default": "1"},
+                    {"value": "ChildLock", "default": "1"},
+                    {"value": "RemoteStart", "default": "0"},
+                ],
+            },
+        },
+        "Value": {
+            "Option1": {
+                "type": "Bit",
+                "option": [
+                    {"startbit": 0, "length": 1, "default": "0", "value": "ChildLock"},
+                    {
+                        "startbit": 4,
+                        "length": 1,
+                        "default": "0",
+                        "value": "RemoteStart",
+                    },
+                    {"startbit": 7, "length": 1, "default": "0", "value": "InitialBit"},
+                ],
+            },
+        },
+        "ControlWifi": {
+            "type": "BINARY(BYTE)",
+            "action": {
+                "OperationStart": {
+                    "cmd": "Control",
+                    "cmdOpt": "Operation",
+                    "value": "Start",
+                    "data": "[{{Course}},{{DryLevel}},{{TempControl}},{{Option1}},0]",
+                    "encode": True,
+                },
+            },
+        },
+    },
+    "washer_thinq1": {
+        "Config": {"defaultCourseId": "1"},
+        "Course": {
+            "2": {
+                "_comment": "Quick 30",
+                "function": [
+                    {"value": "SpinSpeed", "default": "3"},
+                    {"value": "WaterTemp", "default": "2"},
+                    {"value": "TurboWash", "default": "1"},
+                    {"value": "ChildLock", "default": "0"},
+                    {"value": "Steam"},
+                ],
+            },
+        },
+        "SmartCourse": {
+            "51": {
+                "_comment": "Bedding",
+                "Course": "2",
+                "function": [
+                    {"value": "WaterTemp", "default": "5"},
+                    {"value": "Steam", "default": "1"},
+                ],
+            },
+        },
+        "Value": {
+            "SmartCourse": {"type": "Reference", "option": ["SmartCourse"]},
+            "Option1": {
+                "type": "Bit",
+                "option": [
+                    {"startbit": 0, "length": 1, "default": "0", "value": "ChildLock"},
+                    {"startbit": 1, "length": 1, "default": "0", "value": "DoorLock"},
+                    {
+                        "startbit": 3,
+                        "length": 1,
+                        "default": "0",
+                        "value": "RemoteStart",
+                    },
+                    {"startbit": 7, "length": 1, "default": "0", "value": "InitialBit"},
+                ],
+            },
+        },
+        "ControlWifi": {
+            "type": "BINARY(BYTE)",
+            "action": {
+                "OperationStart": {
+                    "cmd": "Control",
+                    "cmdOpt": "Operation",
+                    "value": "Start",
+                    "data": (
+                        "[{{Course}},{{SpinSpeed}},{{WaterTemp}},"
+                        "{{Option1}},{{Option2}},{{SmartCourse}},0]"
+                    ),
+                    "encode": True,
+                },
+            },
+        },
+    },
+    "washer_thinq2": {
+        "MonitoringValue": {
+            "course": {"ref": "Course"},
+            "smartCourse": {"ref": "SmartCourse"},
+        },
+        "Config": {
+            "courseType": "course",
+            "smartCourseType": "smartCourse",
+            "defaultCourse": "COTTON",
+        },
+        "Course": {
+            "QUICK_30": {
+                "_comment": "Quick 30",
+                "courseType": "Course",
+                "function": [
+                    {"value": "spin", "default": "SPIN_800"},
+                    {"value": "temp", "default": "TEMP_COLD"},
+                    {"value": "rinse"},
+                ],
+            },
+        },
+        "SmartCourse": {
+            "BEDDING": {
+                "_comment": "Bedding",
+                "courseType": "SmartCourse",
+                "Course": "COTTON",
+                "function": [
+                    {"value": "temp", "default": "TEMP_60"},
+                    {"value": "steam", "default": "STEAM_ON"},
+                ],
+            },
+        },
+        "ControlWifi": {
+            "WMStart": {
+                "ctrlKey": "WMStart",
+                "command": "Set",
+                "dataSetList": {
+                    "washerDryer": {
+                        "courseType": "COURSE",
+                        "course": "COTTON",
+                        "smartCourse": "NOT_SELECTED",
+                        "initialBit": "INITIAL_BIT_OFF",
+                        "spin": "SPIN_1200",
+                        "temp": "TEMP_40",
+                        "rinse": "RINSE_NORMAL",
+                        "steam": "STEAM_OFF",
+                    }
+                },
+            },
+        },
+    },
+}
+
+VT_CTRL_EXTENSION = {
+    "vtCtrl": {
+        "ctrlKey": "vtCtrl",
+        "command": "Set",
+        "dataSetList": {
+            "ctrlTarget": ["WASHER"],
+            "reqDevType": "APP",
+            "vtData": {"WASHER": []},
+        },
+    },
+}
+
+
+def _wm_corpora() -> list[DeviceCorpus]:
+    """Return the washer and dryer payloads with the extended model info."""
+    corpora = []
+    for corpus in load_corpora():
+        if not (extension := MODEL_EXTENSIONS.get(corpus.name)):
+            continue
+        model_info = deepcopy(corpus.model_info)
+        for section, values in deepcopy(extension).items():
+            model_info.setdefault(section, {}).update(values)
+        corpus.model_info = model_info
+        corpora.append(corpus)
+        if "WMStart" in model_info["ControlWifi"]:
+            vt_corpus = deepcopy(corpus)
+            vt_corpus.name = f"{corpus.name}_vtctrl"
+            vt_corpus.model_info["ControlWifi"].update(deepcopy(VT_CTRL_EXTENSION))
+            corpora.append(vt_corpus)
+    return corpora
+
+
+WM_CORPORA = _wm_corpora()
+
+
+def _legacy_opt_bit(device: WMDevice, opt_name, opt_val, bit_name, bit_val):
+    """Return the option value with a bit updated, as the old builder did."""
+    if device.model_info.is_info_v2:
+        return None
+
+    option_val = int(opt_val)
+    if (bit_index := device.model_info.bit_index(opt_name, bit_name)) is not None:
+        if bit_val:
+            new_val = option_val | (2**bit_index)
+        else:
+            new_val = option_val ^ (option_val & (2**bit_index))
+        return str(new_val)
+
+    return None
+
+
+def _legacy_course_details(device: WMDevice, course_key, course_id):
+    """Return the definition of a course, as the old builder did."""
+    if course_key is None:
+        return None
+    if courses := device.model_info.reference_values(course_key):
+        return courses.get(course_id)
+    return None
+
+
+def _legacy_course_infos(device: WMDevice) -> dict:
+    """Return the available courses, as the old builder did."""
+    if not (course_key := device.get_course_key(CourseType.COURSE)):
+        return {}
+    if not (course_infos := device.model_info.reference_values(course_key)):
+        return {}
+
+    ret_val = {}
+    for key, value in course_infos.items():
+        if enum_name := value.get("name"):
+            name = device.get_enum_text(enum_name)
+            if name == enum_name:
+                name = value.get("_comment", enum_name)
+        else:
+            name = value.get("_comment", key)
+        ret_val[name] = key
+    return ret_val
+
+
+def _legacy_prepare_course_info(
+    device: WMDevice,
+    data,
+    course_id,
+    course_info,
+    course_type,
+    course_set,
+    n_course_key,
+    s_course_key,
+) -> dict:
+    """Prepare the course data for a command, as the old builder did."""
+    ret_data = deepcopy(data)
+
+    option_keys = device.model_info.option_keys(device._sub_key)
+    if not device.model_info.is_info_v2:
+        for opt_name in option_keys:
+            ret_data[opt_name] = data.get(opt_name, "0")
+
+    if "courseType" in course_info:
+        ret_data["courseType"] = course_info["courseType"]
+
+    if course_type == CourseType.COURSE:
+        ret_data[n_course_key] = course_id
+        if s_course_key:
+            ret_data[s_course_key] = 0
+    elif course_type == CourseType.SMARTCOURSE:
+        ret_data[n_course_key] = 0
+        ret_data[s_course_key] = course_id
+        for key in ["Course", "APCourse"]:
+            if key in course_info:
+                ret_data[n_course_key] = course_info[key]
+                break
+
+    if op_course_key := device.get_course_key(CourseType.OPCOURSE):
+        ref_opcourse_key = "OpCourse" if device.model_info.is_info_v2 else op_course_key
+        if ref_opcourse_key in course_info:
+            ret_data[op_course_key] = course_info[ref_opcourse_key]
+        elif device.model_info.is_info_v2:
+            ret_data.pop(op_course_key, None)
+
+    for func_key in course_info["function"]:
+        ckey = func_key.get("value")
+        cdata = func_key.get("default")
+        if not ckey or cdata is None:
+            continue
+        opt_set = False
+        for opt_name in option_keys:
+            if opt_name not in ret_data:
+                continue
+            opt_val = ret_data[opt_name]
+            new_val = _legacy_opt_bit(device, opt_name, opt_val, ckey, int(cdata))
+            if new_val is not None:
+                opt_set = True
+                if not course_set:
+                    ret_data[opt_name] = new_val
+                break
+        if opt_set or (course_set and ckey in ret_data):
+            continue
+        ret_data[ckey] = cdata
+
+    if not course_set:
+        ret_data[VT_CTRL_COURSE_INFO] = course_info
+
+    return ret_data
+
+
+def _legacy_update_course_info(device: WMDevice) -> dict:
+    """Return the course data for a command, as the old builder did."""
+    data = None
+    if device._initial_bit_start:
+        data = device._remote_start_status
+    elif device._status:
+        device._selected_course = None
+        data = device._status.as_dict
+
+    if not data:
+        raise ValueError("Course info not available")
+
+    course_type = CourseType.COURSE
+    n_course_key = device.get_course_key(CourseType.COURSE)
+    s_course_key = device.get_course_key(CourseType.SMARTCOURSE)
+    if device.model_info.is_info_v2:
+        def_course_id = device.model_info.config_value(
+            f"default{device._getcmdkey('Course')}"
+        )
+    else:
+        def_course_id = str(device.model_info.config_value("defaultCourseId"))
+
+    if device._selected_course:
+        course_id = _legacy_course_infos(device).get(device._selected_course)
+    else:
+        course_id = None
+    course_info = None
+    course_set = False
+    if course_id is None:
+        for course_key in [n_course_key, s_course_key]:
+            if not course_key:
+                continue
+            course_id = str(data.get(course_key))
+            if course_info := _legacy_course_details(device, course_key, course_id):
+                if course_key == s_course_key:
+                    course_type = CourseType.SMARTCOURSE
+                course_set = True
+                break
+    else:
+        course_info = _legacy_course_details(device, n_course_key, course_id)
+
+    if not course_info:
+        course_id = def_course_id
+        course_info = _legacy_course_details(device, n_course_key, course_id)
+
+    if not course_info:
+        raise ValueError("Course info not available")
+
+    return _legacy_prepare_course_info(
+        device,
+        data,
+        course_id,
+        course_info,
+        course_type,
+        course_set,
+        n_course_key,
+        s_course_key,
+    )
+
+
+def _legacy_vtctrl_course_info(device: WMDevice) -> list:
+    """Return the vtCtrl course commands, as the old builder did."""
+    vt_cmd_data = []
+    course_data = _legacy_update_course_info(device)
+    if course_info := course_data.get(VT_CTRL_COURSE_INFO):
+        for func_key in course_info["function"]:
+            ckey = func_key.get("value")
+            defdata = func_key.get("default")
+            cdata = course_data.get(ckey, defdata)
+            if not ckey or cdata is None:
+                continue
+            vt_cmd_data.append({"cmd": ckey, "type": "ABSOLUTE", "value": str(cdata)})
+
+    return vt_cmd_data
+
+
+def _legacy_command_v1(device: WMDevice, cmd: dict, key) -> dict:
+    """Return the ThinQ1 start command, as the old builder did."""
+    cmd = deepcopy(cmd)
+    encode = cmd.pop("encode", False)
+
+    str_data = ""
+    if "data" in cmd:
+        str_data = cmd["data"]
+        option_keys = device.model_info.option_keys(device._sub_key)
+        status_data = _legacy_update_course_info(device)
+
+        for dt_key, dt_value in status_data.items():
+            repl_key = f"{{{{{dt_key}}}}}"
+            if repl_key not in str_data:
+                continue
+            if key and key == "Start" and dt_key in option_keys:
+                bit_val = 1 if device._initial_bit_start else 0
+                new_value = _legacy_opt_bit(
+                    device, dt_key, dt_value, "InitialBit", bit_val
+                )
+                if new_value is not None:
+                    dt_value = new_value
+            str_data = str_data.replace(repl_key, str(dt_value))
+        if encode:
+            cmd["format"] = "B64"
+            str_list = json.loads(str_data)
+            str_data = base64.b64encode(bytes(str_list)).decode("ascii")
+
+    return {**cmd, "data": str_data}
+
+
+def _course_data(data: dict) -> dict:
+    """Return the course data without the legacy vtCtrl course info."""
+    return {key: value for key, value in data.items() if key != VT_CTRL_COURSE_INFO}
+
+
+def _start_cases(device: WMDevice, data: dict):
+    """
+    Yield the device configured for each remote start case: every
+    selectable course, every course set in the status and the default one.
+    """
+    device._initial_bit_start = True
+    device._remote_start_status = data
+    for course_name in _legacy_course_infos(device):
+        device._selected_course = course_name
+        yield f"selected {course_name}"
+
+    device._selected_course = None
+    for course_type in [CourseType.COURSE, CourseType.SMARTCOURSE]:
+        if not (course_key := device.get_course_key(course_type)):
+            continue
+        course_ids = list(device.model_info.reference_values(course_key) or {})
+        for course_id in [*course_ids, "invalid"]:
+            status_data = dict(data)
+            for other_type in [CourseType.COURSE, CourseType.SMARTCOURSE]:
+                if other_key := device.get_course_key(other_type):
+                    status_data[other_key] = "NOT_SET"
+            status_data[course_key] = course_id
+            for initial_bit_start in (True, False):
+                device._initial_bit_start = initial_bit_start
+                device._remote_start_status = status_data
+                device._status = MagicMock(as_dict=status_data)
+                yield f"status {course_key} {course_id} {initial_bit_start}"
+
+
+def _build_device(corpus: DeviceCorpus) -> tuple[WMDevice, dict]:
+    """Return the device of a payload and its status data."""
+    device = asyncio.run(async_build_devices(corpus))[0]
+    assert isinstance(device, WMDevice)
+    data = decode_payload(device, corpus)
+    assert data
+    return device, data
+
+
+@pytest.mark.parametrize("corpus", WM_CORPORA, ids=lambda corpus: corpus.name)
+def test_course_data(corpus: DeviceCorpus):
+    """Test the template course data is the one of the old builder."""
+    device, data = _build_device(corpus)
+    assert device._get_course_infos() == _legacy_course_infos(device)
+
+    cases = 0
+    for case in _start_cases(device, data):
+        expected = _course_data(_legacy_update_course_info(device))
+        assert device._update_course_info() == expected, case
+        assert device._prepare_vtctrl_course_info() == (
+            _legacy_vtctrl_course_info(device)
+        ), case
+        cases += 1
+    assert cases > 4
+
+
+@pytest.mark.parametrize("corpus", WM_CORPORA, ids=lambda corpus: corpus.name)
+def test_start_command(corpus: DeviceCorpus, monkeypatch):
+    """Test the start command payload is the one of the old builder."""
+    device, data = _build_device(corpus)
+    ctrl_key, command, key = device._get_cmd_keys(CMD_REMOTE_START)
+    is_info_v2 = device.model_info.is_info_v2
+
+    for case in _start_cases(device, data):
+        payload = device._prepare_command(ctrl_key, command, key, None)
+        if not is_info_v2:
+            action = corpus.model_info["ControlWifi"]["action"][command]
+            assert payload == _legacy_command_v1(device, action, key), case
+            continue
+
+        # the ThinQ2 payload is built from the course data of the old builder
+        with monkeypatch.context() as patch_ctx:
+            patch_ctx.setattr(
+                device,
+                "_update_course_info",
+                lambda: _legacy_update_course_info(device),
+            )
+            patch_ctx.setattr(
+                device,
+                "_prepare_vtctrl_course_info",
+                lambda: _legacy_vtctrl_course_info(device),
+            )
+            expected = device._prepare_command(ctrl_key, command, key, None)
+        assert payload == expected, case
+        vt_ctrl = corpus.name.endswith("_vtctrl")
+        assert payload["ctrlKey"] == ("vtCtrl" if vt_ctrl else command)